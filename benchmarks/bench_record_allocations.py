@@ -0,0 +1,78 @@
+"""
+Measure memory allocated while turning parsed investment rows into a record.
+
+Covers the model stage only (``build_investments`` -> CompanyProfile ->
+output dict), so HTML parsing does not drown out the numbers. Run from the
+project root:
+
+    python -m benchmarks.bench_record_allocations --rows 500 --repeat 50
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from src.extractors.investments_parser import build_investments
+from src.models.company_profile import CompanyProfile
+
+BASICS: Dict[str, Any] = {
+    "url": "https://pitchbook.com/profiles/company/361831-87",
+    "id": "361831-87",
+    "company_name": "Badia Spices",
+    "year_founded": 1967,
+}
+
+def build_rows(rows: int) -> List[List[str]]:
+    return [
+        [f"Target {i}", "2020-11-03", f"{i}.5M", "Buyout/LBO", "Food Products"]
+        for i in range(rows)
+    ]
+
+def build_one(rows: List[List[str]]) -> Dict[str, Any]:
+    summary, all_investments, investors = build_investments(rows, [], ["BDT & MSD Partners"])
+    profile = CompanyProfile.from_parsed_parts(
+        basics=BASICS,
+        investments_summary=summary,
+        competitors=[],
+        all_investments=all_investments,
+        faq=[],
+        investors=investors,
+    )
+    return profile.to_dict()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500, help="Investment rows per record.")
+    parser.add_argument("--repeat", type=int, default=50, help="Records built.")
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    build_one(rows)
+
+    tracemalloc.start()
+    retained = 0
+    peak = 0
+    for _ in range(args.repeat):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        record = build_one(rows)
+        current, current_peak = tracemalloc.get_traced_memory()
+        retained += current - base
+        peak = max(peak, current_peak - base)
+        del record
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        build_one(rows)
+    elapsed = (time.perf_counter() - start) / args.repeat
+
+    print(f"rows per record:     {args.rows}")
+    print(f"retained per record: {retained / args.repeat / 1024:.1f} KiB")
+    print(f"peak per record:     {peak / 1024:.1f} KiB")
+    print(f"time per record:     {elapsed * 1000:.3f} ms")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Compare the compiled schema validator against the jsonschema Draft7Validator path.
+
+Run from the project root:
+
+    python -m benchmarks.bench_schema_validation --records 20000 --rows 20
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from src.outputs.schema_validator import validate_record, validate_record_jsonschema
+
+SAMPLE_PATH = Path(__file__).resolve().parents[1] / "data" / "sample_output.json"
+
+def build_records(count: int, rows: int) -> List[Dict[str, Any]]:
+    with SAMPLE_PATH.open("r", encoding="utf-8") as f:
+        template = json.load(f)[0]
+    template["all_investments"] = [
+        {
+            "company_name": f"Target {i}",
+            "deal_date": "2020-11-03",
+            "deal_size": f"{i}.5M",
+            "deal_type": "Buyout/LBO",
+            "industry": "Food Products",
+        }
+        for i in range(rows)
+    ]
+    records = []
+    for i in range(count):
+        record = copy.deepcopy(template)
+        record["url"] = f"https://pitchbook.com/profiles/company/{i}-00"
+        records.append(record)
+    return records
+
+def time_validation(fn: Callable[[Dict[str, Any], int], List[str]], records) -> float:
+    start = time.perf_counter()
+    for idx, record in enumerate(records):
+        fn(record, idx)
+    return time.perf_counter() - start
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000, help="Records validated.")
+    parser.add_argument("--rows", type=int, default=20, help="Investment rows per record.")
+    args = parser.parse_args()
+
+    records = build_records(args.records, args.rows)
+    reference = time_validation(validate_record_jsonschema, records)
+    compiled = time_validation(validate_record, records)
+
+    print(f"records:     {args.records} ({args.rows} investment rows each)")
+    print(f"jsonschema:  {reference * 1e6 / args.records:.1f} us/record")
+    print(f"compiled:    {compiled * 1e6 / args.records:.1f} us/record")
+    print(f"speedup:     {reference / compiled:.1f}x")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
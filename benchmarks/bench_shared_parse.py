@@ -0,0 +1,104 @@
+"""
+Compare parsing a profile page once per extractor against parsing it once
+and sharing the tree, then compare the shared path across parser backends.
+
+Run from the project root:
+
+    python -m benchmarks.bench_shared_parse --rows 200 --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable
+
+from src.extractors.company_profile_parser import (
+    parse_company_profile,
+    parse_company_profile_page,
+)
+from src.extractors.competitors_parser import parse_competitors, parse_competitors_page
+from src.extractors.faq_parser import parse_faq, parse_faq_page
+from src.extractors.investments_parser import parse_investments, parse_investments_page
+from src.extractors.parsed_page import PARSER_BACKENDS, ParsedPage, check_parser_backend
+
+URL = "https://pitchbook.com/profiles/company/361831-87"
+
+def build_page(rows: int) -> str:
+    investments = "".join(
+        f"<tr><td>Target {i}</td><td>2020-11-03</td><td>{i}.5M</td>"
+        f"<td>Buyout/LBO</td><td>Food Products</td></tr>"
+        for i in range(rows)
+    )
+    competitors = "".join(
+        f"<tr><td><a href='https://pitchbook.com/profiles/company/{i}-00'>Rival {i}</a></td>"
+        f"<td>Corporation</td><td>Chicago, IL</td></tr>"
+        for i in range(rows // 4 + 1)
+    )
+    faq = "".join(
+        f"<div data-test='faq-item'><h3 data-test='faq-question'>Question {i}?</h3>"
+        f"<p data-test='faq-answer'>Answer {i}.</p></div>"
+        for i in range(10)
+    )
+    return f"""
+    <html><head>
+    <script type="application/ld+json">
+    {{"@type": "Organization", "@id": "361831-87", "name": "Badia Spices"}}
+    </script></head><body>
+    <table><tr><th>Founded</th><td>1967</td></tr><tr><th>Employees</th><td>101</td></tr></table>
+    <a href="https://www.facebook.com/BadiaSpices">Facebook</a>
+    <ul><li data-type="Website">www.badiaspices.com</li></ul>
+    <div data-test="deal-summary"><span>Latest deal type: Buyout/LBO</span></div>
+    <table><tr><th>Company</th><th>Date</th><th>Deal Size</th><th>Deal Type</th><th>Industry</th></tr>
+    {investments}</table>
+    <table><tr><th>Competitor</th><th>Status</th><th>Location</th></tr>{competitors}</table>
+    <section><h2>FAQ</h2>{faq}</section>
+    <div data-test="investors"><a>BDT &amp; MSD Partners</a></div>
+    </body></html>
+    """
+
+def parse_separately(html: str) -> None:
+    parse_company_profile(html, URL)
+    parse_investments(html)
+    parse_competitors(html)
+    parse_faq(html)
+
+def parse_shared(html: str, backend: str = "html.parser") -> None:
+    page = ParsedPage.from_html(html, backend)
+    parse_company_profile_page(page, URL)
+    parse_investments_page(page)
+    parse_competitors_page(page)
+    parse_faq_page(page)
+
+def time_per_page(fn: Callable[[str], None], html: str, repeat: int) -> float:
+    fn(html)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(html)
+    return (time.perf_counter() - start) / repeat
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200, help="Investment rows per page.")
+    parser.add_argument("--repeat", type=int, default=20, help="Pages timed per variant.")
+    args = parser.parse_args()
+
+    html = build_page(args.rows)
+    separate = time_per_page(parse_separately, html, args.repeat)
+    shared = time_per_page(parse_shared, html, args.repeat)
+
+    print(f"page size:        {len(html) / 1024:.1f} KiB")
+    print(f"separate parses:  {separate * 1000:.2f} ms/page")
+    print(f"shared parse:     {shared * 1000:.2f} ms/page")
+    print(f"speedup:          {separate / shared:.2f}x")
+
+    for backend in PARSER_BACKENDS:
+        try:
+            check_parser_backend(backend)
+        except ImportError:
+            print(f"{backend + ':':<18}not installed")
+            continue
+        elapsed = time_per_page(lambda h: parse_shared(h, backend), html, args.repeat)
+        print(f"{backend + ':':<18}{elapsed * 1000:.2f} ms/page ({separate / elapsed:.1f}x)")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
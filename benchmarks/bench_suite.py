@@ -0,0 +1,232 @@
+"""
+Time each extractor and process_url end to end on synthetic profile pages.
+
+Pages come from ``benchmarks.synthetic_pages`` (small, medium and large:
+10, 100 and 1,000 investment rows). ``process_url`` runs against an
+in-memory session, so the numbers cover HTTP client overhead and parsing
+but not the network. Results can be written as JSON and compared with an
+earlier run to spot regressions between commits. Run from the project root:
+
+    python -m benchmarks.bench_suite --output bench.json
+    python -m benchmarks.bench_suite --compare bench.json --fail-on-regression
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from benchmarks.synthetic_pages import PAGE_SIZES, generate_page, profile_url
+from src.clients.pitchbook_client import PitchBookClient
+from src.extractors.company_profile_parser import parse_company_profile_page
+from src.extractors.competitors_parser import parse_competitors_page
+from src.extractors.faq_parser import parse_faq_page
+from src.extractors.investments_parser import parse_investments_page
+from src.extractors.parsed_page import PARSER_BACKENDS, ParsedPage, check_parser_backend
+from src.runner import build_record, process_url
+from src.utils.http import HttpClient
+
+COMPANY_ID = "361831-87"
+RESULTS_VERSION = 1
+
+class _FakeResponse:
+    def __init__(self, url: str, body: bytes) -> None:
+        self.url = url
+        self.status_code = 200
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+        self.encoding = "utf-8"
+        self._body = body
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start : start + chunk_size]
+
+    @property
+    def text(self) -> str:
+        return self._content.decode(self.encoding)
+
+    def close(self) -> None:
+        pass
+
+class _FakeSession:
+    """
+    Serves one page for every URL, streamed in chunks like a real response.
+    """
+
+    def __init__(self, html: str) -> None:
+        self.headers: Dict[str, Any] = {}
+        self.body = html.encode("utf-8")
+
+    def get(self, url: str, timeout: float, **_: Any) -> _FakeResponse:
+        return _FakeResponse(url, self.body)
+
+def fake_client(html: str) -> PitchBookClient:
+    http_client = HttpClient(
+        base_url="https://pitchbook.com",
+        user_agent="benchmark",
+        session=_FakeSession(html),
+    )
+    return PitchBookClient(http_client=http_client)
+
+def cases(html: str, backend: str) -> Dict[str, Callable[[], Any]]:
+    url = profile_url(COMPANY_ID)
+    page = ParsedPage.from_html(html, backend)
+    client = fake_client(html)
+    return {
+        "parse": lambda: ParsedPage.from_html(html, backend),
+        "company_profile": lambda: parse_company_profile_page(page, url),
+        "investments": lambda: parse_investments_page(page),
+        "competitors": lambda: parse_competitors_page(page),
+        "faq": lambda: parse_faq_page(page),
+        "build_record": lambda: build_record(html, url, parser_backend=backend),
+        "process_url": lambda: process_url(client, url, parser_backend=backend),
+    }
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    fn()
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": min(timings),
+        "median_ms": statistics.median(timings),
+        "mean_ms": statistics.fmean(timings),
+        "stdev_ms": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+def _git_commit() -> Optional[str]:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+def run_suite(sizes: Sequence[str], backends: Sequence[str], repeat: int) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        html = generate_page(PAGE_SIZES[size], company_id=COMPANY_ID)
+        for backend in backends:
+            for case, fn in cases(html, backend).items():
+                stats = measure(fn, repeat)
+                results.append(
+                    {
+                        "case": case,
+                        "size": size,
+                        "backend": backend,
+                        "page_bytes": len(html.encode("utf-8")),
+                        "repeat": repeat,
+                        **stats,
+                    }
+                )
+                print(
+                    f"{size:<7} {backend:<12} {case:<16} "
+                    f"{stats['median_ms']:9.3f} ms  (min {stats['min_ms']:.3f})"
+                )
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+def _key(result: Dict[str, Any]) -> tuple:
+    return result["case"], result["size"], result["backend"]
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> int:
+    """
+    Print median ratios against ``baseline``; returns the number of regressions.
+    """
+    previous = {_key(result): result for result in baseline["results"]}
+    regressions = 0
+    print(f"\ncompared with {baseline['meta'].get('commit') or 'baseline'}:")
+    for result in current["results"]:
+        before = previous.get(_key(result))
+        if before is None:
+            continue
+        ratio = result["median_ms"] / before["median_ms"] if before["median_ms"] else 1.0
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            flag = "  faster"
+        print(
+            f"{result['size']:<7} {result['backend']:<12} {result['case']:<16} "
+            f"{before['median_ms']:9.3f} -> {result['median_ms']:9.3f} ms  ({ratio:.2f}x){flag}"
+        )
+    return regressions
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        choices=sorted(PAGE_SIZES),
+        default=list(PAGE_SIZES),
+        help="Page sizes to run.",
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=PARSER_BACKENDS,
+        default=None,
+        help="Parser backends to run (default: every installed one).",
+    )
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per case.")
+    parser.add_argument("--output", type=Path, default=None, help="Write results as JSON here.")
+    parser.add_argument(
+        "--compare", type=Path, default=None, help="Earlier results to compare with."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative slowdown of the median counted as a regression.",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 when any case regressed.",
+    )
+    args = parser.parse_args()
+
+    backends = args.backends
+    if backends is None:
+        backends = []
+        for backend in PARSER_BACKENDS:
+            try:
+                check_parser_backend(backend)
+            except ImportError:
+                continue
+            backends.append(backend)
+
+    current = run_suite(args.sizes, backends, args.repeat)
+    if args.output is not None:
+        args.output.write_text(json.dumps(current, indent=2), encoding="utf-8")
+        print(f"\nwrote {len(current['results'])} results to {args.output}")
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(current, baseline, args.threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,147 @@
+"""
+Synthetic PitchBook profile pages for benchmarks.
+
+Pages carry the markup the extractors look for (JSON-LD, details table,
+socials, contacts, deal summary, investments and competitors tables,
+investors and FAQ) plus the boilerplate real profiles have around it:
+inline scripts and styles, navigation and footer anchors. ``PAGE_SIZES``
+holds the standard shapes; text is varied with a seeded RNG so pages are
+reproducible without being identical row to row.
+"""
+from __future__ import annotations
+
+import html
+import json
+import random
+from dataclasses import dataclass
+from typing import Dict, List
+
+DEAL_TYPES = ("Buyout/LBO", "Corporate Asset Purchase", "Merger/Acquisition", "PE Growth/Expansion")
+INDUSTRIES = ("Food Products", "Buildings and Property", "Logistics", "Software", "Retail")
+STATUSES = ("Private Equity-Backed", "Corporation", "Venture Capital-Backed", "Publicly Listed")
+CITIES = ("Baton Rouge, LA", "Chicago, IL", "Doral, FL", "Austin, TX", "Boston, MA")
+SOCIALS = (
+    "https://www.facebook.com/{slug}",
+    "https://twitter.com/{slug}",
+    "https://www.linkedin.com/company/{slug}",
+)
+
+@dataclass(frozen=True)
+class PageSpec:
+    investments: int
+    competitors: int
+    anchors: int
+    faq: int
+    investors: int = 5
+
+PAGE_SIZES: Dict[str, PageSpec] = {
+    "small": PageSpec(investments=10, competitors=5, anchors=40, faq=3),
+    "medium": PageSpec(investments=100, competitors=50, anchors=400, faq=12, investors=20),
+    "large": PageSpec(investments=1000, competitors=500, anchors=4000, faq=40, investors=100),
+}
+
+def profile_url(company_id: str) -> str:
+    return f"https://pitchbook.com/profiles/company/{company_id}"
+
+def _words(rng: random.Random, count: int) -> str:
+    vocabulary = ("spice", "supply", "global", "partners", "foods", "group", "holdings", "labs")
+    return " ".join(rng.choice(vocabulary) for _ in range(count))
+
+def _investment_rows(rng: random.Random, count: int) -> List[str]:
+    return [
+        "<tr>"
+        f"<td>{html.escape(_words(rng, 2).title())} {i}</td>"
+        f"<td>{rng.randint(1995, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}</td>"
+        f"<td>{rng.randint(1, 900)}.{rng.randint(0, 9)}M</td>"
+        f"<td>{html.escape(rng.choice(DEAL_TYPES))}</td>"
+        f"<td>{rng.choice(INDUSTRIES)}</td>"
+        "</tr>"
+        for i in range(count)
+    ]
+
+def _competitor_rows(rng: random.Random, count: int) -> List[str]:
+    return [
+        "<tr>"
+        f"<td><a href='{profile_url(f'{rng.randint(10000, 999999)}-{i % 100:02d}')}'>"
+        f"{html.escape(_words(rng, 2).title())} {i}</a></td>"
+        f"<td>{rng.choice(STATUSES)}</td>"
+        f"<td>{rng.choice(CITIES)}</td>"
+        "</tr>"
+        for i in range(count)
+    ]
+
+def generate_page(spec: PageSpec, *, company_id: str = "361831-87", seed: int = 0) -> str:
+    """
+    Render a profile page with the row and section counts of ``spec``.
+    """
+    rng = random.Random(f"{seed}:{company_id}")
+    name = f"{_words(rng, 2).title()} {company_id}"
+    slug = name.lower().replace(" ", "-")
+    description = f"{name} is a {_words(rng, 12)} company."
+    ld = {
+        "@context": "http://schema.org",
+        "@type": "Organization",
+        "@id": company_id,
+        "name": name,
+        "description": description,
+    }
+    state = {"session": rng.getrandbits(64), "flags": list(range(20))}
+    socials = "".join(
+        f'<a href="{link.format(slug=slug)}">{link.split("/")[2]}</a>' for link in SOCIALS
+    )
+    nav = "".join(
+        f'<li><a href="https://pitchbook.com/{_words(rng, 1)}/{i}">{_words(rng, 2)}</a></li>'
+        for i in range(spec.anchors)
+    )
+    faq = "".join(
+        f"<div data-test='faq-item'><h3 data-test='faq-question'>"
+        f"{html.escape(_words(rng, 6).capitalize())} {i}?</h3>"
+        f"<p data-test='faq-answer'>{html.escape(_words(rng, 30).capitalize())}.</p></div>"
+        for i in range(spec.faq)
+    )
+    investors = "".join(
+        f"<a href='https://pitchbook.com/profiles/investor/{i}'>"
+        f"{_words(rng, 2).title()} Capital {i}</a>"
+        for i in range(spec.investors)
+    )
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+  <title>{html.escape(name)} - PitchBook</title>
+  <style>body {{ font-family: sans-serif }} .nav li {{ display: inline }}</style>
+  <script>window.__STATE__ = {json.dumps(state)};</script>
+  <script type="application/ld+json">{json.dumps(ld)}</script>
+</head>
+<body>
+  <nav><ul class="nav">{nav}</ul></nav>
+  <h1 data-test="company-name">{html.escape(name)}</h1>
+  <p data-test="company-description">{html.escape(description)}</p>
+  <table>
+    <tr><th>Founded</th><td>{rng.randint(1900, 2020)}</td></tr>
+    <tr><th>Ownership Status</th><td>Private</td></tr>
+    <tr><th>Employees</th><td>{rng.randint(5, 50000)}</td></tr>
+  </table>
+  {socials}
+  <ul>
+    <li data-type="Website">www.{slug}.com</li>
+    <li data-type="Phone">+1 (305) 555-{rng.randint(1000, 9999)}</li>
+  </ul>
+  <div data-test="deal-summary">
+    <span>Latest deal type: {html.escape(rng.choice(DEAL_TYPES))}</span>
+    <span>Financing rounds: {rng.randint(1, 12)}</span>
+    <span>Investments: {spec.investments}</span>
+  </div>
+  <table>
+    <tr><th>Company</th><th>Date</th><th>Deal Size</th><th>Deal Type</th><th>Industry</th></tr>
+    {"".join(_investment_rows(rng, spec.investments))}
+  </table>
+  <table>
+    <tr><th>Competitor</th><th>Status</th><th>Location</th></tr>
+    {"".join(_competitor_rows(rng, spec.competitors))}
+  </table>
+  <div data-test="investors">{investors}</div>
+  <section><h2>FAQ</h2>{faq}</section>
+  <footer>{nav}</footer>
+  <script>document.querySelectorAll("a").forEach(function (a) {{ a.rel = "noopener"; }});</script>
+</body>
+</html>"""
\ No newline at end of file
@@ -1,13 +1,52 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
-from urllib.parse import urljoin
+import re
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional, Set
+from urllib.parse import urljoin, urlsplit
+
+import requests
 
 from src.utils.http import HttpClient
 
 LOGGER = logging.getLogger(__name__)
 
+_PROFILE_PATH_RE = re.compile(r"(?:^|/)profiles/company/([^/]+)", re.IGNORECASE)
+_COMPANY_ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9-]*$")
+
+def canonical_company_id(url_or_id: str) -> Optional[str]:
+    """
+    Company ID for a bare ID or a profile URL, or None if it is neither.
+
+    ``361831-87``, ``https://pitchbook.com/profiles/company/361831-87/`` and
+    ``pitchbook.com/profiles/company/361831-87?tab=faq`` all map to ``361831-87``.
+    """
+    value = url_or_id.strip()
+    if "/" in value:
+        match = _PROFILE_PATH_RE.search(urlsplit(value).path)
+        if match is None:
+            return None
+        value = match.group(1)
+    if not _COMPANY_ID_RE.match(value):
+        return None
+    return value.lower()
+
+@dataclass
+class FetchResult:
+    """
+    Outcome of one profile fetch from ``afetch_many``.
+    """
+
+    url_or_id: str
+    html: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
 class PitchBookClient:
     """
     A small wrapper around HttpClient for PitchBook company profile pages.
@@ -16,16 +55,82 @@ class PitchBookClient:
     def __init__(self, http_client: HttpClient) -> None:
         self.http_client = http_client
 
+    def profile_url(self, company_id: str) -> str:
+        return urljoin(self.http_client.base_url, f"/profiles/company/{company_id}")
+
     def _normalize_url(self, url_or_id: str) -> str:
         if url_or_id.startswith("http://") or url_or_id.startswith("https://"):
             return url_or_id
         # Treat as an ID fragment and build a canonical URL.
-        path = f"/profiles/company/{url_or_id}"
-        return urljoin(self.http_client.base_url, path)
+        return self.profile_url(url_or_id)
 
-    def fetch_company_profile(self, url_or_id: str, *, timeout: Optional[int] = None) -> str:
+    def fetch_profile_response(
+        self, url_or_id: str, *, timeout: Optional[int] = None
+    ) -> requests.Response:
+        """
+        Fetch a profile page and return the full response.
+
+        Responses answered from a 304 revalidation carry ``not_modified=True``.
+        """
         url = self._normalize_url(url_or_id)
         LOGGER.debug("Fetching PitchBook profile from %s", url)
         response = self.http_client.get(url, timeout=timeout)
         LOGGER.info("Fetched %s with status %s", response.url, response.status_code)
-        return response.text
\ No newline at end of file
+        return response
+
+    def fetch_company_profile(self, url_or_id: str, *, timeout: Optional[int] = None) -> str:
+        return self.fetch_profile_response(url_or_id, timeout=timeout).text
+
+    async def afetch_company_profile(
+        self, url_or_id: str, *, timeout: Optional[int] = None
+    ) -> str:
+        url = self._normalize_url(url_or_id)
+        LOGGER.debug("Fetching PitchBook profile from %s (async)", url)
+        response = await self.http_client.aget(url, timeout=timeout)
+        LOGGER.info("Fetched %s with status %s", response.url, response.status_code)
+        return response.text
+
+    async def afetch_many(
+        self,
+        ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        timeout: Optional[int] = None,
+    ) -> AsyncIterator[FetchResult]:
+        """
+        Fetch many profiles concurrently, yielding each result as it completes.
+
+        At most ``concurrency`` fetches are in flight; ``ids`` is consumed lazily.
+        A failed fetch is yielded as a FetchResult carrying the error instead of
+        aborting the others.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        async def fetch_one(url_or_id: str) -> FetchResult:
+            try:
+                html = await self.afetch_company_profile(url_or_id, timeout=timeout)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.warning("Failed to fetch %s: %s", url_or_id, exc)
+                return FetchResult(url_or_id=url_or_id, error=exc)
+            return FetchResult(url_or_id=url_or_id, html=html)
+
+        remaining = iter(ids)
+        in_flight: Set["asyncio.Task[FetchResult]"] = set()
+        try:
+            while True:
+                while len(in_flight) < concurrency:
+                    url_or_id = next(remaining, None)
+                    if url_or_id is None:
+                        break
+                    in_flight.add(asyncio.ensure_future(fetch_one(url_or_id)))
+                if not in_flight:
+                    return
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
\ No newline at end of file
@@ -2,10 +2,18 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from bs4 import BeautifulSoup
 
+from src.extractors.parsed_page import (
+    ParsedPage,
+    node_attr,
+    node_text,
+    select_all,
+    select_first,
+)
+
 LOGGER = logging.getLogger(__name__)
 
 def _safe_int(value: Optional[str]) -> Optional[int]:
@@ -21,9 +29,13 @@ def _extract_ld_json(soup: BeautifulSoup) -> Dict[str, Any]:
     """
     Try to extract a JSON-LD block describing the organization / company.
     """
-    for script in soup.find_all("script", type="application/ld+json"):
+    scripts = soup.find_all("script", type="application/ld+json")
+    return _ld_json_from_scripts(script.string for script in scripts)
+
+def _ld_json_from_scripts(texts: Iterable[Optional[str]]) -> Dict[str, Any]:
+    for text in texts:
         try:
-            data = json.loads(script.string or "")
+            data = json.loads(text or "")
         except (TypeError, json.JSONDecodeError):
             continue
         if isinstance(data, dict):
@@ -45,14 +57,64 @@ def _find_text(soup: BeautifulSoup, selectors: List[Dict[str, str]]) -> Optional
             return tag.get_text(strip=True)
     return None
 
+def _social_links(hrefs: Iterable[str]) -> List[Dict[str, str]]:
+    socials: List[Dict[str, str]] = []
+    for href in hrefs:
+        lower = href.lower()
+        if any(domain in lower for domain in ("facebook.com", "linkedin.com", "twitter.com", "x.com")):
+            domain = href.split("/")[2] if "://" in href else href
+            socials.append({"domain": domain, "link": href})
+    return socials
+
+def _build_basics(
+    *,
+    url: str,
+    ld: Dict[str, Any],
+    company_name: Optional[str],
+    description: Optional[str],
+    year_founded: Optional[int],
+    status: Optional[str],
+    employees: Optional[int],
+    socials: List[Dict[str, str]],
+    contact_information: List[Dict[str, str]],
+) -> Dict[str, Any]:
+    basics: Dict[str, Any] = {
+        "url": url,
+        "id": ld.get("@id") or None,
+        "company_name": company_name,
+        "company_socials": socials,
+        "year_founded": year_founded,
+        "status": status,
+        "employees": employees,
+        "latest_deal_type": None,
+        "financing_rounds": None,
+        "investments": None,
+        "description": description,
+        "contact_information": contact_information,
+        "patents": None,
+        "research_analysis": None,
+        "patent_activity": None,
+    }
+
+    LOGGER.debug("Parsed basic company profile for %s: %s", url, basics)
+    return basics
+
 def parse_company_profile(html: str, url: str) -> Dict[str, Any]:
     """
     Parse a PitchBook company profile HTML into a basic dict.
+    """
+    return parse_company_profile_page(ParsedPage.from_html(html), url)
+
+def parse_company_profile_page(page: ParsedPage, url: str) -> Dict[str, Any]:
+    """
+    Parse an already parsed PitchBook company profile page into a basic dict.
 
     This function focuses on robust patterns and sensible defaults rather than
     being tightly coupled to any specific DOM structure.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    if page.tree is not None:
+        return _parse_company_profile_native(page.tree.root, url)
+    soup = page.soup
     ld = _extract_ld_json(soup)
 
     company_name = ld.get("name") if ld else None
@@ -96,13 +158,7 @@ def parse_company_profile(html: str, url: str) -> Dict[str, Any]:
             employees = _safe_int(value_text)
 
     # Social links
-    socials: List[Dict[str, str]] = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        lower = href.lower()
-        if any(domain in lower for domain in ("facebook.com", "linkedin.com", "twitter.com", "x.com")):
-            domain = href.split("/")[2] if "://" in href else href
-            socials.append({"domain": domain, "link": href})
+    socials = _social_links(a["href"] for a in soup.find_all("a", href=True))
 
     # Contact / metadata list (very generic)
     contact_information: List[Dict[str, str]] = []
@@ -112,23 +168,75 @@ def parse_company_profile(html: str, url: str) -> Dict[str, Any]:
         if value:
             contact_information.append({"Type": type_, "value": value})
 
-    basics: Dict[str, Any] = {
-        "url": url,
-        "id": ld.get("@id") or None,
-        "company_name": company_name,
-        "company_socials": socials,
-        "year_founded": year_founded,
-        "status": status,
-        "employees": employees,
-        "latest_deal_type": None,
-        "financing_rounds": None,
-        "investments": None,
-        "description": description,
-        "contact_information": contact_information,
-        "patents": None,
-        "research_analysis": None,
-        "patent_activity": None,
-    }
+    return _build_basics(
+        url=url,
+        ld=ld,
+        company_name=company_name,
+        description=description,
+        year_founded=year_founded,
+        status=status,
+        employees=employees,
+        socials=socials,
+        contact_information=contact_information,
+    )
+
+def _find_text_native(root: Any, selectors: List[str]) -> Optional[str]:
+    for selector in selectors:
+        tag = select_first(root, selector)
+        if tag and node_text(tag):
+            return node_text(tag)
+    return None
 
-    LOGGER.debug("Parsed basic company profile for %s: %s", url, basics)
-    return basics
\ No newline at end of file
+def _parse_company_profile_native(root: Any, url: str) -> Dict[str, Any]:
+    scripts = select_all(root, 'script[type="application/ld+json"]')
+    ld = _ld_json_from_scripts(script.text(deep=True) for script in scripts)
+
+    company_name = ld.get("name") if ld else None
+    if not company_name:
+        company_name = _find_text_native(root, ['h1[data-test="company-name"]', "h1.company-name", "h1"])
+
+    description = ld.get("description") if ld else None
+    if not description:
+        description = _find_text_native(
+            root,
+            ['p[data-test="company-description"]', "p.company-description"]
+        )
+
+    year_founded = None
+    status = None
+    employees: Optional[int] = None
+
+    for row in select_all(root, "dl, table tr"):
+        label = select_first(row, "dt, th")
+        value = select_first(row, "dd, td")
+        if not label or not value:
+            continue
+        label_text = node_text(label).lower()
+        value_text = node_text(value)
+        if "founded" in label_text and year_founded is None:
+            year_founded = _safe_int(value_text)
+        elif ("status" in label_text or "ownership" in label_text) and status is None:
+            status = value_text
+        elif "employees" in label_text and employees is None:
+            employees = _safe_int(value_text)
+
+    socials = _social_links(node_attr(a, "href") for a in select_all(root, "a[href]"))
+
+    contact_information: List[Dict[str, str]] = []
+    for li in select_all(root, "ul li[data-type], ul li[data-label]"):
+        type_ = node_attr(li, "data-type") or node_attr(li, "data-label") or "Unknown"
+        value = node_text(li)
+        if value:
+            contact_information.append({"Type": type_, "value": value})
+
+    return _build_basics(
+        url=url,
+        ld=ld,
+        company_name=company_name,
+        description=description,
+        year_founded=year_founded,
+        status=status,
+        employees=employees,
+        socials=socials,
+        contact_information=contact_information,
+    )
\ No newline at end of file
@@ -3,12 +3,23 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List
 
-from bs4 import BeautifulSoup
+from src.extractors.parsed_page import (
+    ParsedPage,
+    node_attr,
+    node_text,
+    select_all,
+    select_first,
+)
 
 LOGGER = logging.getLogger(__name__)
 
 def parse_competitors(html: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
+    return parse_competitors_page(ParsedPage.from_html(html))
+
+def parse_competitors_page(page: ParsedPage) -> List[Dict[str, Any]]:
+    if page.tree is not None:
+        return _parse_competitors_native(page.tree.root)
+    soup = page.soup
     competitors: List[Dict[str, Any]] = []
 
     table = None
@@ -52,5 +63,48 @@ def parse_competitors(html: str) -> List[Dict[str, Any]]:
             }
         )
 
+    LOGGER.debug("Parsed %d competitors", len(competitors))
+    return competitors
+
+def _parse_competitors_native(root: Any) -> List[Dict[str, Any]]:
+    competitors: List[Dict[str, Any]] = []
+
+    table = None
+    for candidate in select_all(root, "table"):
+        header_cells = [node_text(c).lower() for c in select_all(candidate, "th")]
+        if not header_cells:
+            continue
+        if any("competitor" in h or "company" in h for h in header_cells) and any(
+            "location" in h for h in header_cells
+        ):
+            table = candidate
+            break
+
+    if not table:
+        LOGGER.debug("No competitor table found.")
+        return competitors
+
+    for row in select_all(table, "tr"):
+        cells = select_all(row, "td")
+        if len(cells) < 3:
+            continue
+        link_tag = select_first(cells[0], "a[href]")
+        link = node_attr(link_tag, "href") if link_tag else None
+        name = node_text(cells[0]) or None
+        status = node_text(cells[1]) or None
+        location = node_text(cells[2]) or None
+
+        if not name:
+            continue
+
+        competitors.append(
+            {
+                "company_name": name,
+                "financing_status": status,
+                "link": link,
+                "location": location,
+            }
+        )
+
     LOGGER.debug("Parsed %d competitors", len(competitors))
     return competitors
\ No newline at end of file
@@ -3,12 +3,24 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List
 
-from bs4 import BeautifulSoup
+from src.extractors.parsed_page import (
+    ParsedPage,
+    is_text_string,
+    node_string,
+    node_text,
+    select_all,
+    select_first,
+)
 
 LOGGER = logging.getLogger(__name__)
 
 def parse_faq(html: str) -> List[Dict[str, Any]]:
-    soup = BeautifulSoup(html, "html.parser")
+    return parse_faq_page(ParsedPage.from_html(html))
+
+def parse_faq_page(page: ParsedPage) -> List[Dict[str, Any]]:
+    if page.tree is not None:
+        return _parse_faq_native(page.tree.root)
+    soup = page.soup
     faq_entries: List[Dict[str, Any]] = []
 
     container = None
@@ -32,7 +44,7 @@ def parse_faq(html: str) -> List[Dict[str, Any]]:
         question = None
         answer = None
         q_tag = block.find(["h3", "h4"], attrs={"data-test": "faq-question"}) or block.find(
-            ["h3", "h4"], string=lambda s: s and "?" in s
+            ["h3", "h4"], string=lambda s: is_text_string(s) and "?" in s
         )
         a_tag = block.find("p", attrs={"data-test": "faq-answer"}) or block.find("p")
         if q_tag:
@@ -45,5 +57,47 @@ def parse_faq(html: str) -> List[Dict[str, Any]]:
         if answer:
             faq_entries.append({"type": "Answer", "value": answer})
 
+    LOGGER.debug("Parsed %d FAQ entries", len(faq_entries))
+    return faq_entries
+
+def _parse_faq_native(root: Any) -> List[Dict[str, Any]]:
+    faq_entries: List[Dict[str, Any]] = []
+
+    container = select_first(root, '[data-test="faq-section"]')
+    if not container:
+        for candidate in select_all(root, "section"):
+            heading = select_first(candidate, "h2, h3")
+            if heading and "faq" in node_text(heading).lower():
+                container = candidate
+                break
+
+    if not container:
+        LOGGER.debug("No FAQ section found.")
+        return faq_entries
+
+    blocks = select_all(container, '[data-test="faq-item"]') or select_all(container, "div")
+    for block in blocks:
+        question = None
+        answer = None
+        q_tag = select_first(
+            block, 'h3[data-test="faq-question"], h4[data-test="faq-question"]'
+        )
+        if q_tag is None:
+            for heading in select_all(block, "h3, h4"):
+                string = node_string(heading)
+                if string and "?" in string:
+                    q_tag = heading
+                    break
+        a_tag = select_first(block, 'p[data-test="faq-answer"]') or select_first(block, "p")
+        if q_tag:
+            question = node_text(q_tag)
+        if a_tag:
+            answer = node_text(a_tag)
+
+        if question:
+            faq_entries.append({"type": "Question", "value": question})
+        if answer:
+            faq_entries.append({"type": "Answer", "value": answer})
+
     LOGGER.debug("Parsed %d FAQ entries", len(faq_entries))
     return faq_entries
\ No newline at end of file
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import asdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from bs4 import BeautifulSoup
 
+from src.extractors.parsed_page import ParsedPage, node_text, select_all, select_first
 from src.models.investment_record import InvestmentRecord
 
 LOGGER = logging.getLogger(__name__)
@@ -24,57 +24,115 @@ def _parse_date(value: str) -> Optional[str]:
 
 def parse_investments(html: str) -> tuple[Dict[str, Any], List[Dict[str, Any]], List[str]]:
     """
-    Parse investment history and summary metrics.
+    Parse investment history and summary metrics from raw HTML.
 
     Returns:
       - summary dict with latest_deal_type, financing_rounds, investments
       - list of investment record dicts
       - list of investor names
     """
-    soup = BeautifulSoup(html, "html.parser")
+    summary, investments, investors = parse_investments_page(ParsedPage.from_html(html))
+    return summary, [investment.to_dict() for investment in investments], investors
 
-    investments: List[InvestmentRecord] = []
-    investors: List[str] = []
+def _is_investments_table(header_cells: List[str]) -> bool:
+    return any("deal" in h for h in header_cells) and any(
+        "company" in h or "target" in h for h in header_cells
+    )
 
+def _investment_rows_from_soup(soup: BeautifulSoup) -> List[List[str]]:
     # Look for a generic investments table
-    table = None
     for candidate in soup.find_all("table"):
         header_cells = [c.get_text(strip=True).lower() for c in candidate.find_all("th")]
-        if not header_cells:
+        if header_cells and _is_investments_table(header_cells):
+            return [
+                [cell.get_text(strip=True) for cell in row.find_all("td")]
+                for row in candidate.find_all("tr")
+            ]
+    return []
+
+def _investment_rows_native(root: Any) -> List[List[str]]:
+    for candidate in select_all(root, "table"):
+        header_cells = [node_text(c).lower() for c in select_all(candidate, "th")]
+        if header_cells and _is_investments_table(header_cells):
+            return [
+                [node_text(cell) for cell in select_all(row, "td")]
+                for row in select_all(candidate, "tr")
+            ]
+    return []
+
+def parse_investments_page(
+    page: ParsedPage,
+) -> tuple[Dict[str, Any], List[InvestmentRecord], List[str]]:
+    """
+    Parse investment history and summary metrics.
+
+    Returns:
+      - summary dict with latest_deal_type, financing_rounds, investments
+      - list of InvestmentRecord models (``to_dict()`` gives the output dicts)
+      - list of investor names
+    """
+    badge_texts: List[str] = []
+    investor_names: List[str] = []
+
+    if page.tree is not None:
+        root = page.tree.root
+        rows = _investment_rows_native(root)
+        badge_container = select_first(root, '[data-test="deal-summary"]')
+        if badge_container:
+            badge_texts = [node_text(badge) for badge in select_all(badge_container, "span")]
+        investor_section = select_first(root, '[data-test="investors"]')
+        if investor_section:
+            investor_names = [node_text(tag) for tag in select_all(investor_section, "a")]
+    else:
+        soup = page.soup
+        rows = _investment_rows_from_soup(soup)
+        badge_container = soup.find(attrs={"data-test": "deal-summary"})
+        if badge_container:
+            badge_texts = [badge.get_text(strip=True) for badge in badge_container.find_all("span")]
+        investor_section = soup.find(attrs={"data-test": "investors"})
+        if investor_section:
+            investor_names = [tag.get_text(strip=True) for tag in investor_section.find_all("a")]
+
+    return build_investments(rows, badge_texts, investor_names)
+
+def build_investments(
+    rows: Iterable[List[str]],
+    badge_texts: Iterable[str],
+    investor_names: Iterable[str],
+) -> tuple[Dict[str, Any], List[InvestmentRecord], List[str]]:
+    """
+    Build the parse_investments_page result from the cell texts of the
+    investments table rows, the deal summary badges and the investor links.
+    """
+    investments: List[InvestmentRecord] = []
+    investors: List[str] = []
+
+    for cells in rows:
+        if len(cells) < 3:
             continue
-        if any("deal" in h for h in header_cells) and any("company" in h or "target" in h for h in header_cells):
-            table = candidate
-            break
-
-    if table:
-        for row in table.find_all("tr"):
-            cells = row.find_all("td")
-            if len(cells) < 3:
-                continue
-            company_name = cells[0].get_text(strip=True) or None
-            raw_date = cells[1].get_text(strip=True)
-            deal_date = _parse_date(raw_date)
-            raw_deal_size = cells[2].get_text(strip=True) or None
-            deal_size = None
-            if raw_deal_size:
-                # Strip non-numeric, keep simple string so downstream code can interpret
-                deal_size = raw_deal_size
-
-            deal_type = None
-            industry = None
-            if len(cells) > 3:
-                deal_type = cells[3].get_text(strip=True) or None
-            if len(cells) > 4:
-                industry = cells[4].get_text(strip=True) or None
-
-            record = InvestmentRecord(
-                company_name=company_name,
-                deal_date=deal_date,
-                deal_size=deal_size,
-                deal_type=deal_type,
-                industry=industry,
-            )
-            investments.append(record)
+        company_name = cells[0] or None
+        deal_date = _parse_date(cells[1])
+        raw_deal_size = cells[2] or None
+        deal_size = None
+        if raw_deal_size:
+            # Strip non-numeric, keep simple string so downstream code can interpret
+            deal_size = raw_deal_size
+
+        deal_type = None
+        industry = None
+        if len(cells) > 3:
+            deal_type = cells[3] or None
+        if len(cells) > 4:
+            industry = cells[4] or None
+
+        record = InvestmentRecord(
+            company_name=company_name,
+            deal_date=deal_date,
+            deal_size=deal_size,
+            deal_type=deal_type,
+            industry=industry,
+        )
+        investments.append(record)
 
     # Basic metrics from summary badges or stats
     summary: Dict[str, Any] = {
@@ -83,30 +141,23 @@ def parse_investments(html: str) -> tuple[Dict[str, Any], List[Dict[str, Any]],
         "investments": len(investments) if investments else None,
     }
 
-    badge_container = soup.find(attrs={"data-test": "deal-summary"})
-    if badge_container:
-        badges = badge_container.find_all("span")
-        for badge in badges:
-            text = badge.get_text(strip=True).lower()
-            if "latest" in text and "deal" in text and ":" in text:
-                summary["latest_deal_type"] = text.split(":", 1)[1].strip()
+    for badge_text in badge_texts:
+        text = badge_text.lower()
+        if "latest" in text and "deal" in text and ":" in text:
+            summary["latest_deal_type"] = text.split(":", 1)[1].strip()
 
     if investments and summary["latest_deal_type"] is None:
         summary["latest_deal_type"] = investments[0].deal_type
 
     # Investors list
-    investor_section = soup.find(attrs={"data-test": "investors"})
-    if investor_section:
-        for tag in investor_section.find_all("a"):
-            name = tag.get_text(strip=True)
-            if name:
-                investors.append(name)
-
-    investments_dicts = [asdict(inv) for inv in investments]
+    for name in investor_names:
+        if name:
+            investors.append(name)
+
     LOGGER.debug(
         "Parsed investments: %d records, summary=%s, investors=%d",
-        len(investments_dicts),
+        len(investments),
         summary,
         len(investors),
     )
-    return summary, investments_dicts, investors
\ No newline at end of file
+    return summary, investments, investors
\ No newline at end of file
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional
+
+from bs4 import BeautifulSoup, FeatureNotFound
+from bs4.element import NavigableString, Script, Stylesheet, TemplateString
+
+DEFAULT_PARSER_BACKEND = "html.parser"
+
+# BeautifulSoup tree builders plus the native selectolax (lexbor) fast path.
+PARSER_BACKENDS = ("html.parser", "lxml", "selectolax")
+
+# Elements whose text BeautifulSoup's get_text() leaves out by default.
+_NON_TEXT_TAGS = ("script", "style", "template")
+
+def _load_lexbor_parser() -> Any:
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError as exc:  # pragma: no cover - depends on optional extra
+        raise ImportError(
+            "The 'selectolax' parser backend requires the selectolax package "
+            "(pip install selectolax)."
+        ) from exc
+    return LexborHTMLParser
+
+def _unknown_backend(backend: str) -> ValueError:
+    return ValueError(
+        f"Unknown parser backend {backend!r}; expected one of {', '.join(PARSER_BACKENDS)}"
+    )
+
+def check_parser_backend(backend: str) -> None:
+    """
+    Fail early if a backend is unknown or its library is not installed.
+    """
+    if backend not in PARSER_BACKENDS:
+        raise _unknown_backend(backend)
+    if backend == "selectolax":
+        _load_lexbor_parser()
+    elif backend == "lxml":
+        try:
+            BeautifulSoup("", backend)
+        except FeatureNotFound as exc:
+            raise ImportError(
+                "The 'lxml' parser backend requires the lxml package (pip install lxml)."
+            ) from exc
+
+@dataclass(frozen=True)
+class ParsedPage:
+    """
+    A company profile page that has been parsed once.
+
+    Every extractor accepts a ParsedPage so the HTML tree is built a single
+    time per page and shared between them. Extractors treat the tree as
+    read-only. BeautifulSoup backends populate ``soup``; the selectolax
+    backend populates ``tree`` and extractors switch to their native path.
+    """
+
+    html: str
+    backend: str = DEFAULT_PARSER_BACKEND
+    soup: Optional[BeautifulSoup] = None
+    tree: Optional[Any] = None
+
+    @classmethod
+    def from_html(cls, html: str, backend: str = DEFAULT_PARSER_BACKEND) -> "ParsedPage":
+        if backend == "selectolax":
+            return cls(html=html, backend=backend, tree=_load_lexbor_parser()(html))
+        if backend not in PARSER_BACKENDS:
+            raise _unknown_backend(backend)
+        return cls(html=html, backend=backend, soup=BeautifulSoup(html, backend))
+
+def is_text_string(string: Optional[NavigableString]) -> bool:
+    """
+    True for page text, False for script, style and template contents (and None).
+    """
+    return string is not None and not isinstance(string, (Script, Stylesheet, TemplateString))
+
+# Helpers for the selectolax path. They mirror the BeautifulSoup calls used by
+# the extractors so both paths produce identical records.
+
+def _text_nodes(node: Any) -> Iterator[str]:
+    for child in node.iter(include_text=True):
+        if child.tag == "-text":
+            yield child.text(deep=False)
+        elif child.tag not in _NON_TEXT_TAGS and not child.tag.startswith(("-", "_")):
+            yield from _text_nodes(child)
+
+def node_text(node: Any) -> str:
+    """
+    Equivalent of ``Tag.get_text(strip=True)``: strip every text node and join,
+    leaving out script, style and template contents.
+    """
+    child = node.child
+    if child is not None and child.tag == "-text" and child.next is None:
+        # Most table cells and labels hold a single text node.
+        return child.text(deep=False).strip()
+    return "".join(part.strip() for part in _text_nodes(node))
+
+def node_attr(node: Any, name: str) -> Optional[str]:
+    """
+    Attribute lookup that reports valueless attributes as "" like BeautifulSoup.
+    """
+    attributes = node.attributes
+    if name not in attributes:
+        return None
+    return attributes[name] or ""
+
+def select_all(node: Any, selector: str) -> List[Any]:
+    """
+    Descendants matching ``selector`` in document order, excluding ``node``.
+    """
+    own_id = node.mem_id
+    return [match for match in node.css(selector) if match.mem_id != own_id]
+
+def select_first(node: Any, selector: str) -> Optional[Any]:
+    matches = select_all(node, selector)
+    return matches[0] if matches else None
+
+def node_string(node: Any) -> Optional[str]:
+    """
+    Equivalent of ``Tag.string``: the text of a lone child, followed downwards.
+    Script, style and template contents count as no text, like in
+    ``is_text_string``.
+    """
+    children = list(node.iter(include_text=True))
+    if len(children) != 1:
+        return None
+    child = children[0]
+    if child.tag == "-text":
+        return child.text(deep=False)
+    if child.tag in _NON_TEXT_TAGS or child.tag.startswith(("-", "_")):
+        return None
+    return node_string(child)
\ No newline at end of file
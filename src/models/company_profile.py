@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from dataclasses import field
+from typing import Any, Dict, List, Optional, Union
 
-@dataclass
+from src.models.investment_record import InvestmentRecord
+from src.models.slots import slotted_dataclass
+
+@slotted_dataclass
 class CompanyProfile:
     url: str
     id: Optional[str]
@@ -21,7 +24,7 @@ class CompanyProfile:
     competitors: List[Dict[str, Any]] = field(default_factory=list)
     research_analysis: Optional[Any] = None
     patent_activity: Optional[Any] = None
-    all_investments: List[Dict[str, Any]] = field(default_factory=list)
+    all_investments: List[Union[InvestmentRecord, Dict[str, Any]]] = field(default_factory=list)
     faq: List[Dict[str, Any]] = field(default_factory=list)
     investors: List[str] = field(default_factory=list)
 
@@ -32,7 +35,7 @@ class CompanyProfile:
         basics: Dict[str, Any],
         investments_summary: Dict[str, Any],
         competitors: List[Dict[str, Any]],
-        all_investments: List[Dict[str, Any]],
+        all_investments: List[Union[InvestmentRecord, Dict[str, Any]]],
         faq: List[Dict[str, Any]],
         investors: List[str],
     ) -> "CompanyProfile":
@@ -62,6 +65,9 @@ class CompanyProfile:
         )
 
     def to_dict(self) -> Dict[str, Any]:
+        """
+        The output record; the only dict built per profile and per deal.
+        """
         return {
             "url": self.url,
             "id": self.id,
@@ -79,7 +85,10 @@ class CompanyProfile:
             "competitors": self.competitors,
             "research_analysis": self.research_analysis,
             "patent_activity": self.patent_activity,
-            "all_investments": self.all_investments,
+            "all_investments": [
+                investment.to_dict() if isinstance(investment, InvestmentRecord) else investment
+                for investment in self.all_investments
+            ],
             "faq": self.faq,
             "investors": self.investors,
         }
\ No newline at end of file
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 
-@dataclass
+from src.models.slots import slotted_dataclass
+
+@slotted_dataclass
 class InvestmentRecord:
     company_name: Optional[str]
     deal_date: Optional[str]
     deal_size: Optional[str]
     deal_type: Optional[str]
-    industry: Optional[str]
\ No newline at end of file
+    industry: Optional[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Hand-written instead of dataclasses.asdict, which deep-copies recursively.
+        return {
+            "company_name": self.company_name,
+            "deal_date": self.deal_date,
+            "deal_size": self.deal_size,
+            "deal_type": self.deal_type,
+            "industry": self.industry,
+        }
\ No newline at end of file
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any, Type, TypeVar
+
+T = TypeVar("T")
+
+def slotted_dataclass(cls: Type[T]) -> Type[T]:
+    """
+    ``@dataclass`` that also gives the class ``__slots__``.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10: the
+    dataclass is rebuilt with one slot per field, so instances carry no
+    ``__dict__``. Field defaults keep working because the generated
+    ``__init__`` holds them itself.
+    """
+    cls = dataclass(cls)
+    field_names = tuple(f.name for f in fields(cls))
+    namespace: dict[str, Any] = dict(cls.__dict__)
+    namespace["__slots__"] = field_names
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
\ No newline at end of file
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import csv
+import logging
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, List, Mapping, Optional, Type
+
+from src.outputs.tables import TABLES, Columns, Row
+from src.utils.metrics import STAGE_SECONDS
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional: pip install 'pitchbook-companies-scraper[columnar]'
+    pyarrow = None
+
+LOGGER = logging.getLogger(__name__)
+
+COLUMNAR_FORMATS = ("auto", "parquet", "csv")
+
+def resolve_columnar_format(fmt: str) -> str:
+    """
+    Map ``auto`` to ``parquet`` when pyarrow is installed and ``csv`` otherwise.
+    """
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format {fmt!r}; choose one of {', '.join(COLUMNAR_FORMATS)}")
+    if fmt == "parquet" and pyarrow is None:
+        raise ImportError(
+            "Parquet export requires pyarrow (pip install 'pitchbook-companies-scraper[columnar]')"
+        )
+    if fmt == "auto":
+        if pyarrow is None:
+            LOGGER.warning("pyarrow is not installed; writing columnar tables as CSV")
+            return "csv"
+        return "parquet"
+    return fmt
+
+def _clear_parts(directory: Path) -> None:
+    for path in directory.glob("part-*"):
+        if path.suffix in (".parquet", ".csv"):
+            path.unlink()
+
+def _next_part(directory: Path, suffix: str) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    index = 0
+    while (directory / f"part-{index:05d}{suffix}").exists():
+        index += 1
+    return directory / f"part-{index:05d}{suffix}"
+
+class _TableWriter:
+    def __init__(self, directory: Path, columns: Columns, fmt: str) -> None:
+        self.columns = columns
+        self.fmt = fmt
+        self.rows = 0
+        if fmt == "parquet":
+            self.path = _next_part(directory, ".parquet")
+            self.schema = pyarrow.schema(
+                [
+                    (name, pyarrow.int64() if kind == "int" else pyarrow.string())
+                    for name, kind in columns
+                ]
+            )
+            self._parquet = pyarrow.parquet.ParquetWriter(str(self.path), self.schema)
+        else:
+            self.path = _next_part(directory, ".csv")
+            self._file = self.path.open("w", encoding="utf-8", newline="")
+            self._csv = csv.writer(self._file)
+            self._csv.writerow([name for name, _ in columns])
+
+    def write_batch(self, rows: List[Row]) -> None:
+        if not rows:
+            return
+        if self.fmt == "parquet":
+            arrays = [list(column) for column in zip(*rows)]
+            self._parquet.write_table(pyarrow.Table.from_arrays(arrays, schema=self.schema))
+        else:
+            self._csv.writerows(rows)
+            self._file.flush()
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        if self.fmt == "parquet":
+            self._parquet.close()
+        else:
+            self._file.close()
+
+class ColumnarSink:
+    """
+    Streams records into normalized tables keyed by company ``id``.
+
+    One directory per table (``companies``, ``investments``, ``competitors``,
+    ``investors``, ``contacts``, ``faq``) holds ``part-NNNNN.parquet`` files,
+    readable as one dataset by pandas, pyarrow or DuckDB. Rows are buffered
+    per table and written as a Parquet row group every ``batch_rows`` rows, so
+    memory stays bounded. A fresh sink replaces the parts of earlier runs;
+    with ``resume`` it writes a new part next to them instead, so a resumed
+    run adds to the existing tables. Without pyarrow, ``format="auto"``
+    writes CSV parts instead.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        fmt: str = "auto",
+        batch_rows: int = 10_000,
+        resume: bool = False,
+    ) -> None:
+        if batch_rows < 1:
+            raise ValueError(f"batch_rows must be at least 1, got {batch_rows}")
+        self.directory = directory
+        self.fmt = resolve_columnar_format(fmt)
+        self.batch_rows = batch_rows
+        self.count = 0
+        if not resume:
+            for name in TABLES:
+                _clear_parts(directory / name)
+        self._writers = {
+            name: _TableWriter(directory / name, columns, self.fmt)
+            for name, (columns, _) in TABLES.items()
+        }
+        self._buffers: Dict[str, List[Row]] = {name: [] for name in TABLES}
+        self._closed = False
+
+    def write(self, record: Any) -> None:
+        if not isinstance(record, Mapping):
+            record = record.to_dict()
+        company_id = record.get("id") or record.get("url")
+        with STAGE_SECONDS.time(stage="export_columnar"):
+            for name, (_, rows) in TABLES.items():
+                buffer = self._buffers[name]
+                buffer.extend(rows(record, company_id))
+                if len(buffer) >= self.batch_rows:
+                    self._writers[name].write_batch(buffer)
+                    self._buffers[name] = []
+        self.count += 1
+
+    def row_counts(self) -> Dict[str, int]:
+        return {
+            name: writer.rows + len(self._buffers[name]) for name, writer in self._writers.items()
+        }
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for name, writer in self._writers.items():
+            writer.write_batch(self._buffers[name])
+            self._buffers[name] = []
+            writer.close()
+
+    def __enter__(self) -> "ColumnarSink":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
\ No newline at end of file
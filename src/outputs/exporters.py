@@ -2,21 +2,194 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from pathlib import Path
-from typing import Iterable, Mapping, Any
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional, Sequence, Type
+
+from src.utils.files import truncate_partial_line
+from src.utils.metrics import STAGE_SECONDS
+
+try:
+    import orjson
+except ImportError:  # optional: pip install 'pitchbook-companies-scraper[fast]'
+    orjson = None
 
 LOGGER = logging.getLogger(__name__)
 
-def write_pretty_json(records: Iterable[Mapping[str, Any]], path: Path) -> None:
-    data = list(records)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    LOGGER.info("Wrote pretty JSON with %d records to %s", len(data), path)
+DEFAULT_JSON_BACKEND = "json"
+JSON_BACKENDS = ("json", "orjson")
+
+# Structural whitespace in indented JSON; string values never contain a raw
+# newline (it is always escaped), so these only ever match between tokens.
+_PRETTY_ITEM_BREAK = re.compile(rb",\n *")
+_PRETTY_BREAK = re.compile(rb"\n *")
+
+def _encode_model(obj: Any) -> Any:
+    """
+    ``json`` fallback that lets sinks take models (CompanyProfile,
+    InvestmentRecord) directly instead of pre-built dicts.
+    """
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+def check_json_backend(backend: str) -> None:
+    """
+    Raise ValueError for an unknown backend and ImportError if it is not installed.
+    """
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend {backend!r}; choose one of {', '.join(JSON_BACKENDS)}")
+    if backend == "orjson" and orjson is None:
+        raise ImportError(
+            "The orjson JSON backend requires orjson "
+            "(pip install 'pitchbook-companies-scraper[fast]')"
+        )
+
+class EncodedRecord(NamedTuple):
+    """
+    One record serialized once, in the two layouts the sinks need (UTF-8).
+    """
+
+    pretty: bytes
+    compact: bytes
+
+def encode_record(record: Any, backend: str = DEFAULT_JSON_BACKEND) -> EncodedRecord:
+    """
+    Serialize ``record`` once and derive both output layouts from that pass.
+
+    ``pretty`` equals ``json.dumps(record, indent=2, ensure_ascii=False)`` and
+    ``compact`` equals ``json.dumps(record, ensure_ascii=False)``; the compact
+    form is obtained by collapsing the indentation rather than by encoding
+    again. With orjson the bytes are identical for everything the scraper
+    emits (strings, integers, booleans, null); only floats that Python writes
+    in exponent form (``1e+16``) would differ. Values orjson cannot encode,
+    such as integers beyond 64 bits, fall back to the standard library.
+    """
+    pretty: Optional[bytes] = None
+    if backend == "orjson":
+        try:
+            pretty = orjson.dumps(record, option=orjson.OPT_INDENT_2, default=_encode_model)
+        except TypeError:
+            pretty = None
+    if pretty is None:
+        pretty = json.dumps(
+            record, indent=2, ensure_ascii=False, default=_encode_model
+        ).encode("utf-8")
+    compact = _PRETTY_BREAK.sub(b"", _PRETTY_ITEM_BREAK.sub(b", ", pretty))
+    return EncodedRecord(pretty, compact)
+
+class _FileSink:
+    """
+    Base class for incremental record sinks that own one open file.
+    """
+
+    def __init__(
+        self, path: Path, mode: str = "w", *, json_backend: str = DEFAULT_JSON_BACKEND
+    ) -> None:
+        check_json_backend(json_backend)
+        self.path = path
+        self.json_backend = json_backend
+        self.count = 0
+        self._file = path.open(mode + "b")
+
+    def write(self, record: Any) -> None:
+        self.write_encoded(encode_record(record, self.json_backend))
+
+    def write_encoded(self, encoded: EncodedRecord) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "_FileSink":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+def read_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+class JsonlSink(_FileSink):
+    """
+    Writes one JSON document per line and flushes after every record, so a
+    crash loses at most the record being written.
+    """
+
+    def __init__(
+        self, path: Path, *, append: bool = False, json_backend: str = DEFAULT_JSON_BACKEND
+    ) -> None:
+        if append:
+            truncate_partial_line(path)
+        super().__init__(path, "a" if append else "w", json_backend=json_backend)
+
+    def write_encoded(self, encoded: EncodedRecord) -> None:
+        self._file.write(encoded.compact + b"\n")
+        self._file.flush()
+        self.count += 1
+
+class PrettyJsonSink(_FileSink):
+    """
+    Streams records into an indented JSON array without holding them in memory.
+
+    The output is byte-identical to ``json.dump(records, f, indent=2)``.
+    """
+
+    def write_encoded(self, encoded: EncodedRecord) -> None:
+        body = encoded.pretty.replace(b"\n", b"\n  ")
+        self._file.write((b"[\n  " if self.count == 0 else b",\n  ") + body)
+        self.count += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.write(b"\n]" if self.count else b"[]")
+        super().close()
+
+class RecordWriter:
+    """
+    Fans each record out to several sinks, serializing it only once.
+    """
+
+    def __init__(
+        self, sinks: Sequence[_FileSink], *, json_backend: str = DEFAULT_JSON_BACKEND
+    ) -> None:
+        check_json_backend(json_backend)
+        self.sinks = list(sinks)
+        self.json_backend = json_backend
+
+    def write(self, record: Any) -> EncodedRecord:
+        """
+        Write ``record`` to every sink; the encoding is returned for reuse.
+        """
+        with STAGE_SECONDS.time(stage="export_json"):
+            encoded = encode_record(record, self.json_backend)
+            for sink in self.sinks:
+                sink.write_encoded(encoded)
+        return encoded
+
+def write_pretty_json(
+    records: Iterable[Mapping[str, Any]], path: Path, *, json_backend: str = DEFAULT_JSON_BACKEND
+) -> None:
+    with PrettyJsonSink(path, json_backend=json_backend) as sink:
+        for record in records:
+            sink.write(record)
+    LOGGER.info("Wrote pretty JSON with %d records to %s", sink.count, path)
 
-def write_jsonl(records: Iterable[Mapping[str, Any]], path: Path) -> None:
-    count = 0
-    with path.open("w", encoding="utf-8") as f:
+def write_jsonl(
+    records: Iterable[Mapping[str, Any]], path: Path, *, json_backend: str = DEFAULT_JSON_BACKEND
+) -> None:
+    with JsonlSink(path, json_backend=json_backend) as sink:
         for record in records:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
-            count += 1
-    LOGGER.info("Wrote JSONL with %d records to %s", count, path)
\ No newline at end of file
+            sink.write(record)
+    LOGGER.info("Wrote JSONL with %d records to %s", sink.count, path)
\ No newline at end of file
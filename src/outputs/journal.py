@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Optional, Set
+
+from src.utils.files import truncate_partial_line
+from src.utils.statuses import STATUS_DONE, STATUS_PERMANENT
+
+LOGGER = logging.getLogger(__name__)
+
+_FINISHED_STATUSES = frozenset({STATUS_DONE, STATUS_PERMANENT})
+
+class RunJournal:
+    """
+    Append-only checkpoint journal of processed URLs, kept next to the output.
+
+    Each line is a JSON object ``{"url": ..., "status": ...}`` with status
+    ``done``, ``failed`` or ``permanent``. A resumed run skips every URL whose
+    latest entry is ``done`` or ``permanent``; failed URLs are retried.
+    ``completed`` is loaded once at startup and not grown by ``record``, so
+    memory does not grow with the run (inputs are de-duplicated upstream).
+    """
+
+    def __init__(self, path: Path, *, resume: bool = False) -> None:
+        self.path = path
+        self.completed: Set[str] = self._load() if resume else set()
+        if resume:
+            # Otherwise the first new entry is glued onto a line torn by a crash.
+            truncate_partial_line(path)
+        self._file = path.open("a" if resume else "w", encoding="utf-8")
+
+    def _load(self) -> Set[str]:
+        completed: Set[str] = set()
+        if not self.path.exists():
+            return completed
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash; that URL is simply redone.
+                    continue
+                if entry.get("status") in _FINISHED_STATUSES:
+                    completed.add(entry["url"])
+                else:
+                    completed.discard(entry.get("url"))
+        LOGGER.info("Loaded %d completed URLs from journal %s", len(completed), self.path)
+        return completed
+
+    def is_done(self, url: str) -> bool:
+        return url in self.completed
+
+    def record(self, url: str, status: str, error: Optional[str] = None) -> None:
+        entry = {"url": url, "status": status}
+        if error:
+            entry["error"] = error
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> "RunJournal":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
\ No newline at end of file
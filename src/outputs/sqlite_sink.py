@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Type
+
+from src.outputs.tables import COMPANY_COLUMNS, TABLES
+from src.utils.metrics import STAGE_SECONDS
+
+LOGGER = logging.getLogger(__name__)
+
+_SQL_TYPES = {"string": "TEXT", "int": "INTEGER"}
+
+# Child tables share the columnar exporter's layout: company_id, position, ...
+_CHILD_TABLES = {name: spec for name, spec in TABLES.items() if name != "companies"}
+
+class SqliteSink:
+    """
+    Upserts records into a SQLite database keyed by company ``id``.
+
+    ``companies`` holds one row per company with the scalar fields and the
+    full record as JSON; list fields go to indexed side tables
+    (``investments``, ``competitors``, ``investors``, ``contacts``, ``faq``).
+    Every sink instance registers a row in ``runs``. A company's
+    ``updated_run`` only moves when its record actually changed, so "what
+    changed since run X" is an index range scan, and ``seen_run`` records the
+    last run that saw it. Writes are committed every ``batch_size`` records
+    in one transaction, with the database in WAL mode.
+    """
+
+    def __init__(self, path: Path, *, batch_size: int = 500) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self.path = path
+        self.batch_size = batch_size
+        self.count = 0
+        self.changed = 0
+        self._pending = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Transactions are managed explicitly so each batch commits once.
+        self._conn = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        cursor = self._conn.execute("INSERT INTO runs (started_at) VALUES (?)", (time.time(),))
+        self.run_id: int = cursor.lastrowid
+        self._company_sql = self._upsert_company_sql()
+        self._child_sql = {
+            name: "INSERT INTO {} ({}) VALUES ({})".format(
+                name,
+                ", ".join(column for column, _ in columns),
+                ", ".join("?" for _ in columns),
+            )
+            for name, (columns, _) in _CHILD_TABLES.items()
+        }
+        self._closed = False
+
+    def _create_schema(self) -> None:
+        company_columns = ["id TEXT PRIMARY KEY"] + [
+            f"{column} {_SQL_TYPES[kind]}" for column, kind in COMPANY_COLUMNS[1:]
+        ]
+        company_columns += [
+            "record TEXT NOT NULL",
+            "first_run INTEGER NOT NULL",
+            "updated_run INTEGER NOT NULL",
+            "seen_run INTEGER NOT NULL",
+            "updated_at REAL NOT NULL",
+        ]
+        statements = [
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_id INTEGER PRIMARY KEY AUTOINCREMENT, started_at REAL NOT NULL, finished_at REAL)",
+            f"CREATE TABLE IF NOT EXISTS companies ({', '.join(company_columns)})",
+            "CREATE INDEX IF NOT EXISTS companies_updated_run ON companies (updated_run)",
+        ]
+        for name, (columns, _) in _CHILD_TABLES.items():
+            column_defs = ", ".join(f"{column} {_SQL_TYPES[kind]}" for column, kind in columns)
+            statements.append(
+                f"CREATE TABLE IF NOT EXISTS {name} ("
+                f"{column_defs}, PRIMARY KEY (company_id, position)) WITHOUT ROWID"
+            )
+        for statement in statements:
+            self._conn.execute(statement)
+
+    @staticmethod
+    def _upsert_company_sql() -> str:
+        columns = [column for column, _ in COMPANY_COLUMNS] + [
+            "record",
+            "first_run",
+            "updated_run",
+            "seen_run",
+            "updated_at",
+        ]
+        updates = ", ".join(
+            f"{column} = excluded.{column}" for column in columns if column not in ("id", "first_run")
+        )
+        return (
+            f"INSERT INTO companies ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT (id) DO UPDATE SET {updates}"
+        )
+
+    def _begin(self) -> None:
+        if self._pending == 0:
+            self._conn.execute("BEGIN")
+
+    def write(self, record: Any) -> bool:
+        """
+        Upsert one record; return True if it was new or differs from the stored one.
+        """
+        if not isinstance(record, Mapping):
+            record = record.to_dict()
+        with STAGE_SECONDS.time(stage="export_sqlite"):
+            changed = self._upsert(record)
+        self.count += 1
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.commit()
+        return changed
+
+    def _upsert(self, record: Mapping[str, Any]) -> bool:
+        company_id = record.get("id") or record.get("url")
+        payload = json.dumps(record, ensure_ascii=False, sort_keys=True)
+        self._begin()
+        row = self._conn.execute(
+            "SELECT record FROM companies WHERE id = ?", (company_id,)
+        ).fetchone()
+        changed = row is None or row[0] != payload
+        if changed:
+            values = (
+                (company_id,)
+                + tuple(record.get(column) for column, _ in COMPANY_COLUMNS[1:])
+                + (payload, self.run_id, self.run_id, self.run_id, time.time())
+            )
+            self._conn.execute(self._company_sql, values)
+            for name, (_, rows) in _CHILD_TABLES.items():
+                self._conn.execute(f"DELETE FROM {name} WHERE company_id = ?", (company_id,))
+                self._conn.executemany(self._child_sql[name], rows(record, company_id))
+            self.changed += 1
+        else:
+            self._conn.execute(
+                "UPDATE companies SET seen_run = ? WHERE id = ?", (self.run_id, company_id)
+            )
+        return changed
+
+    def commit(self) -> None:
+        if self._pending:
+            self._conn.execute("COMMIT")
+            self._pending = 0
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self.commit()
+        self._conn.execute(
+            "UPDATE runs SET finished_at = ? WHERE run_id = ?", (time.time(), self.run_id)
+        )
+        self._conn.close()
+
+    def __enter__(self) -> "SqliteSink":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+def _connect(path: Path) -> sqlite3.Connection:
+    return sqlite3.connect(str(path), timeout=30)
+
+def get_company(path: Path, company_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Point lookup of one stored record by company ``id``.
+    """
+    conn = _connect(path)
+    try:
+        row = conn.execute("SELECT record FROM companies WHERE id = ?", (company_id,)).fetchone()
+    finally:
+        conn.close()
+    return json.loads(row[0]) if row is not None else None
+
+def changed_since(path: Path, run_id: int) -> Iterator[Dict[str, Any]]:
+    """
+    Records added or changed by runs after ``run_id`` (index-backed on ``updated_run``).
+    """
+    conn = _connect(path)
+    try:
+        cursor = conn.execute(
+            "SELECT record FROM companies WHERE updated_run > ? ORDER BY updated_run, id",
+            (run_id,),
+        )
+        for (payload,) in cursor:
+            yield json.loads(payload)
+    finally:
+        conn.close()
+
+def write_sqlite(records: Iterable[Mapping[str, Any]], path: Path, *, batch_size: int = 500) -> int:
+    """
+    Upsert ``records`` into the database at ``path``; returns the new run id.
+    """
+    with SqliteSink(path, batch_size=batch_size) as sink:
+        for record in records:
+            sink.write(record)
+    LOGGER.info(
+        "Upserted %d records into %s (run %d, %d new or changed)",
+        sink.count,
+        path,
+        sink.run_id,
+        sink.changed,
+    )
+    return sink.run_id
\ No newline at end of file
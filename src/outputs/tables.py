@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Mapping, Tuple
+
+Row = Tuple[Any, ...]
+Columns = Tuple[Tuple[str, str], ...]
+RowFunction = Callable[[Mapping[str, Any], str], Iterable[Row]]
+
+def _nested(key: str, columns: Tuple[str, ...]) -> RowFunction:
+    def rows(record: Mapping[str, Any], company_id: str) -> Iterable[Row]:
+        for position, item in enumerate(record.get(key) or []):
+            yield (company_id, position) + tuple(item.get(column) for column in columns)
+
+    return rows
+
+def _company_rows(record: Mapping[str, Any], company_id: str) -> Iterable[Row]:
+    yield (company_id,) + tuple(record.get(column) for column, _ in COMPANY_COLUMNS[1:])
+
+def _investor_rows(record: Mapping[str, Any], company_id: str) -> Iterable[Row]:
+    for position, name in enumerate(record.get("investors") or []):
+        yield company_id, position, name
+
+def _contact_rows(record: Mapping[str, Any], company_id: str) -> Iterable[Row]:
+    position = 0
+    for item in record.get("contact_information") or []:
+        yield company_id, position, "contact", item.get("Type"), item.get("value")
+        position += 1
+    for item in record.get("company_socials") or []:
+        yield company_id, position, "social", item.get("domain"), item.get("link")
+        position += 1
+
+COMPANY_COLUMNS: Columns = (
+    ("id", "string"),
+    ("url", "string"),
+    ("company_name", "string"),
+    ("year_founded", "int"),
+    ("status", "string"),
+    ("employees", "int"),
+    ("latest_deal_type", "string"),
+    ("financing_rounds", "int"),
+    ("investments", "int"),
+    ("description", "string"),
+)
+
+_CHILD_KEY = (("company_id", "string"), ("position", "int"))
+
+# table name -> (columns with their types, function yielding one tuple per row)
+TABLES: Dict[str, Tuple[Columns, RowFunction]] = {
+    "companies": (COMPANY_COLUMNS, _company_rows),
+    "investments": (
+        _CHILD_KEY
+        + (
+            ("company_name", "string"),
+            ("deal_date", "string"),
+            ("deal_size", "string"),
+            ("deal_type", "string"),
+            ("industry", "string"),
+        ),
+        _nested("all_investments", ("company_name", "deal_date", "deal_size", "deal_type", "industry")),
+    ),
+    "competitors": (
+        _CHILD_KEY
+        + (
+            ("company_name", "string"),
+            ("financing_status", "string"),
+            ("link", "string"),
+            ("location", "string"),
+        ),
+        _nested("competitors", ("company_name", "financing_status", "link", "location")),
+    ),
+    "investors": (_CHILD_KEY + (("name", "string"),), _investor_rows),
+    "contacts": (
+        _CHILD_KEY + (("kind", "string"), ("type", "string"), ("value", "string")),
+        _contact_rows,
+    ),
+    "faq": (
+        _CHILD_KEY + (("type", "string"), ("value", "string")),
+        _nested("faq", ("type", "value")),
+    ),
+}
\ No newline at end of file
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+class UrlResult(NamedTuple):
+    """
+    Outcome for one input URL: a record, or the error that prevented it.
+    """
+
+    url: str
+    record: Optional[dict]
+    error: Optional[BaseException] = None
+
+_POLL_SECONDS = 0.1
+_DONE = object()
+
+FetchFn = Callable[[str], Any]
+ParseFn = Callable[[str, str], dict]
+ReuseFn = Callable[[str, Any], Tuple[Optional[dict], Any]]
+RememberFn = Callable[[str, Any, dict], None]
+
+def _page_text(page: Any) -> str:
+    return page if isinstance(page, str) else page.text
+
+def run_pipeline(
+    urls: Iterable[str],
+    fetch: FetchFn,
+    parse: ParseFn,
+    *,
+    fetch_workers: int = 4,
+    parse_workers: int = 2,
+    queue_size: int = 64,
+    reuse: Optional[ReuseFn] = None,
+    remember: Optional[RememberFn] = None,
+) -> Iterator[UrlResult]:
+    """
+    Fetch in threads and parse in a process pool, yielding a UrlResult per URL.
+
+    Stages:
+      - a feeder thread admits URLs from ``urls``
+      - ``fetch_workers`` threads call ``fetch(url)`` and push the page into a
+        bounded queue; ``fetch`` returns the HTML or a response carrying it
+        in ``text``
+      - a dispatcher thread hands each page to a ProcessPoolExecutor running
+        ``parse(html, url)``; ``parse`` must be picklable
+      - the caller consumes the results in input order (the writer stage)
+
+    When given, ``reuse(url, page)`` runs in the dispatcher before parsing
+    with what ``fetch`` returned, and returns a previous record, used as is
+    when not None, and a key for the page (e.g. its hash);
+    ``remember(url, key, record)`` is then called with every freshly parsed
+    record. ``remember`` requires ``reuse``.
+
+    At most ``queue_size`` URLs are admitted but not yet consumed, so memory
+    stays flat regardless of input size and a slow writer throttles fetching.
+    When fetching or parsing fails the error is logged and carried on the result.
+    """
+    if fetch_workers < 1 or parse_workers < 1 or queue_size < 1:
+        raise ValueError("fetch_workers, parse_workers and queue_size must be at least 1")
+    if remember is not None and reuse is None:
+        raise ValueError("remember requires reuse, which provides the page key")
+
+    window = threading.Semaphore(queue_size)
+    stop = threading.Event()
+    url_queue: "queue.Queue[object]" = queue.Queue(maxsize=queue_size)
+    html_queue: "queue.Queue[object]" = queue.Queue(maxsize=queue_size)
+    result_queue: "queue.Queue[object]" = queue.Queue()
+
+    def put(target: "queue.Queue[object]", item: object) -> bool:
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(source: "queue.Queue[object]") -> object:
+        while not stop.is_set():
+            try:
+                return source.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def feeder() -> None:
+        try:
+            for index, url in enumerate(urls):
+                while not window.acquire(timeout=_POLL_SECONDS):
+                    if stop.is_set():
+                        return
+                if not put(url_queue, (index, url)):
+                    return
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.exception("Failed to read pipeline input: %s", exc)
+        finally:
+            for _ in range(fetch_workers):
+                put(url_queue, _DONE)
+
+    def fetcher() -> None:
+        while True:
+            item = get(url_queue)
+            if item is _DONE:
+                put(html_queue, _DONE)
+                return
+            index, url = item  # type: ignore[misc]
+            error: Optional[BaseException] = None
+            try:
+                page: Any = fetch(url)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.exception("Failed to process %s: %s", url, exc)
+                page, error = None, exc
+            if not put(html_queue, (index, url, page, error)):
+                return
+
+    def dispatcher(pool: ProcessPoolExecutor) -> None:
+        finished_fetchers = 0
+        outstanding = 0
+        settled = threading.Condition()
+
+        def on_parsed(index: int, url: str, key: Any, future: Future) -> None:
+            nonlocal outstanding
+            try:
+                record = future.result()
+                if remember is not None:
+                    remember(url, key, record)
+                result = UrlResult(url, record)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.error("Failed to process %s: %s", url, exc, exc_info=exc)
+                result = UrlResult(url, None, exc)
+            result_queue.put((index, result))
+            with settled:
+                outstanding -= 1
+                settled.notify_all()
+
+        while finished_fetchers < fetch_workers:
+            item = get(html_queue)
+            if item is _DONE:
+                if stop.is_set():
+                    return
+                finished_fetchers += 1
+                continue
+            index, url, page, error = item  # type: ignore[misc]
+            if page is None:
+                result_queue.put((index, UrlResult(url, None, error)))
+                continue
+            try:
+                previous, key = reuse(url, page) if reuse is not None else (None, None)
+                if previous is not None:
+                    result_queue.put((index, UrlResult(url, previous)))
+                    continue
+                future = pool.submit(parse, _page_text(page), url)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.error("Failed to process %s: %s", url, exc, exc_info=exc)
+                result_queue.put((index, UrlResult(url, None, exc)))
+                continue
+            with settled:
+                outstanding += 1
+            future.add_done_callback(
+                lambda done, index=index, url=url, key=key: on_parsed(index, url, key, done)
+            )
+
+        with settled:
+            settled.wait_for(lambda: outstanding == 0)
+        result_queue.put(_DONE)
+
+    with ProcessPoolExecutor(max_workers=parse_workers) as pool:
+        threads = [threading.Thread(target=feeder, name="pipeline-feeder", daemon=True)]
+        threads += [
+            threading.Thread(target=fetcher, name=f"pipeline-fetch-{i}", daemon=True)
+            for i in range(fetch_workers)
+        ]
+        threads.append(
+            threading.Thread(target=dispatcher, args=(pool,), name="pipeline-dispatch", daemon=True)
+        )
+        for thread in threads:
+            thread.start()
+
+        buffered: Dict[int, UrlResult] = {}
+        next_index = 0
+        try:
+            while True:
+                item = result_queue.get()
+                if item is _DONE:
+                    break
+                index, result = item  # type: ignore[misc]
+                buffered[index] = result
+                while next_index in buffered:
+                    yield buffered.pop(next_index)
+                    next_index += 1
+                    window.release()
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
\ No newline at end of file
@@ -1,23 +1,75 @@
 import argparse
+import functools
+import itertools
 import json
 import logging
+import os
+import socket
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
+from dataclasses import dataclass
+from http.server import ThreadingHTTPServer
 from pathlib import Path
-from typing import List
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-from src.clients.pitchbook_client import PitchBookClient
-from src.extractors.company_profile_parser import parse_company_profile
-from src.extractors.investments_parser import parse_investments
-from src.extractors.competitors_parser import parse_competitors
-from src.extractors.faq_parser import parse_faq
+from src.clients.pitchbook_client import PitchBookClient, canonical_company_id
+from src.extractors.company_profile_parser import parse_company_profile_page
+from src.extractors.investments_parser import parse_investments_page
+from src.extractors.competitors_parser import parse_competitors_page
+from src.extractors.faq_parser import parse_faq_page
+from src.extractors.parsed_page import (
+    DEFAULT_PARSER_BACKEND,
+    PARSER_BACKENDS,
+    ParsedPage,
+    check_parser_backend,
+)
 from src.models.company_profile import CompanyProfile
-from src.outputs.exporters import write_pretty_json, write_jsonl
-from src.outputs.schema_validator import validate_records
+from src.outputs.columnar import ColumnarSink
+from src.outputs.exporters import (
+    DEFAULT_JSON_BACKEND,
+    JSON_BACKENDS,
+    JsonlSink,
+    PrettyJsonSink,
+    RecordWriter,
+    check_json_backend,
+    read_jsonl,
+    write_pretty_json,
+)
+from src.outputs.journal import RunJournal
+from src.outputs.schema_validator import validate_record
+from src.outputs.sqlite_sink import SqliteSink
+from src.pipeline import UrlResult, run_pipeline
+from src.utils.cache import ResponseCache
+from src.utils.dedupe import SeenSet
+from src.utils.fingerprints import FingerprintStore
 from src.utils.http import HttpClient
+from src.utils.inputs import load_inputs, parse_shard, shard_of
+from src.utils.job_queue import STATUS_PENDING, JobQueue
 from src.utils.logging_utils import setup_logging
-from src.utils.rate_limiter import RateLimiter
+from src.utils.metrics import METRICS, RECORDS, RUN_SECONDS, STAGE_SECONDS, log_summary
+from src.utils.profiling import StageProfiler
+from src.utils.rate_limiter import AdaptiveRateLimiter, RateLimiter
+from src.utils.retry import DEFAULT_RETRY_STATUSES, PermanentHttpError, RetryPolicy
+from src.utils.statuses import STATUS_DONE, STATUS_FAILED, STATUS_PERMANENT
 
 LOGGER = logging.getLogger(__name__)
 
+# How often an idle queue worker checks for new or expired jobs.
+_QUEUE_POLL_SECONDS = 1.0
+
 def load_settings(config_path: Path) -> dict:
     if not config_path.exists():
         LOGGER.warning("Settings file %s not found, using defaults.", config_path)
@@ -27,24 +79,99 @@ def load_settings(config_path: Path) -> dict:
             "request_timeout": 15,
             "rate_limit_per_minute": 30,
             "output_dir": "data",
+            "html_parser": DEFAULT_PARSER_BACKEND,
+            "workers": 1,
+            "parse_processes": 0,
+            "queue_size": 64,
         }
     with config_path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
-def load_inputs(input_path: Path) -> List[str]:
-    if not input_path.exists():
-        LOGGER.warning("Input file %s does not exist. No URLs to process.", input_path)
-        return []
-    urls: List[str] = []
-    with input_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                urls.append(line)
-    return urls
+@dataclass
+class InputStats:
+    total: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    other_shards: int = 0
+    already_done: int = 0
+    scheduled: int = 0
+
+def canonicalize_inputs(
+    values: Iterable[str],
+    to_url: Callable[[str], str],
+    seen: SeenSet,
+    stats: InputStats,
+    *,
+    shard: Optional[Tuple[int, int]] = None,
+) -> Iterator[str]:
+    """
+    Map inputs to canonical profile URLs, dropping duplicates and invalid lines.
+
+    Inputs are keyed by company ID, so an ID and every URL variant of the same
+    profile are fetched once. With ``shard=(i, N)`` only IDs hashing to shard
+    ``i`` are kept, so N machines can split one input without coordinating.
+    ``stats`` is updated as the inputs are consumed.
+    """
+    for value in values:
+        stats.total += 1
+        company_id = canonical_company_id(value)
+        if company_id is None:
+            stats.invalid += 1
+            LOGGER.warning("Skipping input %r: not a company ID or profile URL", value)
+            continue
+        if shard is not None and shard_of(company_id, shard[1]) != shard[0]:
+            stats.other_shards += 1
+            continue
+        if not seen.add(company_id):
+            stats.duplicates += 1
+            continue
+        stats.scheduled += 1
+        yield to_url(company_id)
+
+def _skip_done(urls: Iterable[str], journal: RunJournal, stats: InputStats) -> Iterator[str]:
+    for url in urls:
+        if journal.is_done(url):
+            stats.already_done += 1
+            stats.scheduled -= 1
+            continue
+        yield url
+
+def build_cache(settings: dict) -> Optional[ResponseCache]:
+    cache_path = settings.get("cache_path")
+    if not cache_path:
+        return None
+    max_mb = settings.get("cache_max_mb", 512)
+    return ResponseCache(
+        Path(cache_path),
+        ttl_seconds=settings.get("cache_ttl_seconds", 7 * 24 * 3600),
+        max_bytes=int(max_mb * 1024 * 1024),
+    )
+
+def build_retry_policy(settings: dict) -> RetryPolicy:
+    return RetryPolicy(
+        max_attempts=settings.get("max_retries", 3),
+        backoff_factor=settings.get("retry_backoff_factor", 0.5),
+        max_backoff=settings.get("retry_max_backoff", 30.0),
+        deadline=settings.get("retry_deadline_seconds", 120.0),
+        retry_statuses=frozenset(settings.get("retry_statuses", DEFAULT_RETRY_STATUSES)),
+    )
 
 def build_client(settings: dict) -> PitchBookClient:
-    rate_limiter = RateLimiter(max_per_minute=settings.get("rate_limit_per_minute", 30))
+    rate_limiter: RateLimiter
+    if settings.get("rate_limit_adaptive", False):
+        rate_limiter = AdaptiveRateLimiter(
+            max_per_minute=settings.get("rate_limit_per_minute", 30),
+            burst=settings.get("rate_limit_burst", 1),
+            per_host=settings.get("rate_limit_per_host", False),
+            floor_per_minute=settings.get("rate_limit_floor_per_minute", 5),
+            ceiling_per_minute=settings.get("rate_limit_ceiling_per_minute", 120),
+        )
+    else:
+        rate_limiter = RateLimiter(
+            max_per_minute=settings.get("rate_limit_per_minute", 30),
+            burst=settings.get("rate_limit_burst", 1),
+            per_host=settings.get("rate_limit_per_host", False),
+        )
     http_client = HttpClient(
         base_url=settings.get("base_url", "https://pitchbook.com"),
         user_agent=settings.get(
@@ -53,101 +180,1089 @@ def build_client(settings: dict) -> PitchBookClient:
         ),
         timeout=settings.get("request_timeout", 15),
         rate_limiter=rate_limiter,
+        cache=build_cache(settings),
+        retry_policy=build_retry_policy(settings),
+        offline=settings.get("offline", False),
+        pool_size=settings.get("pool_size") or max(10, settings.get("workers", 1)),
+        max_body_bytes=int(settings.get("max_body_mb", 10) * 1024 * 1024),
     )
     return PitchBookClient(http_client=http_client)
 
-def process_url(client: PitchBookClient, url: str) -> dict:
-    LOGGER.info("Processing %s", url)
-    html = client.fetch_company_profile(url)
-    basics = parse_company_profile(html, url)
-    investments_summary, all_investments, investors = parse_investments(html)
-    competitors = parse_competitors(html)
-    faq = parse_faq(html)
-
-    profile = CompanyProfile.from_parsed_parts(
-        basics=basics,
-        investments_summary=investments_summary,
-        competitors=competitors,
-        all_investments=all_investments,
-        faq=faq,
-        investors=investors,
-    )
-    record = profile.to_dict()
+def build_record(
+    html: str,
+    url: str,
+    *,
+    parser_backend: str = DEFAULT_PARSER_BACKEND,
+) -> dict:
+    """
+    Run the extractor chain over one page and build its output record.
+
+    Kept free of client state so it can run in a process pool.
+    """
+    with STAGE_SECONDS.time(stage="parse"):
+        page = ParsedPage.from_html(html, parser_backend)
+    with STAGE_SECONDS.time(stage="company_profile"):
+        basics = parse_company_profile_page(page, url)
+    with STAGE_SECONDS.time(stage="investments"):
+        investments_summary, all_investments, investors = parse_investments_page(page)
+    with STAGE_SECONDS.time(stage="competitors"):
+        competitors = parse_competitors_page(page)
+    with STAGE_SECONDS.time(stage="faq"):
+        faq = parse_faq_page(page)
+
+    with STAGE_SECONDS.time(stage="build_record"):
+        profile = CompanyProfile.from_parsed_parts(
+            basics=basics,
+            investments_summary=investments_summary,
+            competitors=competitors,
+            all_investments=all_investments,
+            faq=faq,
+            investors=investors,
+        )
+        record = profile.to_dict()
     LOGGER.debug("Built record for %s: %s", url, record)
     return record
 
-def run(input_path: Path, output_path: Path, config_path: Path) -> None:
-    setup_logging()
-    LOGGER.info("Loading settings from %s", config_path)
-    settings = load_settings(config_path)
+def _stage(profiler: Optional[StageProfiler], name: str, url: str) -> ContextManager[None]:
+    return profiler.stage(name, url) if profiler is not None else nullcontext()
 
-    client = build_client(settings)
-    urls = load_inputs(input_path)
+# The response URL (the cache key) and the page hash, if fingerprinting.
+PageKey = Tuple[str, Optional[str]]
+
+class _RecordReuse:
+    """
+    Records built before, reused instead of parsing a page again: after a
+    304 from the response cache, or when the page fingerprint is unchanged.
+
+    ``reuse`` and ``remember`` serve both ``process_url`` and the hooks of
+    ``run_pipeline``.
+    """
+
+    def __init__(
+        self, cache: Optional[ResponseCache], fingerprints: Optional[FingerprintStore]
+    ) -> None:
+        self.cache = cache
+        self.fingerprints = fingerprints
+
+    def reuse(self, url: str, response: Any) -> Tuple[Optional[dict], PageKey]:
+        if self.cache is not None and getattr(response, "not_modified", False):
+            previous = self.cache.get_record(response.url)
+            if previous is not None and previous.get("url") == url:
+                LOGGER.debug("%s not modified; reusing previous record", url)
+                return previous, (response.url, None)
+
+        page_hash = None
+        if self.fingerprints is not None:
+            previous, page_hash = self.fingerprints.reuse(url, response.text)
+            if previous is not None:
+                LOGGER.debug("%s content unchanged; reusing previous record", url)
+                return previous, (response.url, page_hash)
+        return None, (response.url, page_hash)
+
+    def remember(self, url: str, key: PageKey, record: dict) -> None:
+        response_url, page_hash = key
+        if self.cache is not None:
+            self.cache.put_record(response_url, record)
+        if self.fingerprints is not None and page_hash is not None:
+            self.fingerprints.remember(url, page_hash, record)
 
-    if not urls:
-        LOGGER.warning("No URLs provided in %s. Nothing to do.", input_path)
+def process_url(
+    client: PitchBookClient,
+    url: str,
+    *,
+    parser_backend: str = DEFAULT_PARSER_BACKEND,
+    fingerprints: Optional[FingerprintStore] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> dict:
+    LOGGER.info("Processing %s", url)
+    if profiler is not None:
+        profiler.sample(url)
+    # The fetch is not profiled: profiled sections run one at a time, so it
+    # would serialize network waits across workers. Its latency is in the metrics.
+    response = client.fetch_profile_response(url)
+    records = _RecordReuse(client.http_client.cache, fingerprints)
+    previous, key = records.reuse(url, response)
+    if previous is not None:
+        return previous
+
+    with _stage(profiler, "parse", url):
+        record = build_record(response.text, url, parser_backend=parser_backend)
+    records.remember(url, key, record)
+    return record
+
+def _process_url_safely(
+    client: PitchBookClient,
+    url: str,
+    *,
+    parser_backend: str,
+    fingerprints: Optional[FingerprintStore] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> UrlResult:
+    try:
+        record = process_url(
+            client,
+            url,
+            parser_backend=parser_backend,
+            fingerprints=fingerprints,
+            profiler=profiler,
+        )
+        return UrlResult(url, record)
+    except PermanentHttpError as exc:
+        LOGGER.error("Failed to process %s: %s (permanent, not retried)", url, exc)
+        return UrlResult(url, None, exc)
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.exception("Failed to process %s: %s", url, exc)
+        return UrlResult(url, None, exc)
+
+def iter_processed(
+    client: PitchBookClient,
+    urls: Iterable[str],
+    *,
+    workers: int = 1,
+    parser_backend: str = DEFAULT_PARSER_BACKEND,
+    fingerprints: Optional[FingerprintStore] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> Iterator[UrlResult]:
+    """
+    Yield a UrlResult per URL in input order; failures carry their error.
+
+    With more than one worker, ``process_url`` runs in a thread pool sharing
+    ``client`` (and therefore its rate limiter). At most ``2 * workers`` URLs
+    are in flight, so results are released in order without buffering the
+    whole input.
+    """
+    if workers <= 1:
+        for url in urls:
+            yield _process_url_safely(
+                client,
+                url,
+                parser_backend=parser_backend,
+                fingerprints=fingerprints,
+                profiler=profiler,
+            )
         return
 
-    records: List[dict] = []
-    for url in urls:
-        try:
-            record = process_url(client, url)
-            records.append(record)
-        except Exception as exc:  # noqa: BLE001
-            LOGGER.exception("Failed to process %s: %s", url, exc)
-
-    errors = validate_records(records)
-    if errors:
-        LOGGER.warning("Schema validation completed with %d error(s).", len(errors))
+    max_in_flight = workers * 2
+    pending: Deque["Future[UrlResult]"] = deque()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper") as pool:
+        for url in urls:
+            pending.append(
+                pool.submit(
+                    _process_url_safely,
+                    client,
+                    url,
+                    parser_backend=parser_backend,
+                    fingerprints=fingerprints,
+                    profiler=profiler,
+                )
+            )
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _log_input_stats(input_stats: InputStats, input_path: Path) -> None:
+    LOGGER.info(
+        "Read %d inputs from %s: %d scheduled, %d duplicates removed, %d invalid skipped, "
+        "%d in other shards, %d already done",
+        input_stats.total,
+        input_path,
+        input_stats.scheduled,
+        input_stats.duplicates,
+        input_stats.invalid,
+        input_stats.other_shards,
+        input_stats.already_done,
+    )
+
+def _finish_metrics(
+    started: float, metrics_file: Optional[Path], metrics_server: Optional[ThreadingHTTPServer]
+) -> None:
+    """
+    Count the run's duration, write the metrics file and stop the metrics server.
+    """
+    RUN_SECONDS.inc(time.perf_counter() - started)
+    if metrics_file is not None:
+        METRICS.write_prometheus(metrics_file)
+        LOGGER.info("Wrote Prometheus metrics to %s", metrics_file)
+    if metrics_server is not None:
+        metrics_server.shutdown()
+        metrics_server.server_close()
+
+def _finish_profile(profiler: StageProfiler) -> None:
+    profiler.write()
+    LOGGER.info(
+        "Wrote profiles of %d URL(s) to %s (report.txt and one .prof per stage)",
+        profiler.profiled,
+        profiler.directory,
+    )
+
+@dataclass
+class _RunSinks:
+    """
+    The outputs of one run. Every valid record goes to ``writer`` (the JSONL
+    file and, on fresh runs, the pretty JSON array) and each optional sink.
+    """
+
+    jsonl: JsonlSink
+    writer: RecordWriter
+    quarantine: Optional[JsonlSink] = None
+    columnar: Optional[ColumnarSink] = None
+    sqlite: Optional[SqliteSink] = None
+    changes: Optional[JsonlSink] = None
+
+@dataclass
+class _RunCounts:
+    validation_errors: int = 0
+    failed: int = 0
+    permanent: int = 0
+    quarantined: int = 0
+
+def _open_sinks(
+    stack: ExitStack,
+    output_path: Path,
+    settings: dict,
+    *,
+    resume: bool,
+    json_backend: str,
+    quarantine: bool,
+    columnar_dir: Optional[Path],
+    sqlite_path: Optional[Path],
+    changes_path: Optional[Path],
+) -> _RunSinks:
+    """
+    Open the run's sinks on ``stack``, appending to the previous run's files on resume.
+    """
+    jsonl_sink = stack.enter_context(
+        JsonlSink(output_path.with_suffix(".jsonl"), append=resume, json_backend=json_backend)
+    )
+    file_sinks = [jsonl_sink]
+    if not resume:
+        file_sinks.append(
+            stack.enter_context(PrettyJsonSink(output_path, json_backend=json_backend))
+        )
+    # Each record is serialized once and the bytes go to every file sink.
+    sinks = _RunSinks(jsonl_sink, RecordWriter(file_sinks, json_backend=json_backend))
+    if quarantine:
+        sinks.quarantine = stack.enter_context(
+            JsonlSink(
+                output_path.with_suffix(".quarantine.jsonl"),
+                append=resume,
+                json_backend=json_backend,
+            )
+        )
+    if columnar_dir is not None:
+        sinks.columnar = stack.enter_context(
+            ColumnarSink(
+                columnar_dir,
+                fmt=settings.get("columnar_format", "auto"),
+                batch_rows=settings.get("columnar_batch_rows", 10_000),
+                resume=resume,
+            )
+        )
+    if sqlite_path is not None:
+        sinks.sqlite = stack.enter_context(
+            SqliteSink(sqlite_path, batch_size=settings.get("sqlite_batch_size", 500))
+        )
+    if changes_path is not None:
+        sinks.changes = stack.enter_context(
+            JsonlSink(changes_path, append=resume, json_backend=json_backend)
+        )
+    return sinks
+
+def _write_results(
+    results: Iterable[UrlResult],
+    sinks: _RunSinks,
+    journal: RunJournal,
+    fingerprints: Optional[FingerprintStore],
+    profiler: Optional[StageProfiler],
+) -> _RunCounts:
+    """
+    Validate and write each record as it arrives and journal every URL.
+
+    Memory does not grow with the input and a crash keeps everything already
+    in the JSONL file. The journal entry follows the JSONL write, so a crash
+    in between can only repeat a record, never lose one.
+    """
+    counts = _RunCounts()
+    for url, record, error in results:
+        if record is None:
+            if isinstance(error, PermanentHttpError):
+                RECORDS.inc(outcome="permanent")
+                counts.permanent += 1
+                journal.record(url, STATUS_PERMANENT, error=str(error))
+            else:
+                RECORDS.inc(outcome="failed")
+                counts.failed += 1
+                journal.record(url, STATUS_FAILED, error=str(error) if error else None)
+            if profiler is not None:
+                profiler.finish(url)
+            continue
+        with _stage(profiler, "validate", url):
+            errors = validate_record(record, sinks.jsonl.count)
         for err in errors:
             LOGGER.warning("Validation error: %s", err)
+        counts.validation_errors += len(errors)
+        if errors and sinks.quarantine is not None:
+            sinks.quarantine.write({"url": url, "errors": errors, "record": record})
+            counts.quarantined += 1
+            RECORDS.inc(outcome="quarantined")
+        else:
+            RECORDS.inc(outcome="written")
+            with _stage(profiler, "export", url):
+                encoded = sinks.writer.write(record)
+                if (
+                    fingerprints is not None
+                    and fingerprints.record_changed(url, record)
+                    and sinks.changes is not None
+                ):
+                    sinks.changes.write_encoded(encoded)
+                if sinks.columnar is not None:
+                    sinks.columnar.write(record)
+                if sinks.sqlite is not None:
+                    sinks.sqlite.write(record)
+        journal.record(url, STATUS_DONE)
+        if profiler is not None:
+            profiler.finish(url)
+    return counts
+
+def _log_output_summary(
+    sinks: _RunSinks, counts: _RunCounts, fingerprints: Optional[FingerprintStore]
+) -> None:
+    if sinks.columnar is not None:
+        LOGGER.info(
+            "Wrote %s tables to %s: %s",
+            sinks.columnar.fmt,
+            sinks.columnar.directory,
+            ", ".join(f"{name}={rows}" for name, rows in sinks.columnar.row_counts().items()),
+        )
+
+    if sinks.sqlite is not None:
+        LOGGER.info(
+            "Upserted %d records into %s as run %d (%d new or changed)",
+            sinks.sqlite.count,
+            sinks.sqlite.path,
+            sinks.sqlite.run_id,
+            sinks.sqlite.changed,
+        )
+
+    if fingerprints is not None:
+        stats = fingerprints.stats()
+        LOGGER.info(
+            "Fingerprints: %d unchanged pages reused, %d parsed; %d records new or changed, "
+            "%d unchanged",
+            stats["reused"],
+            stats["parsed"],
+            stats["changed"],
+            stats["unchanged"],
+        )
+        if sinks.changes is not None:
+            LOGGER.info(
+                "Wrote %d new or changed records to %s", sinks.changes.count, sinks.changes.path
+            )
+
+    if sinks.quarantine is not None and counts.quarantined:
+        LOGGER.warning(
+            "Schema validation found %d error(s); %d invalid record(s) quarantined in %s",
+            counts.validation_errors,
+            counts.quarantined,
+            sinks.quarantine.path,
+        )
+    elif counts.validation_errors:
+        LOGGER.warning("Schema validation completed with %d error(s).", counts.validation_errors)
     else:
-        LOGGER.info("All %d records validated successfully.", len(records))
+        LOGGER.info("All %d records validated successfully.", sinks.jsonl.count)
+
+def _log_client_summary(client: PitchBookClient) -> None:
+    rate_limiter = client.http_client.rate_limiter
+    if isinstance(rate_limiter, AdaptiveRateLimiter):
+        LOGGER.info(
+            "Adaptive rate limiter finished at %.1f requests per minute",
+            rate_limiter.current_per_minute,
+        )
+
+    pool = client.http_client.pool_stats()
+    LOGGER.info(
+        "Connection pools: %d requests over %d connections (%d reused)",
+        pool["requests"],
+        pool["connections"],
+        pool["reused"],
+    )
+
+    cache = client.http_client.cache
+    if cache is not None:
+        stats = cache.stats()
+        LOGGER.info(
+            "Response cache: %d hits, %d misses, %d evictions, %d entries (%.1f MiB)",
+            stats["hits"],
+            stats["misses"],
+            stats["evictions"],
+            stats["entries"],
+            stats["bytes"] / (1024 * 1024),
+        )
+
+def run(
+    input_path: Path,
+    output_path: Path,
+    config_path: Path,
+    *,
+    parser_backend: Optional[str] = None,
+    workers: Optional[int] = None,
+    parse_processes: Optional[int] = None,
+    queue_size: Optional[int] = None,
+    resume: bool = False,
+    cache_path: Optional[Path] = None,
+    offline: bool = False,
+    shard: Optional[Tuple[int, int]] = None,
+    id_column: Optional[str] = None,
+    quarantine: Optional[bool] = None,
+    json_backend: Optional[str] = None,
+    columnar_dir: Optional[Path] = None,
+    sqlite_path: Optional[Path] = None,
+    fingerprints_path: Optional[Path] = None,
+    changes_path: Optional[Path] = None,
+    metrics_file: Optional[Path] = None,
+    metrics_port: Optional[int] = None,
+    profile: bool = False,
+    profile_every: Optional[int] = None,
+) -> None:
+    setup_logging()
+    started = time.perf_counter()
+    LOGGER.info("Loading settings from %s", config_path)
+    settings = load_settings(config_path)
+
+    parser_backend = parser_backend or settings.get("html_parser", DEFAULT_PARSER_BACKEND)
+    check_parser_backend(parser_backend)
+    LOGGER.info("Using %s HTML parser backend", parser_backend)
+
+    if workers is None:
+        workers = settings.get("workers", 1)
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if parse_processes is None:
+        parse_processes = settings.get("parse_processes", 0)
+    if queue_size is None:
+        queue_size = settings.get("queue_size", 64)
+    if profile_every is None:
+        profile_every = settings.get("profile_every", 1)
+    if quarantine is None:
+        quarantine = settings.get("quarantine_invalid_records", False)
+    json_backend = json_backend or settings.get("json_backend", DEFAULT_JSON_BACKEND)
+    check_json_backend(json_backend)
+    if columnar_dir is None and settings.get("columnar_dir"):
+        columnar_dir = Path(settings["columnar_dir"])
+    if sqlite_path is None and settings.get("sqlite_path"):
+        sqlite_path = Path(settings["sqlite_path"])
+    if fingerprints_path is None and settings.get("fingerprints_path"):
+        fingerprints_path = Path(settings["fingerprints_path"])
+    if changes_path is None and settings.get("changes_feed_path"):
+        changes_path = Path(settings["changes_feed_path"])
+    if metrics_file is None and settings.get("metrics_file"):
+        metrics_file = Path(settings["metrics_file"])
+    if metrics_port is None:
+        metrics_port = settings.get("metrics_port")
+    if profile and parse_processes > 0:
+        # Pages parsed in the process pool cannot be profiled from here.
+        LOGGER.warning(
+            "--profile parses pages in the fetch threads instead of %d processes", parse_processes
+        )
+        parse_processes = 0
+    if changes_path is not None and fingerprints_path is None:
+        raise ValueError(
+            "A changes-only feed requires a fingerprint store (--fingerprints or fingerprints_path)"
+        )
+
+    # The connection pool is sized from the effective fetch worker count.
+    settings["workers"] = workers
+    if cache_path is not None:
+        settings["cache_path"] = str(cache_path)
+    if offline:
+        if not settings.get("cache_path"):
+            raise ValueError("--offline requires a response cache (--cache or cache_path)")
+        settings["offline"] = True
 
+    # Everything opened below is closed on the way out, even when the run fails.
+    with ExitStack() as cleanup:
+        # Metrics are process-wide; start every run from zero.
+        METRICS.reset()
+        metrics_server = METRICS.serve(metrics_port) if metrics_port is not None else None
+        # Registered first so it runs last, after the other resources are closed.
+        cleanup.callback(_finish_metrics, started, metrics_file, metrics_server)
+
+        client = build_client(settings)
+        cache = client.http_client.cache
+        if cache is not None:
+            cleanup.callback(cache.close)
+        if shard is not None:
+            LOGGER.info("Processing shard %d of %d (0-based)", shard[0], shard[1])
+
+        # Inputs are streamed straight into the workers: nothing below holds the
+        # whole input, so startup time and memory do not depend on its size.
+        input_stats = InputStats()
+        seen = cleanup.enter_context(
+            SeenSet(max_memory_items=settings.get("dedupe_memory_items", 1_000_000))
+        )
+        urls = canonicalize_inputs(
+            load_inputs(input_path, id_column=id_column or settings.get("input_id_column")),
+            client.profile_url,
+            seen,
+            input_stats,
+            shard=shard,
+        )
+        # Look at the first URL before anything is opened for writing: a fresh
+        # run truncates the journal and the outputs of the previous one.
+        first = next(urls, None)
+        if first is None:
+            _log_input_stats(input_stats, input_path)
+            LOGGER.warning("No URLs to process in %s. Nothing to do.", input_path)
+            return
+        urls = itertools.chain([first], urls)
+
+        # Page and record hashes from earlier runs: unchanged pages skip the
+        # extractors and unchanged records stay out of the changes-only feed.
+        fingerprints = (
+            cleanup.enter_context(FingerprintStore(fingerprints_path, salt=parser_backend))
+            if fingerprints_path is not None
+            else None
+        )
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        profiler = (
+            StageProfiler(
+                output_path.with_suffix(".profile"),
+                every=profile_every,
+                top=settings.get("profile_top", 30),
+            )
+            if profile
+            else None
+        )
+        if profiler is not None:
+            LOGGER.info("Profiling every %d URL(s) into %s", profiler.every, profiler.directory)
+            cleanup.callback(_finish_profile, profiler)
+        jsonl_path = output_path.with_suffix(".jsonl")
+        journal_path = output_path.with_suffix(".journal")
+
+        with RunJournal(journal_path, resume=resume) as journal:
+            if resume:
+                LOGGER.info("Resuming from %s: skipping URLs already done", journal_path)
+                urls = _skip_done(urls, journal, input_stats)
+
+            results: Iterator[UrlResult]
+            if parse_processes > 0:
+                LOGGER.info(
+                    "Processing %s with %d fetch threads, %d parse processes and queue size %d",
+                    input_path,
+                    workers,
+                    parse_processes,
+                    queue_size,
+                )
+                records = _RecordReuse(cache, fingerprints)
+                results = run_pipeline(
+                    urls,
+                    client.fetch_profile_response,
+                    functools.partial(build_record, parser_backend=parser_backend),
+                    fetch_workers=workers,
+                    parse_workers=parse_processes,
+                    queue_size=queue_size,
+                    reuse=records.reuse,
+                    remember=records.remember,
+                )
+            else:
+                if workers > 1:
+                    LOGGER.info("Processing %s with %d workers", input_path, workers)
+                results = iter_processed(
+                    client,
+                    urls,
+                    workers=workers,
+                    parser_backend=parser_backend,
+                    fingerprints=fingerprints,
+                    profiler=profiler,
+                )
+
+            with ExitStack() as stack:
+                sinks = _open_sinks(
+                    stack,
+                    output_path,
+                    settings,
+                    resume=resume,
+                    json_backend=json_backend,
+                    quarantine=quarantine,
+                    columnar_dir=columnar_dir,
+                    sqlite_path=sqlite_path,
+                    changes_path=changes_path,
+                )
+                counts = _write_results(results, sinks, journal, fingerprints, profiler)
+
+        _log_input_stats(input_stats, input_path)
+
+        if resume:
+            # A JSON array cannot be appended to, so rebuild it from the JSONL file.
+            write_pretty_json(read_jsonl(jsonl_path), output_path, json_backend=json_backend)
+
+        _log_output_summary(sinks, counts, fingerprints)
+        _log_client_summary(client)
+        log_summary(time.perf_counter() - started)
+        if parse_processes > 0:
+            LOGGER.info("Parse and extractor timings are kept by the parse processes (not shown)")
+        LOGGER.info(
+            "Finished. Wrote %d records to %s and %s; %d failed, %d permanently (not retried)",
+            sinks.jsonl.count,
+            output_path,
+            jsonl_path,
+            counts.failed,
+            counts.permanent,
+        )
+
+def seed_queue(
+    input_path: Path,
+    queue_path: Path,
+    config_path: Path,
+    *,
+    shard: Optional[Tuple[int, int]] = None,
+    id_column: Optional[str] = None,
+) -> int:
+    """
+    Canonicalise and de-duplicate ``input_path`` into the job queue at ``queue_path``.
+
+    Returns the number of new jobs; seeding the same input twice adds nothing.
+    """
+    setup_logging()
+    settings = load_settings(config_path)
+    client = build_client(settings)
+    input_stats = InputStats()
+    with SeenSet(
+        max_memory_items=settings.get("dedupe_memory_items", 1_000_000)
+    ) as seen, JobQueue(queue_path) as queue:
+        added = queue.seed(
+            canonicalize_inputs(
+                load_inputs(input_path, id_column=id_column or settings.get("input_id_column")),
+                client.profile_url,
+                seen,
+                input_stats,
+                shard=shard,
+            )
+        )
+        counts = queue.counts()
+    LOGGER.info(
+        "Seeded %d new jobs into %s from %d inputs (%d duplicates, %d invalid); "
+        "%d pending in total",
+        added,
+        queue_path,
+        input_stats.total,
+        input_stats.duplicates,
+        input_stats.invalid,
+        counts[STATUS_PENDING],
+    )
+    return added
+
+def work_queue(
+    queue_path: Path,
+    output_path: Path,
+    config_path: Path,
+    *,
+    worker_id: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    lease_seconds: Optional[float] = None,
+    parser_backend: Optional[str] = None,
+    workers: Optional[int] = None,
+    cache_path: Optional[Path] = None,
+    offline: bool = False,
+    json_backend: Optional[str] = None,
+) -> dict:
+    """
+    Claim batches from the job queue and process them until no job is left.
+
+    Each worker appends to its own ``<output stem>.<worker id>.jsonl`` file.
+    Delivery is at-least-once: if a lease expires mid-batch, the job can be
+    processed again by another worker. While other workers still hold leases
+    this worker keeps polling, so jobs of a crashed worker are picked up once
+    their lease expires. Returns the queue's final status counts.
+    """
+    setup_logging()
+    settings = load_settings(config_path)
+    parser_backend = parser_backend or settings.get("html_parser", DEFAULT_PARSER_BACKEND)
+    check_parser_backend(parser_backend)
+    if workers is None:
+        workers = settings.get("workers", 1)
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if batch_size is None:
+        batch_size = settings.get("queue_batch_size", 20)
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    if lease_seconds is None:
+        lease_seconds = settings.get("queue_lease_seconds", 600)
+    json_backend = json_backend or settings.get("json_backend", DEFAULT_JSON_BACKEND)
+    check_json_backend(json_backend)
+    settings["workers"] = workers
+    if cache_path is not None:
+        settings["cache_path"] = str(cache_path)
+    if offline:
+        if not settings.get("cache_path"):
+            raise ValueError("--offline requires a response cache (--cache or cache_path)")
+        settings["offline"] = True
+
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    write_pretty_json(records, output_path)
-    jsonl_path = output_path.with_suffix(".jsonl")
-    write_jsonl(records, jsonl_path)
+    jsonl_path = output_path.with_name(f"{output_path.stem}.{worker_id}.jsonl")
+    client = build_client(settings)
+    done = failed = 0
+
+    with ExitStack() as cleanup:
+        cache = client.http_client.cache
+        if cache is not None:
+            cleanup.callback(cache.close)
+        queue = cleanup.enter_context(
+            JobQueue(
+                queue_path,
+                lease_seconds=lease_seconds,
+                max_attempts=settings.get("queue_max_attempts", 3),
+            )
+        )
+        sink = cleanup.enter_context(JsonlSink(jsonl_path, append=True, json_backend=json_backend))
+        LOGGER.info("Worker %s processing jobs from %s into %s", worker_id, queue_path, jsonl_path)
+        while True:
+            urls = queue.claim(worker_id, batch_size)
+            if not urls:
+                if not queue.has_unfinished():
+                    break
+                time.sleep(_QUEUE_POLL_SECONDS)
+                continue
+            for url, record, error in iter_processed(
+                client, urls, workers=workers, parser_backend=parser_backend
+            ):
+                if record is None:
+                    failed += 1
+                    queue.fail(
+                        url,
+                        worker_id,
+                        str(error),
+                        permanent=isinstance(error, PermanentHttpError),
+                    )
+                    continue
+                for err in validate_record(record, sink.count):
+                    LOGGER.warning("Validation error: %s", err)
+                sink.write(record)
+                done += 1
+                queue.complete(url, worker_id)
+        counts = queue.counts()
 
     LOGGER.info(
-        "Finished. Wrote %d records to %s and %s",
-        len(records),
-        output_path,
-        jsonl_path,
+        "Worker %s finished: %d done, %d failed attempts. Queue: %d done, %d failed, "
+        "%d permanent, %d retries",
+        worker_id,
+        done,
+        failed,
+        counts[STATUS_DONE],
+        counts[STATUS_FAILED],
+        counts[STATUS_PERMANENT],
+        counts["retries"],
     )
+    return counts
 
-def main() -> None:
+def _add_settings_option(parser: argparse.ArgumentParser) -> List[argparse.Action]:
+    return [parser.add_argument("--config", type=str, help="Path to JSON settings file.")]
+
+# The option groups shared by a plain run and the seed / work commands add
+# their options without defaults: the top-level parser sets them, and the
+# command parsers leave options they were not given out of the namespace, so
+# options given before the command are not reset by it.
+def _add_input_options(parser: argparse.ArgumentParser) -> List[argparse.Action]:
+    return [
+        parser.add_argument(
+            "--input",
+            type=str,
+            help=(
+                "Input file of PitchBook IDs or URLs: plain text (one per line), JSONL or "
+                "CSV, optionally .gz or .zst compressed."
+            ),
+        ),
+        parser.add_argument(
+            "--id-column",
+            type=str,
+            help="JSONL key or CSV column holding the ID or URL. Overrides input_id_column.",
+        ),
+        parser.add_argument(
+            "--shard",
+            type=parse_shard,
+            metavar="I/N",
+            help=(
+                "Only process IDs whose hash falls in shard I of N (0-based), so N "
+                "machines can split one input file without coordination."
+            ),
+        ),
+    ]
+
+def _add_output_options(parser: argparse.ArgumentParser) -> List[argparse.Action]:
+    return [
+        parser.add_argument(
+            "--output",
+            type=str,
+            help="Path to output JSON file where records will be written.",
+        ),
+        parser.add_argument(
+            "--json-backend",
+            choices=JSON_BACKENDS,
+            help="JSON encoder for the output files. Overrides the json_backend setting.",
+        ),
+    ]
+
+def _add_fetch_options(parser: argparse.ArgumentParser) -> List[argparse.Action]:
+    return [
+        parser.add_argument(
+            "--parser",
+            choices=PARSER_BACKENDS,
+            help="HTML parser backend. Overrides the html_parser setting.",
+        ),
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of URLs processed concurrently. Overrides the workers setting.",
+        ),
+        parser.add_argument(
+            "--cache",
+            type=str,
+            help="Path to the on-disk HTTP response cache. Overrides the cache_path setting.",
+        ),
+        parser.add_argument(
+            "--offline",
+            action="store_true",
+            help="Serve every page from the response cache and never touch the network.",
+        ),
+    ]
+
+def _add_run_options(parser: argparse.ArgumentParser) -> List[argparse.Action]:
+    """
+    Options only a plain run honors.
+    """
+    return [
+        parser.add_argument(
+            "--parse-processes",
+            type=int,
+            default=None,
+            help=(
+                "Parse pages in a pool of this many processes while --workers threads "
+                "fetch. 0 parses in the fetching threads. Overrides the parse_processes setting."
+            ),
+        ),
+        parser.add_argument(
+            "--queue-size",
+            type=int,
+            default=None,
+            help=(
+                "Maximum pages buffered between pipeline stages. Overrides the queue_size setting."
+            ),
+        ),
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help=(
+                "Continue an interrupted run: skip URLs recorded as done in the journal "
+                "next to the output and append to the existing JSONL file."
+            ),
+        ),
+        parser.add_argument(
+            "--quarantine",
+            action="store_true",
+            default=None,
+            help=(
+                "Write records that fail schema validation to <output>.quarantine.jsonl "
+                "instead of the main output. Overrides quarantine_invalid_records."
+            ),
+        ),
+        parser.add_argument(
+            "--columnar",
+            type=str,
+            default=None,
+            metavar="DIR",
+            help=(
+                "Also write normalized companies/investments/competitors/investors/contacts/faq "
+                "tables (Parquet, or CSV without pyarrow) under DIR. Overrides columnar_dir."
+            ),
+        ),
+        parser.add_argument(
+            "--sqlite",
+            type=str,
+            default=None,
+            metavar="PATH",
+            help=(
+                "Also upsert records by company id into this SQLite database. "
+                "Overrides sqlite_path."
+            ),
+        ),
+        parser.add_argument(
+            "--fingerprints",
+            type=str,
+            default=None,
+            metavar="PATH",
+            help=(
+                "Keep page and record hashes in this SQLite file across runs; pages that have "
+                "not changed reuse their previous record. Overrides fingerprints_path."
+            ),
+        ),
+        parser.add_argument(
+            "--changes-only",
+            type=str,
+            default=None,
+            metavar="PATH",
+            help=(
+                "Also write records that are new or changed since the previous run to this "
+                "JSONL file. Requires --fingerprints. Overrides changes_feed_path."
+            ),
+        ),
+        parser.add_argument(
+            "--metrics-file",
+            type=str,
+            default=None,
+            metavar="PATH",
+            help=(
+                "Write per-stage timings and counters in Prometheus text format to this file "
+                "when the run ends (e.g. for node_exporter's textfile collector). "
+                "Overrides metrics_file."
+            ),
+        ),
+        parser.add_argument(
+            "--metrics-port",
+            type=int,
+            default=None,
+            metavar="PORT",
+            help=(
+                "Serve live metrics on http://127.0.0.1:PORT/metrics during the run. "
+                "Overrides metrics_port."
+            ),
+        ),
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help=(
+                "Profile the parse, validate and export stages with cProfile and track "
+                "peak memory per page with tracemalloc. Writes <output>.profile/ with one "
+                ".prof file per stage and a report.txt."
+            ),
+        ),
+        parser.add_argument(
+            "--profile-every",
+            type=int,
+            default=None,
+            metavar="N",
+            help="With --profile, only profile every Nth URL. Overrides profile_every.",
+        ),
+    ]
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     project_root = Path(__file__).resolve().parents[1]
-    default_input = project_root / "data" / "inputs.sample.txt"
-    default_output = project_root / "data" / "sample_output.json"
-    default_config = project_root / "src" / "config" / "settings.example.json"
 
-    parser = argparse.ArgumentParser(
-        description="PitchBook Company Profile Scraper runner"
+    parser = argparse.ArgumentParser(description="PitchBook Company Profile Scraper runner")
+    shared = {
+        "settings": _add_settings_option(parser),
+        "input": _add_input_options(parser),
+        "output": _add_output_options(parser),
+        "fetch": _add_fetch_options(parser),
+    }
+    run_only = _add_run_options(parser)
+    parser.set_defaults(
+        input=str(project_root / "data" / "inputs.sample.txt"),
+        output=str(project_root / "data" / "sample_output.json"),
+        config=str(project_root / "src" / "config" / "settings.example.json"),
     )
-    parser.add_argument(
-        "--input",
-        type=str,
-        default=str(default_input),
-        help="Path to input file containing PitchBook URLs, one per line.",
+
+    commands = parser.add_subparsers(dest="command", metavar="{seed,work}")
+    seed_parser = commands.add_parser(
+        "seed",
+        argument_default=argparse.SUPPRESS,
+        help="Load the input into a SQLite job queue shared by worker processes.",
     )
-    parser.add_argument(
-        "--output",
-        type=str,
-        default=str(default_output),
-        help="Path to output JSON file where records will be written.",
+    _add_settings_option(seed_parser)
+    _add_input_options(seed_parser)
+    seed_parser.add_argument("--queue", type=str, required=True, help="Path to the job queue.")
+    work_parser = commands.add_parser(
+        "work",
+        argument_default=argparse.SUPPRESS,
+        help="Claim and process jobs from a queue; run any number of these in parallel.",
     )
-    parser.add_argument(
-        "--config",
+    _add_settings_option(work_parser)
+    _add_output_options(work_parser)
+    _add_fetch_options(work_parser)
+    work_parser.add_argument("--queue", type=str, required=True, help="Path to the job queue.")
+    work_parser.add_argument(
+        "--worker-id",
         type=str,
-        default=str(default_config),
-        help="Path to JSON settings file.",
+        default=None,
+        help="Name of this worker; defaults to <hostname>-<pid>.",
+    )
+    work_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Jobs claimed per lease. Overrides the queue_batch_size setting.",
+    )
+    work_parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=None,
+        help="How long claimed jobs stay leased. Overrides the queue_lease_seconds setting.",
     )
 
-    args = parser.parse_args()
+    # Options a command does not honor are rejected rather than ignored,
+    # including when they are given before the command.
+    unsupported = {
+        "seed": shared["output"] + shared["fetch"] + run_only,
+        "work": shared["input"] + run_only,
+    }
+    args = parser.parse_args(argv)
+    for action in unsupported.get(args.command, []):
+        if getattr(args, action.dest) != parser.get_default(action.dest):
+            parser.error(f"{action.option_strings[0]} is not supported by {args.command}")
+    return args
+
+def main() -> None:
+    args = parse_args()
+
+    if args.command == "seed":
+        seed_queue(
+            input_path=Path(args.input),
+            queue_path=Path(args.queue),
+            config_path=Path(args.config),
+            shard=args.shard,
+            id_column=args.id_column,
+        )
+        return
+    if args.command == "work":
+        work_queue(
+            queue_path=Path(args.queue),
+            output_path=Path(args.output),
+            config_path=Path(args.config),
+            worker_id=args.worker_id,
+            batch_size=args.batch_size,
+            lease_seconds=args.lease_seconds,
+            parser_backend=args.parser,
+            workers=args.workers,
+            cache_path=Path(args.cache) if args.cache else None,
+            offline=args.offline,
+            json_backend=args.json_backend,
+        )
+        return
 
     run(
         input_path=Path(args.input),
         output_path=Path(args.output),
         config_path=Path(args.config),
+        parser_backend=args.parser,
+        workers=args.workers,
+        parse_processes=args.parse_processes,
+        queue_size=args.queue_size,
+        resume=args.resume,
+        cache_path=Path(args.cache) if args.cache else None,
+        offline=args.offline,
+        shard=args.shard,
+        id_column=args.id_column,
+        quarantine=args.quarantine,
+        json_backend=args.json_backend,
+        columnar_dir=Path(args.columnar) if args.columnar else None,
+        sqlite_path=Path(args.sqlite) if args.sqlite else None,
+        fingerprints_path=Path(args.fingerprints) if args.fingerprints else None,
+        changes_path=Path(args.changes_only) if args.changes_only else None,
+        metrics_file=Path(args.metrics_file) if args.metrics_file else None,
+        metrics_port=args.metrics_port,
+        profile=args.profile,
+        profile_every=args.profile_every,
     )
\ No newline at end of file
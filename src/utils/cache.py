@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+LOGGER = logging.getLogger(__name__)
+
+class CacheMiss(LookupError):
+    """
+    Raised in offline mode when a URL is not in the response cache.
+    """
+
+def normalize_cache_key(url: str) -> str:
+    """
+    Canonical cache key: lower-case scheme and host, sorted query, no fragment
+    and no trailing slash on the path.
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+@dataclass
+class CachedResponse:
+    url: str
+    status_code: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    encoding: Optional[str] = None
+    stored_at: float = 0.0
+    fresh: bool = True
+
+    def validators(self) -> Dict[str, str]:
+        """
+        Conditional request headers derived from the stored ETag / Last-Modified.
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        conditional: Dict[str, str] = {}
+        if headers.get("ETag"):
+            conditional["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            conditional["If-Modified-Since"] = headers["Last-Modified"]
+        return conditional
+
+    def to_response(self, *, not_modified: bool = False) -> requests.Response:
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response._content = self.body
+        response.from_cache = True  # type: ignore[attr-defined]
+        response.not_modified = not_modified  # type: ignore[attr-defined]
+        return response
+
+class ResponseCache:
+    """
+    Persistent HTTP response cache stored in a single SQLite file.
+
+    Bodies are zlib-compressed. Entries older than ``ttl_seconds`` are treated
+    as misses (``None`` disables expiry) and the least recently used entries
+    are evicted once the compressed bodies exceed ``max_bytes``. Expired
+    entries are kept so they can be revalidated with their ETag/Last-Modified
+    validators. The parsed record for a URL can be stored alongside its body
+    and reused when the server answers 304 Not Modified. Safe to share between
+    threads.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl_seconds: Optional[float] = 7 * 24 * 3600,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                encoding TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS records (key TEXT PRIMARY KEY, record TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        self._total_bytes = int(row[0])
+
+    def _is_fresh(self, stored_at: float) -> bool:
+        return self.ttl_seconds is None or time.time() - stored_at <= self.ttl_seconds
+
+    def get(self, url: str, *, allow_stale: bool = False) -> Optional[CachedResponse]:
+        """
+        Return the cached response for ``url``.
+
+        Expired entries are returned (with ``fresh=False``) only when
+        ``allow_stale`` is set, for revalidation. Only fresh entries count as hits.
+        """
+        key = normalize_cache_key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status_code, headers, encoding, body, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            fresh = row is not None and self._is_fresh(row[5])
+            if not fresh:
+                self.misses += 1
+                if row is None or not allow_stale:
+                    return None
+            else:
+                self.hits += 1
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+        return CachedResponse(
+            url=row[0],
+            status_code=row[1],
+            headers=json.loads(row[2]),
+            encoding=row[3],
+            body=zlib.decompress(row[4]),
+            stored_at=row[5],
+            fresh=fresh,
+        )
+
+    def refresh(self, url: str, headers: Mapping[str, str]) -> None:
+        """
+        Mark an entry as fresh again after a 304, merging any new validators.
+        """
+        key = normalize_cache_key(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT headers FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return
+            stored = CaseInsensitiveDict(json.loads(row[0]))
+            for name in ("ETag", "Last-Modified"):
+                if headers.get(name):
+                    stored[name] = headers[name]
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, stored_at = ?, accessed_at = ? WHERE key = ?",
+                (json.dumps(dict(stored)), now, now, key),
+            )
+            self._conn.commit()
+            self.revalidations += 1
+
+    def get_record(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record FROM records WHERE key = ?", (normalize_cache_key(url),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_record(self, url: str, record: Mapping[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO records (key, record) VALUES (?, ?)",
+                (normalize_cache_key(url), json.dumps(record, ensure_ascii=False)),
+            )
+            self._conn.commit()
+
+    def put(self, url: str, response: requests.Response) -> None:
+        key = normalize_cache_key(url)
+        body = zlib.compress(response.content)
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            # The stored body is already decoded and may be re-encoded on reads.
+            if name.lower() not in {"content-encoding", "content-length", "transfer-encoding"}
+        }
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, status_code, headers, encoding, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url or url,
+                    response.status_code,
+                    json.dumps(headers),
+                    response.encoding,
+                    body,
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.execute("DELETE FROM records WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "revalidations": self.revalidations,
+            "entries": entries,
+            "bytes": self._total_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
\ No newline at end of file
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import tempfile
+from typing import Optional, Set
+
+LOGGER = logging.getLogger(__name__)
+
+class SeenSet:
+    """
+    Exact "have we seen this key" set with bounded memory.
+
+    Keys live in a Python set until ``max_memory_items`` is reached; after
+    that they are moved to a temporary on-disk SQLite table, so
+    multi-million-line inputs de-duplicate without false positives (unlike a
+    Bloom filter) and without holding every key in memory.
+    """
+
+    def __init__(self, max_memory_items: int = 1_000_000, directory: Optional[str] = None) -> None:
+        if max_memory_items < 1:
+            raise ValueError(f"max_memory_items must be at least 1, got {max_memory_items}")
+        self.max_memory_items = max_memory_items
+        self.directory = directory
+        self._memory: Set[str] = set()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._path: Optional[str] = None
+        self._count = 0
+
+    @property
+    def spilled(self) -> bool:
+        return self._conn is not None
+
+    def _spill(self) -> None:
+        fd, self._path = tempfile.mkstemp(prefix="seen-", suffix=".sqlite", dir=self.directory)
+        os.close(fd)
+        LOGGER.info(
+            "De-duplication set exceeded %d keys; spilling to %s",
+            self.max_memory_items,
+            self._path,
+        )
+        # The set may be fed from a pipeline feeder thread; it is never shared
+        # between threads concurrently.
+        self._conn = sqlite3.connect(self._path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("CREATE TABLE seen (key TEXT PRIMARY KEY) WITHOUT ROWID")
+        # The table is scratch space, so one never-committed transaction is fine.
+        self._conn.execute("BEGIN")
+        self._conn.executemany("INSERT INTO seen (key) VALUES (?)", ((key,) for key in self._memory))
+        self._memory = set()
+
+    def add(self, key: str) -> bool:
+        """
+        Add ``key``; return True if it was not seen before.
+        """
+        if self._conn is None:
+            if key in self._memory:
+                return False
+            if len(self._memory) < self.max_memory_items:
+                self._memory.add(key)
+                self._count += 1
+                return True
+            self._spill()
+        cursor = self._conn.execute("INSERT OR IGNORE INTO seen (key) VALUES (?)", (key,))
+        if cursor.rowcount == 1:
+            self._count += 1
+            return True
+        return False
+
+    def __contains__(self, key: object) -> bool:
+        if self._conn is None:
+            return key in self._memory
+        row = self._conn.execute("SELECT 1 FROM seen WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._memory = set()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._path is not None:
+            try:
+                os.remove(self._path)
+            except OSError:
+                pass
+            self._path = None
+
+    def __enter__(self) -> "SeenSet":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
\ No newline at end of file
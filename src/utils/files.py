@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+def truncate_partial_line(path: Path) -> None:
+    """
+    Drop a torn trailing line left by a crash so appended records stay valid.
+    """
+    if not path.exists():
+        return
+    with path.open("rb+") as f:
+        size = f.seek(0, 2)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        chunk_start = size
+        while chunk_start > 0:
+            chunk_start = max(0, chunk_start - 65536)
+            f.seek(chunk_start)
+            newline = f.read(size - chunk_start).rfind(b"\n")
+            if newline != -1:
+                f.truncate(chunk_start + newline + 1)
+                break
+        else:
+            f.truncate(0)
+    LOGGER.warning("Removed a partial trailing record from %s", path)
\ No newline at end of file
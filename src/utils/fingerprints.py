@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump when the extractors change so stored records are rebuilt from the pages.
+EXTRACTOR_VERSION = "1"
+
+# Page content that changes between fetches without changing what the
+# extractors read: comments, inline scripts (except JSON-LD), styles and
+# per-request tokens.
+_VOLATILE_PATTERNS = (
+    re.compile(r"<!--.*?-->", re.S),
+    re.compile(r"<script\b(?![^>]*application/ld\+json)[^>]*>.*?</script\s*>", re.I | re.S),
+    re.compile(r"<style\b[^>]*>.*?</style\s*>", re.I | re.S),
+    re.compile(r"<meta\b[^>]*\bname\s*=\s*[\"']?csrf[^>]*>", re.I),
+    re.compile(
+        r"\s(?:nonce|integrity|data-(?:csrf|nonce|request-id)[\w-]*)"
+        r"\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s>]+)",
+        re.I,
+    ),
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+def _digest(data: str) -> str:
+    return hashlib.blake2b(data.encode("utf-8"), digest_size=16).hexdigest()
+
+def page_fingerprint(html: str, *, salt: str = "") -> str:
+    """
+    Hash of the parts of a page the extractors depend on.
+
+    Volatile markup (see ``_VOLATILE_PATTERNS``) is dropped and whitespace
+    collapsed first, so re-fetching an unchanged profile gives the same hash.
+    """
+    for pattern in _VOLATILE_PATTERNS:
+        html = pattern.sub("", html)
+    return _digest(salt + _WHITESPACE_RE.sub(" ", html).strip())
+
+def record_fingerprint(record: Mapping[str, Any]) -> str:
+    """
+    Hash of a record independent of key order.
+    """
+    return _digest(json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":")))
+
+class FingerprintStore:
+    """
+    Per-URL page and record hashes kept across runs in a SQLite file.
+
+    ``reuse`` returns the stored record when a page hashes the same as the
+    last time it was parsed, so the extractor chain can be skipped;
+    ``remember`` stores the hash ``reuse`` returned and the record after
+    parsing, so each page is hashed once. Page hashes are
+    salted with ``salt`` (the parser backend) and ``EXTRACTOR_VERSION``.
+    ``record_changed`` compares a record with the last one exported for
+    its URL, which drives the changes-only feed. Safe to share between threads.
+    """
+
+    def __init__(self, path: Path, *, salt: str = "") -> None:
+        self.path = path
+        self.salt = f"{EXTRACTOR_VERSION}:{salt}:"
+        self.reused = 0
+        self.parsed = 0
+        self.changed = 0
+        self.unchanged = 0
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                url TEXT PRIMARY KEY,
+                page_hash TEXT,
+                record TEXT,
+                record_hash TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def reuse(self, url: str, html: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        The record parsed from an identical page for ``url`` (or None) and the
+        hash of ``html`` to pass to ``remember``.
+        """
+        page_hash = page_fingerprint(html, salt=self.salt)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT page_hash, record FROM fingerprints WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None or row[0] != page_hash or row[1] is None:
+            return None, page_hash
+        record = json.loads(row[1])
+        if record.get("url") != url:
+            return None, page_hash
+        with self._lock:
+            self.reused += 1
+        return record, page_hash
+
+    def remember(self, url: str, page_hash: str, record: Mapping[str, Any]) -> None:
+        payload = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO fingerprints (url, page_hash, record, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (url) DO UPDATE SET page_hash = excluded.page_hash, "
+                "record = excluded.record, updated_at = excluded.updated_at",
+                (url, page_hash, payload, time.time()),
+            )
+            self._conn.commit()
+            self.parsed += 1
+
+    def record_changed(self, url: str, record: Mapping[str, Any]) -> bool:
+        """
+        Store the hash of ``record``; True if it is new or differs from the last one.
+        """
+        record_hash = record_fingerprint(record)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record_hash FROM fingerprints WHERE url = ?", (url,)
+            ).fetchone()
+            changed = row is None or row[0] != record_hash
+            if changed:
+                self._conn.execute(
+                    "INSERT INTO fingerprints (url, record_hash, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT (url) DO UPDATE SET record_hash = excluded.record_hash, "
+                    "updated_at = excluded.updated_at",
+                    (url, record_hash, time.time()),
+                )
+                self._conn.commit()
+                self.changed += 1
+            else:
+                self.unchanged += 1
+        return changed
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "reused": self.reused,
+                "parsed": self.parsed,
+                "changed": self.changed,
+                "unchanged": self.unchanged,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "FingerprintStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
\ No newline at end of file
@@ -1,16 +1,68 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 
+from src.utils.cache import CacheMiss, CachedResponse, ResponseCache
+from src.utils.metrics import (
+    CACHE_HITS,
+    HTTP_REQUEST_SECONDS,
+    HTTP_RESPONSE_BYTES,
+    HTTP_RESPONSES,
+    HTTP_RETRIES,
+)
 from src.utils.rate_limiter import RateLimiter
+from src.utils.retry import HttpStatusError, PermanentHttpError, RetryPolicy
 
 LOGGER = logging.getLogger(__name__)
 
+# Statuses that signal the server wants us to slow down.
+THROTTLE_STATUSES = frozenset({429, 503})
+
+# Largest decoded body we are willing to hold in memory for one page.
+DEFAULT_MAX_BODY_BYTES = 10 * 1024 * 1024
+
+_CHUNK_SIZE = 64 * 1024
+
+class ResponseTooLargeError(PermanentHttpError):
+    """
+    A response body exceeded ``max_body_bytes`` and was abandoned mid-stream.
+    """
+
+    def __init__(self, status_code: int, url: str, max_bytes: int) -> None:
+        super().__init__(status_code, url)
+        self.max_bytes = max_bytes
+        self.args = (f"Response body exceeds {max_bytes} bytes",)
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait according to a Retry-After header (delta-seconds or HTTP date).
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
 @dataclass
 class HttpClient:
     base_url: str
@@ -20,44 +72,314 @@ class HttpClient:
     max_retries: int = 3
     backoff_factor: float = 0.5
     session: Optional[requests.Session] = None
+    cache: Optional[ResponseCache] = None
+    offline: bool = False
+    retry_policy: Optional[RetryPolicy] = None
+    pool_size: int = 10
+    max_body_bytes: Optional[int] = DEFAULT_MAX_BODY_BYTES
 
     def __post_init__(self) -> None:
+        if self.retry_policy is None:
+            self.retry_policy = RetryPolicy(
+                max_attempts=self.max_retries,
+                backoff_factor=self.backoff_factor,
+            )
+        if self.offline and self.cache is None:
+            raise ValueError("offline mode requires a response cache")
         if self.session is None:
             self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.user_agent})
+            # One pooled connection per worker, so keep-alive connections are
+            # reused instead of being dropped (and re-handshaked) under load.
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=self.pool_size)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        # urllib3 lists br / zstd only when brotli / zstandard are installed,
+        # and transparently decodes whatever it advertises.
+        self.session.headers.update(
+            {"User-Agent": self.user_agent, "Accept-Encoding": ACCEPT_ENCODING}
+        )
 
-    def get(self, url: str, *, timeout: Optional[int] = None, **kwargs: Any) -> requests.Response:
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Connection pool counters summed over every host pool of the session.
+
+        ``reused`` is the number of requests served on an already open
+        connection; a low value relative to ``requests`` means pools are too
+        small for the number of workers.
+        """
+        stats = {"pools": 0, "connections": 0, "requests": 0, "reused": 0}
+        adapters = {id(adapter): adapter for adapter in self.session.adapters.values()}
+        for adapter in adapters.values():
+            pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+            if pools is None:
+                continue
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats["pools"] += 1
+                stats["connections"] += pool.num_connections
+                stats["requests"] += pool.num_requests
+        stats["reused"] = max(0, stats["requests"] - stats["connections"])
+        return stats
+
+    def _absolute_url(self, url: str) -> str:
         if not url.startswith("http://") and not url.startswith("https://"):
             url = self.base_url.rstrip("/") + "/" + url.lstrip("/")
+        return url
+
+    def _cached(
+        self, url: str
+    ) -> Tuple[Optional[requests.Response], Optional[CachedResponse]]:
+        """
+        Look ``url`` up in the response cache.
+
+        Returns the response to serve without a request, if any, and otherwise
+        the expired entry whose validators should be sent for revalidation. In
+        offline mode any stored entry is served and a miss raises CacheMiss.
+        """
+        if self.cache is None:
+            return None, None
+        entry = self.cache.get(url, allow_stale=True)
+        if entry is not None and (entry.fresh or self.offline):
+            LOGGER.debug("Cache hit for %s", url)
+            CACHE_HITS.inc()
+            return entry.to_response(), None
+        if self.offline:
+            raise CacheMiss(f"{url} is not in the response cache (offline mode)")
+        return None, entry
+
+    @staticmethod
+    def _with_validators(kwargs: Dict[str, Any], stale: Optional[CachedResponse]) -> Dict[str, Any]:
+        validators = stale.validators() if stale is not None else {}
+        if not validators:
+            return kwargs
+        headers = dict(kwargs.get("headers") or {})
+        headers.update(validators)
+        return {**kwargs, "headers": headers}
+
+    def _accept(
+        self,
+        url: str,
+        response: requests.Response,
+        stale: Optional[CachedResponse],
+    ) -> Optional[requests.Response]:
+        """
+        Return the response to hand back to the caller, or None to retry.
+
+        A 304 for a revalidated entry is answered with the cached body, flagged
+        with ``not_modified`` so callers can reuse what they derived from it.
+        """
+        if response.status_code == 304 and stale is not None and self.cache is not None:
+            LOGGER.debug("%s not modified; reusing cached body", url)
+            self.cache.refresh(url, response.headers)
+            return stale.to_response(not_modified=True)
+        if 200 <= response.status_code < 300:
+            if self.cache is not None:
+                self.cache.put(url, response)
+            return response
+        return None
+
+    def _send(self, url: str, timeout: float, kwargs: Dict[str, Any]) -> requests.Response:
+        """
+        Issue one GET and read its body in chunks, giving up past ``max_body_bytes``.
+        """
+        with HTTP_REQUEST_SECONDS.time():
+            response = self.session.get(url, timeout=timeout, stream=True, **kwargs)
+            try:
+                self._read_body(url, response)
+            except BaseException:
+                response.close()
+                raise
+        HTTP_RESPONSES.inc(status=str(response.status_code))
+        HTTP_RESPONSE_BYTES.inc(len(response._content or b""))
+        return response
+
+    def _read_body(self, url: str, response: requests.Response) -> None:
+        limit = self.max_body_bytes
+        if limit is not None:
+            declared = response.headers.get("Content-Length", "")
+            if declared.isdigit() and int(declared) > limit:
+                raise ResponseTooLargeError(response.status_code, url, limit)
+        buffered = getattr(response, "_content", False)
+        if buffered is not False:
+            # The body was already read (e.g. a response built in memory).
+            if limit is not None and buffered and len(buffered) > limit:
+                raise ResponseTooLargeError(response.status_code, url, limit)
+            return
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+            size += len(chunk)
+            if limit is not None and size > limit:
+                raise ResponseTooLargeError(response.status_code, url, limit)
+            chunks.append(chunk)
+        response._content = b"".join(chunks)
+        response._content_consumed = True
+
+    def _feedback(self, host: str, response: requests.Response) -> None:
+        """
+        Report the outcome of a request to the rate limiter.
+        """
+        if self.rate_limiter is None:
+            return
+        if response.status_code in THROTTLE_STATUSES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.rate_limiter.record_throttle(host, retry_after)
+        elif response.status_code < 400:
+            self.rate_limiter.record_success(host)
+
+    def _status_error(self, response: requests.Response, url: str, attempt: int) -> HttpStatusError:
+        if not self.retry_policy.is_retryable_status(response.status_code):
+            LOGGER.warning(
+                "Permanent status %s for %s (attempt %d); not retrying",
+                response.status_code,
+                url,
+                attempt,
+            )
+            return PermanentHttpError(response.status_code, url)
+        LOGGER.warning(
+            "Non-success status %s for %s (attempt %d)",
+            response.status_code,
+            url,
+            attempt,
+        )
+        return HttpStatusError(response.status_code, url)
+
+    def _request_error(self, host: str, url: str, attempt: int, exc: Exception) -> None:
+        if isinstance(exc, requests.Timeout) and self.rate_limiter is not None:
+            self.rate_limiter.record_throttle(host)
+        LOGGER.warning("Request error for %s (attempt %d): %s", url, attempt, exc)
 
+    def _deadline(self) -> Optional[float]:
+        if self.retry_policy.deadline is None:
+            return None
+        return time.monotonic() + self.retry_policy.deadline
+
+    @staticmethod
+    def _attempt_timeout(timeout: float, deadline_at: Optional[float]) -> float:
+        if deadline_at is None:
+            return timeout
+        return max(0.1, min(timeout, deadline_at - time.monotonic()))
+
+    def _retry_delay(
+        self,
+        url: str,
+        attempt: int,
+        deadline_at: Optional[float],
+        retry_after: Optional[float],
+    ) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None to give up now.
+        """
+        if attempt >= self.retry_policy.max_attempts:
+            return None
+        delay = self.retry_policy.backoff(attempt, retry_after)
+        if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+            LOGGER.warning("Retry deadline for %s reached after %d attempts", url, attempt)
+            return None
+        HTTP_RETRIES.inc()
+        return delay
+
+    def get(self, url: str, *, timeout: Optional[int] = None, **kwargs: Any) -> requests.Response:
+        url = self._absolute_url(url)
+        cached, stale = self._cached(url)
+        if cached is not None:
+            return cached
+        kwargs = self._with_validators(kwargs, stale)
+        host = urlsplit(url).netloc
         effective_timeout = timeout or self.timeout
+        deadline_at = self._deadline()
         attempt = 0
         last_error: Optional[Exception] = None
 
-        while attempt < self.max_retries:
+        while True:
             attempt += 1
             if self.rate_limiter is not None:
-                self.rate_limiter.acquire()
+                self.rate_limiter.acquire(host)
 
+            retry_after: Optional[float] = None
             try:
                 LOGGER.debug("HTTP GET %s (attempt %d)", url, attempt)
-                response = self.session.get(url, timeout=effective_timeout, **kwargs)
-                if 200 <= response.status_code < 300:
-                    return response
-                LOGGER.warning(
-                    "Non-success status %s for %s (attempt %d)",
-                    response.status_code,
+                response = self._send(
+                    url, self._attempt_timeout(effective_timeout, deadline_at), kwargs
+                )
+            except (requests.RequestException, OSError) as exc:  # noqa: PERF203
+                self._request_error(host, url, attempt, exc)
+                if not self.retry_policy.is_retryable_exception(exc):
+                    raise
+                last_error = exc
+            else:
+                self._feedback(host, response)
+                accepted = self._accept(url, response, stale)
+                if accepted is not None:
+                    return accepted
+                last_error = self._status_error(response, url, attempt)
+                if isinstance(last_error, PermanentHttpError):
+                    raise last_error
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            delay = self._retry_delay(url, attempt, deadline_at, retry_after)
+            if delay is None:
+                break
+            time.sleep(delay)
+
+        LOGGER.error("HTTP GET %s ultimately failed after %d attempts", url, attempt)
+        raise last_error
+
+    async def aget(
+        self, url: str, *, timeout: Optional[int] = None, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Async counterpart of ``get`` with the same retry policy and rate limiting.
+
+        The blocking request runs in a worker thread while rate-limit waits and
+        backoff use ``asyncio.sleep``, so the event loop is never blocked.
+        """
+        url = self._absolute_url(url)
+        cached, stale = await asyncio.to_thread(self._cached, url)
+        if cached is not None:
+            return cached
+        kwargs = self._with_validators(kwargs, stale)
+        host = urlsplit(url).netloc
+        effective_timeout = timeout or self.timeout
+        deadline_at = self._deadline()
+        attempt = 0
+        last_error: Optional[Exception] = None
+
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire(host)
+
+            retry_after: Optional[float] = None
+            try:
+                LOGGER.debug("HTTP GET %s (attempt %d, async)", url, attempt)
+                response = await asyncio.to_thread(
+                    self._send,
                     url,
-                    attempt,
+                    self._attempt_timeout(effective_timeout, deadline_at),
+                    kwargs,
                 )
-                last_error = RuntimeError(f"Unexpected status code {response.status_code}")
             except (requests.RequestException, OSError) as exc:  # noqa: PERF203
+                self._request_error(host, url, attempt, exc)
+                if not self.retry_policy.is_retryable_exception(exc):
+                    raise
                 last_error = exc
-                LOGGER.warning("Request error for %s (attempt %d): %s", url, attempt, exc)
+            else:
+                self._feedback(host, response)
+                accepted = await asyncio.to_thread(self._accept, url, response, stale)
+                if accepted is not None:
+                    return accepted
+                last_error = self._status_error(response, url, attempt)
+                if isinstance(last_error, PermanentHttpError):
+                    raise last_error
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
 
-            sleep_time = self.backoff_factor * (2 ** (attempt - 1))
-            time.sleep(sleep_time)
+            delay = self._retry_delay(url, attempt, deadline_at, retry_after)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
 
-        assert last_error is not None
-        LOGGER.error("HTTP GET %s ultimately failed after %d attempts", url, self.max_retries)
+        LOGGER.error("HTTP GET %s ultimately failed after %d attempts", url, attempt)
         raise last_error
\ No newline at end of file
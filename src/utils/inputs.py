@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import gzip
+import hashlib
+import io
+import json
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+# Columns / keys tried, in order, when no ID column is configured.
+DEFAULT_ID_COLUMNS = ("id", "company_id", "url", "profile_url")
+
+JSONL_SUFFIXES = frozenset({".jsonl", ".ndjson"})
+CSV_SUFFIXES = frozenset({".csv"})
+
+@contextmanager
+def open_text(path: Path) -> Iterator[IO[str]]:
+    """
+    Open ``path`` for streaming text reads, decompressing ``.gz`` and ``.zst``.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".gz":
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as handle:
+            yield handle
+    elif suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError(
+                f"Reading {path} requires the 'zstandard' package "
+                "(pip install 'pitchbook-companies-scraper[compression]')"
+            ) from exc
+        with path.open("rb") as raw:
+            reader = zstandard.ZstdDecompressor().stream_reader(raw)
+            with io.TextIOWrapper(reader, encoding="utf-8", newline="") as handle:
+                yield handle
+    else:
+        with path.open("r", encoding="utf-8", newline="") as handle:
+            yield handle
+
+def input_format(path: Path) -> str:
+    """
+    ``"jsonl"``, ``"csv"`` or ``"text"``, judged by the suffix under any compression.
+    """
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if suffixes and suffixes[-1] in (".gz", ".zst"):
+        suffixes.pop()
+    last = suffixes[-1] if suffixes else ""
+    if last in JSONL_SUFFIXES:
+        return "jsonl"
+    if last in CSV_SUFFIXES:
+        return "csv"
+    return "text"
+
+def _pick_column(columns: Iterable[str], id_column: Optional[str], path: Path) -> Optional[str]:
+    if id_column is not None:
+        if id_column not in columns:
+            raise ValueError(f"{path} has no {id_column!r} column")
+        return id_column
+    for candidate in DEFAULT_ID_COLUMNS:
+        if candidate in columns:
+            return candidate
+    return None
+
+def _iter_text(handle: IO[str]) -> Iterator[str]:
+    for line in handle:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+def _iter_jsonl(handle: IO[str], id_column: Optional[str], path: Path) -> Iterator[str]:
+    for line_no, line in enumerate(handle, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError:
+            LOGGER.warning("Skipping malformed JSON on line %d of %s", line_no, path)
+            continue
+        if isinstance(entry, str):
+            yield entry
+            continue
+        if not isinstance(entry, dict):
+            LOGGER.warning("Skipping line %d of %s: expected an object", line_no, path)
+            continue
+        column = id_column or _pick_column(entry, None, path)
+        value = entry.get(column) if column is not None else None
+        if value in (None, ""):
+            LOGGER.warning("Skipping line %d of %s: no ID value", line_no, path)
+            continue
+        yield str(value)
+
+def _iter_csv(handle: IO[str], id_column: Optional[str], path: Path) -> Iterator[str]:
+    reader = csv.DictReader(handle)
+    if not reader.fieldnames:
+        return
+    column = _pick_column(reader.fieldnames, id_column, path) or reader.fieldnames[0]
+    for row in reader:
+        value = (row.get(column) or "").strip()
+        if value:
+            yield value
+
+def load_inputs(input_path: Path, *, id_column: Optional[str] = None) -> Iterator[str]:
+    """
+    Lazily yield raw inputs (IDs or URLs) from a text, JSONL or CSV file.
+
+    Files may be gzip (``.gz``) or zstandard (``.zst``) compressed. For JSONL
+    and CSV the value comes from ``id_column``, or the first of
+    DEFAULT_ID_COLUMNS present. Nothing is buffered, so memory and startup
+    time do not depend on the size of the input.
+    """
+    if not input_path.exists():
+        LOGGER.warning("Input file %s does not exist. No URLs to process.", input_path)
+        return
+    fmt = input_format(input_path)
+    with open_text(input_path) as handle:
+        if fmt == "jsonl":
+            yield from _iter_jsonl(handle, id_column, input_path)
+        elif fmt == "csv":
+            yield from _iter_csv(handle, id_column, input_path)
+        else:
+            yield from _iter_text(handle)
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse ``"i/N"`` into ``(i, N)`` with ``0 <= i < N``; the ``--shard`` argument type.
+    """
+    try:
+        index_text, count_text = value.split("/", 1)
+        index, count = int(index_text), int(count_text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"shard must be two integers i/N, got {value!r}") from None
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"shard count N must be at least 1, got {value!r}")
+    if index < 0:
+        raise argparse.ArgumentTypeError(f"shard index i must not be negative, got {value!r}")
+    if index >= count:
+        raise argparse.ArgumentTypeError(f"shard index i must be < count N, got {value!r}")
+    return index, count
+
+def shard_of(company_id: str, count: int) -> int:
+    """
+    Stable shard number for ``company_id``; identical on every machine and run.
+    """
+    digest = hashlib.blake2b(company_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count
\ No newline at end of file
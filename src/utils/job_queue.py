@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.statuses import STATUS_DONE, STATUS_FAILED, STATUS_PERMANENT
+
+LOGGER = logging.getLogger(__name__)
+
+STATUS_PENDING = "pending"
+STATUS_LEASED = "leased"
+
+_SEED_BATCH = 10_000
+
+class JobQueue:
+    """
+    Durable URL work queue in a SQLite file shared by any number of processes.
+
+    ``seed`` adds URLs as ``pending`` jobs. Workers ``claim`` batches under a
+    time-limited lease; a lease that expires (the worker crashed or stalled) is
+    claimed again by the next worker. Each claim counts as an attempt, and a
+    job that keeps failing ends as ``failed`` after ``max_attempts``.
+    Permanent errors end as ``permanent`` straight away.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        lease_seconds: float = 600.0,
+        max_attempts: int = 3,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Transactions are managed explicitly so claims can use BEGIN IMMEDIATE.
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, timeout=30, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                url TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                worker TEXT,
+                lease_expires REAL,
+                error TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_expires)")
+
+    def seed(self, urls: Iterable[str]) -> int:
+        """
+        Add ``urls`` as pending jobs; URLs already in the queue are left alone.
+
+        Returns the number of new jobs.
+        """
+        added = 0
+        remaining = iter(urls)
+        with self._lock:
+            while True:
+                batch = list(islice(remaining, _SEED_BATCH))
+                if not batch:
+                    return added
+                now = time.time()
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    before = self._conn.total_changes
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO jobs (url, status, updated_at) VALUES (?, ?, ?)",
+                        ((url, STATUS_PENDING, now) for url in batch),
+                    )
+                    added += self._conn.total_changes - before
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+
+    def claim(self, worker: str, limit: int) -> List[str]:
+        """
+        Lease up to ``limit`` pending (or lease-expired) jobs to ``worker``.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT url, status FROM jobs "
+                    "WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                    "LIMIT ?",
+                    (STATUS_PENDING, STATUS_LEASED, now, limit),
+                ).fetchall()
+                self._conn.executemany(
+                    "UPDATE jobs SET status = ?, worker = ?, lease_expires = ?, "
+                    "attempts = attempts + 1, updated_at = ? WHERE url = ?",
+                    ((STATUS_LEASED, worker, now + self.lease_seconds, now, url) for url, _ in rows),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        reclaimed = sum(1 for _, status in rows if status == STATUS_LEASED)
+        if reclaimed:
+            LOGGER.warning("%s reclaimed %d jobs with expired leases", worker, reclaimed)
+        return [url for url, _ in rows]
+
+    def _finish(self, url: str, worker: str, status: str, error: Optional[str]) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, lease_expires = NULL, updated_at = ? "
+                "WHERE url = ? AND status = ? AND worker = ?",
+                (status, error, time.time(), url, STATUS_LEASED, worker),
+            )
+        if cursor.rowcount != 1:
+            # The lease expired and another worker took the job over.
+            LOGGER.warning("%s no longer holds the lease for %s", worker, url)
+            return False
+        return True
+
+    def complete(self, url: str, worker: str) -> bool:
+        return self._finish(url, worker, STATUS_DONE, None)
+
+    def fail(self, url: str, worker: str, error: str, *, permanent: bool = False) -> bool:
+        """
+        Record a failed attempt; the job goes back to pending until it runs out of attempts.
+        """
+        if permanent:
+            return self._finish(url, worker, STATUS_PERMANENT, error)
+        with self._lock:
+            row = self._conn.execute("SELECT attempts FROM jobs WHERE url = ?", (url,)).fetchone()
+        exhausted = row is not None and row[0] >= self.max_attempts
+        return self._finish(url, worker, STATUS_FAILED if exhausted else STATUS_PENDING, error)
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Number of jobs per status, plus ``retries`` (attempts beyond the first).
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+            retries = self._conn.execute(
+                "SELECT COALESCE(SUM(attempts - 1), 0) FROM jobs WHERE attempts > 1"
+            ).fetchone()[0]
+        counts = {
+            status: 0
+            for status in (STATUS_PENDING, STATUS_LEASED, STATUS_DONE, STATUS_FAILED, STATUS_PERMANENT)
+        }
+        counts.update(dict(rows))
+        counts["retries"] = int(retries)
+        return counts
+
+    def has_unfinished(self) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM jobs WHERE status IN (?, ?) LIMIT 1",
+                (STATUS_PENDING, STATUS_LEASED),
+            ).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "JobQueue":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
\ No newline at end of file
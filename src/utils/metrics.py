@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+LOGGER = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from sub-millisecond parses to slow fetches.
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+def _label_key(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items())) if labels else ()
+
+def _format_labels(labels: Labels, extra: Labels = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in pairs
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+class Counter:
+    """
+    Monotonic counter, optionally split by labels.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help_text = help_text
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0.0)
+
+    def total(self) -> float:
+        with self._lock:
+            return sum(self._values.values())
+
+    def by_label(self, name: str) -> Dict[str, float]:
+        """
+        Values summed per value of the label ``name``.
+        """
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for labels, value in self._values.items():
+                label = dict(labels).get(name, "")
+                totals[label] = totals.get(label, 0.0) + value
+        return totals
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(labels)} {_format_value(value)}" for labels, value in items
+        ]
+
+class Gauge:
+    """
+    Value that can go up and down, optionally split by labels.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help_text = help_text
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(labels)} {_format_value(value)}" for labels, value in items
+        ]
+
+class _Series:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, buckets: int) -> None:
+        self.counts = [0] * buckets
+        self.sum = 0.0
+        self.count = 0
+
+class Histogram:
+    """
+    Latency histogram with fixed buckets, optionally split by labels.
+
+    An observation is a bisect and three increments under a lock, cheap
+    enough for per-page and per-request timings.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Labels, _Series] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = _Series(len(self.buckets) + 1)
+            series.counts[index] += 1
+            series.sum += value
+            series.count += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def snapshot(self) -> Dict[Labels, Tuple[List[int], float, int]]:
+        with self._lock:
+            return {
+                labels: (list(series.counts), series.sum, series.count)
+                for labels, series in self._series.items()
+            }
+
+    def quantile(self, q: float, counts: Sequence[int]) -> float:
+        """
+        Estimate the ``q`` quantile from bucket ``counts`` by linear interpolation.
+        """
+        total = sum(counts)
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                if index >= len(self.buckets):
+                    return lower
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> List[str]:
+        lines: List[str] = []
+        for labels, (counts, total, count) in sorted(self.snapshot().items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = (("le", _format_value(bound)),)
+                lines.append(f"{self.name}_bucket{_format_labels(labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+class MetricsRegistry:
+    """
+    The counters, gauges and histograms of one process, rendered in the Prometheus
+    text exposition format.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Union[Counter, Gauge, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        with self._lock:
+            metric = self._metrics.setdefault(name, Counter(name, help_text))
+        assert isinstance(metric, Counter)
+        return metric
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        with self._lock:
+            metric = self._metrics.setdefault(name, Gauge(name, help_text))
+        assert isinstance(metric, Gauge)
+        return metric
+
+    def histogram(
+        self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        with self._lock:
+            metric = self._metrics.setdefault(name, Histogram(name, help_text, buckets))
+        assert isinstance(metric, Histogram)
+        return metric
+
+    def reset(self) -> None:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def render_prometheus(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        lines: List[str] = []
+        for name, metric in metrics:
+            lines.append(f"# HELP {name} {metric.help_text}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path) -> None:
+        """
+        Write the metrics for node_exporter's textfile collector (atomically).
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(self.render_prometheus(), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serve ``/metrics`` from a daemon thread; call ``shutdown()`` on the result to stop.
+        """
+        registry = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                LOGGER.debug("metrics: " + format, *args)
+
+        server = ThreadingHTTPServer((host, port), _Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+        LOGGER.info("Serving metrics on http://%s:%d/metrics", host, server.server_address[1])
+        return server
+
+METRICS = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = METRICS.histogram(
+    "scraper_http_request_seconds", "Latency of one HTTP attempt including the body read."
+)
+HTTP_RESPONSES = METRICS.counter("scraper_http_responses_total", "HTTP responses by status code.")
+HTTP_RESPONSE_BYTES = METRICS.counter(
+    "scraper_http_response_bytes_total", "Decoded response body bytes read."
+)
+HTTP_RETRIES = METRICS.counter("scraper_http_retries_total", "HTTP attempts that were retried.")
+CACHE_HITS = METRICS.counter(
+    "scraper_cache_hits_total", "Requests answered from the response cache."
+)
+RATE_LIMIT_WAIT_SECONDS = METRICS.histogram(
+    "scraper_rate_limit_wait_seconds", "Time spent waiting for a rate limiter token."
+)
+RATE_LIMIT_PER_MINUTE = METRICS.gauge(
+    "scraper_rate_limit_per_minute", "Current request rate of the adaptive rate limiter."
+)
+STAGE_SECONDS = METRICS.histogram(
+    "scraper_stage_seconds", "Time per page in each parse, validation and export stage."
+)
+RECORDS = METRICS.counter("scraper_records_total", "Processed URLs by outcome.")
+RUN_SECONDS = METRICS.counter("scraper_run_seconds_total", "Wall-clock duration of runs.")
+
+def log_summary(elapsed: float) -> None:
+    """
+    Log URLs per second and a per-stage latency breakdown for a run of ``elapsed`` seconds.
+    """
+    outcomes = RECORDS.by_label("outcome")
+    processed = sum(outcomes.values())
+    LOGGER.info(
+        "Run summary: %d URLs in %.1fs (%.2f per second): %s",
+        processed,
+        elapsed,
+        processed / elapsed if elapsed > 0 else 0.0,
+        ", ".join(f"{name}={int(count)}" for name, count in sorted(outcomes.items())) or "none",
+    )
+    rows = [
+        ("fetch", HTTP_REQUEST_SECONDS, HTTP_REQUEST_SECONDS.snapshot().get(())),
+        ("rate limit wait", RATE_LIMIT_WAIT_SECONDS, RATE_LIMIT_WAIT_SECONDS.snapshot().get(())),
+    ]
+    rows += [
+        (dict(labels).get("stage", ""), STAGE_SECONDS, data)
+        for labels, data in sorted(STAGE_SECONDS.snapshot().items())
+    ]
+    for name, histogram, data in rows:
+        if data is None or not data[2]:
+            continue
+        counts, total, count = data
+        LOGGER.info(
+            "  %-16s %7d calls %9.3fs total %8.2fms mean %8.2fms p50 %8.2fms p95",
+            name,
+            count,
+            total,
+            total / count * 1000,
+            histogram.quantile(0.5, counts) * 1000,
+            histogram.quantile(0.95, counts) * 1000,
+        )
+    statuses = HTTP_RESPONSES.by_label("status")
+    LOGGER.info(
+        "  http: %d responses (%s), %d retries, %.1f MiB read, %d cache hits",
+        sum(statuses.values()),
+        ", ".join(f"{status}={int(count)}" for status, count in sorted(statuses.items())) or "none",
+        HTTP_RETRIES.total(),
+        HTTP_RESPONSE_BYTES.total() / (1024 * 1024),
+        CACHE_HITS.total(),
+    )
\ No newline at end of file
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Set
+
+LOGGER = logging.getLogger(__name__)
+
+class StageProfiler:
+    """
+    cProfile statistics per pipeline stage and peak memory per page for a
+    sample of URLs.
+
+    Every ``every``-th URL passed to ``sample`` is profiled; ``stage`` is a
+    no-op for the others, so the overhead stays proportional to the sample.
+    tracemalloc only runs inside profiled sections too, as it slows every
+    allocation in the process down several times. Profiled sections run one
+    at a time (a process can only have one active profiler on Python 3.12+),
+    which also keeps the tracemalloc peak of a page mostly its own;
+    allocations of unsampled pages running in other threads still count
+    towards it. ``write`` leaves a ``<stage>.prof`` file per stage (readable
+    with ``pstats`` or snakeviz) and a ``report.txt`` with the top ``top``
+    functions, the pages with the highest peak memory and the sites that
+    allocated the most memory still held at the end of a profiled section.
+    """
+
+    def __init__(
+        self, directory: Path, *, every: int = 1, top: int = 30, memory: bool = True
+    ) -> None:
+        if every < 1:
+            raise ValueError(f"every must be at least 1, got {every}")
+        self.directory = directory
+        self.every = every
+        self.top = top
+        self.memory = memory
+        self.seen = 0
+        self.profiled = 0
+        self._sampled: Set[str] = set()
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._peaks: Dict[str, int] = {}
+        self._sites: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._profile_lock = threading.Lock()
+
+    def sample(self, url: str) -> bool:
+        """
+        Count ``url`` and decide whether its stages are profiled.
+        """
+        with self._lock:
+            sampled = self.seen % self.every == 0
+            self.seen += 1
+            if sampled:
+                self.profiled += 1
+                self._sampled.add(url)
+        return sampled
+
+    @contextmanager
+    def stage(self, name: str, url: str) -> Iterator[None]:
+        if url not in self._sampled:
+            yield
+            return
+        with self._profile_lock:
+            profile = self._profiles.get(name)
+            if profile is None:
+                profile = self._profiles[name] = cProfile.Profile()
+            # Leave tracing that someone else started running, and out of the sites.
+            started = self.memory and not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            if self.memory:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                if self.memory:
+                    peak = tracemalloc.get_traced_memory()[1] - baseline
+                    self._peaks[url] = max(self._peaks.get(url, 0), peak)
+                if started:
+                    self._add_sites(tracemalloc.take_snapshot())
+                    tracemalloc.stop()
+
+    def _add_sites(self, snapshot: tracemalloc.Snapshot) -> None:
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+        )
+        for statistic in snapshot.statistics("lineno"):
+            site = str(statistic.traceback)
+            self._sites[site] = self._sites.get(site, 0) + statistic.size
+
+    def finish(self, url: str) -> None:
+        with self._lock:
+            self._sampled.discard(url)
+
+    def write(self) -> List[Path]:
+        """
+        Write the ``.prof`` files and the text report; returns their paths.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        paths: List[Path] = []
+        report = io.StringIO()
+        report.write(f"Profiled {self.profiled} of {self.seen} URLs (every {self.every})\n")
+        for name, profile in self._profiles.items():
+            path = self.directory / f"{name}.prof"
+            profile.dump_stats(str(path))
+            paths.append(path)
+            report.write(f"\n=== {name}: top {self.top} by cumulative time ===\n")
+            stats = pstats.Stats(profile, stream=report)
+            stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        if self._peaks:
+            peaks = sorted(self._peaks.items(), key=lambda item: item[1], reverse=True)
+            mean = sum(self._peaks.values()) / len(self._peaks)
+            report.write(f"\n=== peak memory per page (mean {mean / 1024:.1f} KiB) ===\n")
+            for url, peak in peaks[: self.top]:
+                report.write(f"{peak / 1024:10.1f} KiB  {url}\n")
+        if self._sites:
+            sites = sorted(self._sites.items(), key=lambda item: item[1], reverse=True)
+            report.write(f"\n=== top {self.top} allocation sites still held after a stage ===\n")
+            for site, size in sites[: self.top]:
+                report.write(f"{size / 1024:10.1f} KiB  {site}\n")
+        report_path = self.directory / "report.txt"
+        report_path.write_text(report.getvalue(), encoding="utf-8")
+        paths.append(report_path)
+        return paths
\ No newline at end of file
@@ -1,30 +1,171 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from src.utils.metrics import RATE_LIMIT_PER_MINUTE, RATE_LIMIT_WAIT_SECONDS
+
+LOGGER = logging.getLogger(__name__)
+
+@dataclass
+class _Bucket:
+    tokens: float
+    updated: float
 
 @dataclass
 class RateLimiter:
     """
-    A simple thread-safe rate limiter for approximate N requests per minute.
+    A thread-safe token bucket allowing ``max_per_minute`` requests on average
+    and bursts of up to ``burst`` requests.
+
+    With ``per_host`` enabled every host gets its own bucket. Callers reserve
+    a token under the lock and sleep outside it, so waiting threads do not
+    serialize behind each other. ``max_per_minute <= 0`` disables limiting.
     """
 
     max_per_minute: int
-    _lock: threading.Lock = threading.Lock()
-    _last_acquire: float = 0.0
+    burst: int = 1
+    per_host: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _buckets: Dict[str, _Bucket] = field(default_factory=dict, init=False, repr=False)
+
+    @property
+    def current_per_minute(self) -> float:
+        return float(self.max_per_minute)
 
     @property
     def min_interval(self) -> float:
-        if self.max_per_minute <= 0:
+        rate = self.current_per_minute
+        if rate <= 0:
+            return 0.0
+        return 60.0 / rate
+
+    def _bucket(self, host: Optional[str], now: float) -> _Bucket:
+        key = (host or "") if self.per_host else ""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(tokens=float(max(self.burst, 1)), updated=now)
+        return bucket
+
+    def _reserve(self, host: Optional[str]) -> float:
+        """
+        Take a token, returning how long the caller must wait before using it.
+
+        The bucket may go negative: each waiter reserves its own future slot.
+        A bucket whose ``updated`` lies in the future is paused until then.
+        """
+        interval = self.min_interval
+        if interval <= 0:
             return 0.0
-        return 60.0 / float(self.max_per_minute)
+        capacity = float(max(self.burst, 1))
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+            if now > bucket.updated:
+                bucket.tokens = min(capacity, bucket.tokens + (now - bucket.updated) / interval)
+                bucket.updated = now
+            bucket.tokens -= 1.0
+            return (bucket.updated - now) + max(0.0, -bucket.tokens) * interval
+
+    def acquire(self, host: Optional[str] = None) -> None:
+        wait_for = self._reserve(host)
+        RATE_LIMIT_WAIT_SECONDS.observe(wait_for)
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+    async def aacquire(self, host: Optional[str] = None) -> None:
+        wait_for = self._reserve(host)
+        RATE_LIMIT_WAIT_SECONDS.observe(wait_for)
+        if wait_for > 0:
+            await asyncio.sleep(wait_for)
+
+    def pause(self, seconds: float, host: Optional[str] = None) -> None:
+        """
+        Hold back new tokens for ``seconds``, e.g. to honor a Retry-After header.
+        """
+        if seconds <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+            resume_at = now + seconds
+            if resume_at > bucket.updated:
+                bucket.updated = resume_at
+                bucket.tokens = min(bucket.tokens, 1.0)
+
+    def record_success(self, host: Optional[str] = None) -> None:
+        """
+        Feedback hook called by HttpClient after a successful response.
+        """
+
+    def record_throttle(self, host: Optional[str] = None, retry_after: Optional[float] = None) -> None:
+        """
+        Feedback hook called by HttpClient after a 429/503 or a timeout.
+        """
+        if retry_after:
+            self.pause(retry_after, host)
+
+@dataclass
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    A RateLimiter whose rate follows AIMD (additive increase, multiplicative
+    decrease) feedback from HttpClient.
+
+    The rate starts at ``max_per_minute``, grows by ``increase_per_minute``
+    after every success and is multiplied by ``decrease_factor`` on 429/503
+    responses and timeouts, always staying within ``floor_per_minute`` and
+    ``ceiling_per_minute``. Throttles within ``decrease_cooldown`` seconds of
+    the last decrease are treated as the same congestion event, so a wave of
+    concurrent 429s only cuts the rate once. Retry-After is honored by pausing
+    the bucket.
+    """
+
+    floor_per_minute: float = 5.0
+    ceiling_per_minute: float = 120.0
+    increase_per_minute: float = 1.0
+    decrease_factor: float = 0.5
+    decrease_cooldown: float = 5.0
+    _rate: float = field(default=0.0, init=False, repr=False)
+    _last_decrease: float = field(default=float("-inf"), init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not 0 < self.floor_per_minute <= self.ceiling_per_minute:
+            raise ValueError("expected 0 < floor_per_minute <= ceiling_per_minute")
+        if not 0 < self.decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self._rate = self._clamp(float(self.max_per_minute))
+        RATE_LIMIT_PER_MINUTE.set(self._rate)
+
+    def _clamp(self, rate: float) -> float:
+        return min(self.ceiling_per_minute, max(self.floor_per_minute, rate))
+
+    @property
+    def current_per_minute(self) -> float:
+        return self._rate
+
+    def record_success(self, host: Optional[str] = None) -> None:
+        with self._lock:
+            self._rate = self._clamp(self._rate + self.increase_per_minute)
+            RATE_LIMIT_PER_MINUTE.set(self._rate)
 
-    def acquire(self) -> None:
+    def record_throttle(self, host: Optional[str] = None, retry_after: Optional[float] = None) -> None:
         with self._lock:
             now = time.monotonic()
-            elapsed = now - self._last_acquire
-            wait_for = self.min_interval - elapsed
-            if wait_for > 0:
-                time.sleep(wait_for)
-            self._last_acquire = time.monotonic()
\ No newline at end of file
+            previous = self._rate
+            decreased = now - self._last_decrease >= self.decrease_cooldown
+            if decreased:
+                self._rate = self._clamp(self._rate * self.decrease_factor)
+                self._last_decrease = now
+                RATE_LIMIT_PER_MINUTE.set(self._rate)
+        if decreased:
+            LOGGER.info(
+                "Throttled%s; request rate %.1f -> %.1f per minute",
+                f" by {host}" if host else "",
+                previous,
+                self._rate,
+            )
+        super().record_throttle(host, retry_after)
\ No newline at end of file
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import FrozenSet, Optional, Tuple, Type
+
+import requests
+
+DEFAULT_RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+DEFAULT_RETRY_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    ConnectionError,
+)
+
+class HttpStatusError(RuntimeError):
+    """
+    A request finished with a non-success status code.
+    """
+
+    def __init__(self, status_code: int, url: str) -> None:
+        super().__init__(f"Unexpected status code {status_code}")
+        self.status_code = status_code
+        self.url = url
+
+class PermanentHttpError(HttpStatusError):
+    """
+    A non-retryable status such as 404 or 410; the URL was not retried.
+    """
+
+@dataclass
+class RetryPolicy:
+    """
+    Decides which failures are retried and how long to wait in between.
+
+    Backoff uses full jitter: a uniform delay between 0 and
+    ``min(max_backoff, backoff_factor * 2 ** (attempt - 1))``. A Retry-After
+    value from the server raises the delay to at least that long. ``deadline``
+    caps the total time spent on one URL across all attempts, in seconds.
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    deadline: Optional[float] = 120.0
+    retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES
+    retry_exceptions: Tuple[Type[BaseException], ...] = field(
+        default=DEFAULT_RETRY_EXCEPTIONS
+    )
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def is_retryable_exception(self, exc: BaseException) -> bool:
+        return isinstance(exc, self.retry_exceptions)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        ceiling = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        delay = random.uniform(0, ceiling) if self.jitter else ceiling
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
\ No newline at end of file
@@ -0,0 +1,5 @@
+# Outcomes of a processed URL, shared by the run journal and the job queue.
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+# Failed with a non-retryable status (e.g. 404); not worth retrying on resume.
+STATUS_PERMANENT = "permanent"
\ No newline at end of file
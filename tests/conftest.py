@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+import pytest
+
+SAMPLE_OUTPUT = Path(__file__).resolve().parents[1] / "data" / "sample_output.json"
+
+@pytest.fixture
+def sample_records() -> list:
+    """
+    The records of data/sample_output.json, loaded afresh for each test.
+    """
+    with SAMPLE_OUTPUT.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+@pytest.fixture
+def company_records(sample_records) -> list:
+    """
+    Five copies of the first sample record with distinct ids; company ``i``
+    has ``i + 1`` times the sample's investments.
+    """
+    record = sample_records[0]
+    records = []
+    for i in range(5):
+        copy = dict(record, id=f"{i}-00", url=f"https://pitchbook.com/profiles/company/{i}-00")
+        copy["all_investments"] = record["all_investments"] * (i + 1)
+        records.append(copy)
+    return records
+
+class _StubClient:
+    """
+    Stand-in for PitchBookClient in runner tests, serving pages from ``fetch``.
+    """
+
+    def __init__(self, fetch: Callable[[str], str]) -> None:
+        self.fetch_company_profile = fetch
+        self.http_client = SimpleNamespace(
+            cache=None,
+            rate_limiter=None,
+            pool_stats=lambda: {"pools": 0, "connections": 0, "requests": 0, "reused": 0},
+        )
+
+    def profile_url(self, company_id: str) -> str:
+        return f"https://pitchbook.com/profiles/company/{company_id}"
+
+    def fetch_profile_response(self, url_or_id: str) -> SimpleNamespace:
+        html = self.fetch_company_profile(url_or_id)
+        return SimpleNamespace(url=url_or_id, text=html, not_modified=False)
+
+@pytest.fixture
+def stub_client() -> Callable[[Callable[[str], str]], _StubClient]:
+    """
+    Factory for stand-in PitchBookClients; call it with the page fetch function.
+    """
+    return _StubClient
\ No newline at end of file
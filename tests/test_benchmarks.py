@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from benchmarks.bench_suite import compare, run_suite
+from benchmarks.synthetic_pages import PAGE_SIZES, generate_page, profile_url
+from src.runner import build_record
+
+def test_synthetic_pages_have_the_requested_shape():
+    spec = PAGE_SIZES["medium"]
+    html = generate_page(spec, company_id="1000-1")
+
+    record = build_record(html, profile_url("1000-1"))
+
+    assert record["id"] == "1000-1"
+    assert len(record["all_investments"]) == spec.investments
+    assert len(record["competitors"]) == spec.competitors
+    assert len(record["investors"]) == spec.investors
+    assert len(record["company_socials"]) == 3
+    assert generate_page(spec, company_id="1000-1") == html
+
+def test_suite_results_compare_between_runs(capsys):
+    current = run_suite(["small"], ["html.parser"], repeat=1)
+    cases = {result["case"] for result in current["results"]}
+    assert {"parse", "investments", "faq", "build_record", "process_url"} <= cases
+
+    def scaled(factor: float) -> dict:
+        results = [
+            dict(result, median_ms=result["median_ms"] * factor) for result in current["results"]
+        ]
+        return {"meta": {"commit": "abc123"}, "results": results}
+
+    slower, faster = scaled(10), scaled(0.1)
+    assert compare(current, slower, 0.1) == 0
+    assert compare(current, faster, 0.1) == len(current["results"])
+    assert "REGRESSION" in capsys.readouterr().out
\ No newline at end of file
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import time
+import zlib
+from typing import Optional
+
+import pytest
+import requests
+
+from src.utils.cache import CacheMiss, ResponseCache, normalize_cache_key
+from src.utils.http import HttpClient
+
+def _response(url: str, text: str, status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.encoding = "utf-8"
+    response._content = text.encode("utf-8")
+    return response
+
+class _CountingSession:
+    def __init__(self) -> None:
+        self.headers: dict = {}
+        self.calls = 0
+
+    def get(self, url: str, timeout: int, **_: object) -> requests.Response:
+        self.calls += 1
+        return _response(url, f"<html><body>{url}</body></html>")
+
+def test_normalize_cache_key_collapses_equivalent_urls():
+    assert normalize_cache_key("HTTPS://PitchBook.com/profiles/company/1-1/") == normalize_cache_key(
+        "https://pitchbook.com/profiles/company/1-1#faq"
+    )
+    assert normalize_cache_key("https://x.test/a?b=2&a=1") == "https://x.test/a?a=1&b=2"
+
+def test_cache_hits_expires_and_evicts_least_recently_used(tmp_path):
+    big = "".join(chr(0x4E00 + (i * 7919) % 20000) for i in range(3000))
+    entry_size = len(zlib.compress((big + "b").encode("utf-8")))
+    max_bytes = 2 * entry_size + 100
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds=60, max_bytes=max_bytes)
+    cache.put("https://x.test/a", _response("https://x.test/a", "alpha"))
+
+    hit = cache.get("https://x.test/a/")
+    assert hit is not None and hit.to_response().text == "alpha"
+    assert cache.get("https://x.test/missing") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get("https://x.test/a") is None
+
+    cache.ttl_seconds = None
+    for name in ("b", "c", "d"):
+        cache.put(f"https://x.test/{name}", _response(f"https://x.test/{name}", big + name))
+        cache.get("https://x.test/b")
+    assert cache.get("https://x.test/b") is not None
+    assert cache.get("https://x.test/c") is None
+    assert cache.stats()["bytes"] <= max_bytes
+    cache.close()
+
+def test_http_client_serves_repeat_requests_from_cache_and_offline(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    session = _CountingSession()
+    client = HttpClient(base_url="https://x.test", user_agent="t", session=session, cache=cache)
+
+    first = client.get("/profiles/company/1-1")
+    second = client.get("https://x.test/profiles/company/1-1")
+    assert session.calls == 1
+    assert second.text == first.text
+
+    offline = HttpClient(
+        base_url="https://x.test", user_agent="t", session=session, cache=cache, offline=True
+    )
+    assert offline.get("/profiles/company/1-1").text == first.text
+    with pytest.raises(CacheMiss):
+        offline.get("/profiles/company/2-2")
+    assert session.calls == 1
+
+class _RevalidatingSession:
+    def __init__(self) -> None:
+        self.headers: dict = {}
+        self.conditional: list = []
+
+    def get(self, url: str, timeout: int, headers: Optional[dict] = None, **_: object):
+        self.conditional.append(dict(headers or {}))
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return _response(url, "", status_code=304)
+        response = _response(url, "<html><body>v1</body></html>")
+        response.headers["ETag"] = '"v1"'
+        response.headers["Last-Modified"] = "Wed, 21 Oct 2026 07:28:00 GMT"
+        return response
+
+def test_expired_entries_are_revalidated_with_validators(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds=0)
+    session = _RevalidatingSession()
+    client = HttpClient(base_url="https://x.test", user_agent="t", session=session, cache=cache)
+
+    first = client.get("/profiles/company/1-1")
+    assert not getattr(first, "not_modified", False)
+    cache.put_record(first.url, {"url": "1-1", "company_name": "Cached"})
+
+    time.sleep(0.01)
+    second = client.get("/profiles/company/1-1")
+
+    assert session.conditional[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT",
+    }
+    assert second.not_modified is True
+    assert second.text == first.text
+    assert cache.revalidations == 1
+    assert cache.get_record(second.url) == {"url": "1-1", "company_name": "Cached"}
\ No newline at end of file
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any
 
+import pytest
+
 from src.clients.pitchbook_client import PitchBookClient
-from src.utils.http import HttpClient
+from src.utils.http import HttpClient, ResponseTooLargeError
 from src.utils.rate_limiter import RateLimiter
+from src.utils.retry import HttpStatusError, PermanentHttpError, RetryPolicy
 
 class _FakeResponse:
     def __init__(self, url: str, text: str, status_code: int = 200) -> None:
         self.url = url
         self.text = text
         self.status_code = status_code
+        self.headers: dict[str, str] = {}
+
+    def iter_content(self, chunk_size: int) -> list[bytes]:
+        return [self.text.encode("utf-8")]
+
+    def close(self) -> None:
+        pass
 
 class _FakeSession:
     def __init__(self) -> None:
@@ -37,4 +51,125 @@ def test_pitchbook_client_fetch_uses_http_client_and_normalizes_id():
     assert "profiles/company/361831-87" in html
 
     html2 = client.fetch_company_profile("https://pitchbook.com/profiles/company/123")
-    assert "profiles/company/123" in html2
\ No newline at end of file
+    assert "profiles/company/123" in html2
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits: dict[str, int] = {}
+
+    def do_GET(self) -> None:  # noqa: N802
+        company_id = self.path.rsplit("/", 1)[-1]
+        hits = _StubHandler.hits
+        hits[company_id] = hits.get(company_id, 0) + 1
+        if company_id == "missing":
+            status = 404
+        elif company_id == "flaky" and hits[company_id] == 1:
+            status = 503
+        else:
+            status = 200
+        body = f"<html><body><h1>{company_id}</h1></body></html>".encode("utf-8")
+        if company_id == "huge":
+            body = b"<html>" + b"x" * 200_000 + b"</html>"
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if company_id == "gzipped":
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: Any) -> None:
+        pass
+
+@pytest.fixture()
+def stub_server():
+    _StubHandler.hits = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def test_afetch_many_yields_every_result_with_retries(stub_server):
+    http_client = HttpClient(
+        base_url=stub_server,
+        user_agent="test-agent",
+        timeout=5,
+        rate_limiter=RateLimiter(max_per_minute=0),
+        backoff_factor=0.01,
+    )
+    client = PitchBookClient(http_client=http_client)
+    ids = ["361831-87", "flaky", "missing"] + [f"{i}-00" for i in range(10)]
+
+    async def collect():
+        return [result async for result in client.afetch_many(ids, concurrency=4)]
+
+    results = {result.url_or_id: result for result in asyncio.run(collect())}
+
+    assert set(results) == set(ids)
+    assert "<h1>361831-87</h1>" in results["361831-87"].html
+    assert results["flaky"].ok and _StubHandler.hits["flaky"] == 2
+    # 404 is permanent, so it fails fast instead of using every attempt.
+    assert isinstance(results["missing"].error, PermanentHttpError)
+    assert _StubHandler.hits["missing"] == 1
+
+def test_pooled_connections_are_reused_and_bodies_are_capped(stub_server):
+    http_client = HttpClient(
+        base_url=stub_server,
+        user_agent="test-agent",
+        timeout=5,
+        pool_size=2,
+        max_body_bytes=100_000,
+    )
+    client = PitchBookClient(http_client=http_client)
+
+    for i in range(5):
+        assert f"<h1>{i}-00</h1>" in client.fetch_company_profile(f"{i}-00")
+    assert "<h1>gzipped</h1>" in client.fetch_company_profile("gzipped")
+    with pytest.raises(ResponseTooLargeError):
+        client.fetch_company_profile("huge")
+    assert _StubHandler.hits["huge"] == 1
+
+    stats = http_client.pool_stats()
+    assert stats["requests"] == 7
+    assert stats["reused"] >= 5
+    assert "gzip" in http_client.session.headers["Accept-Encoding"]
+
+class _ScriptedSession:
+    def __init__(self, statuses: list) -> None:
+        self.headers: dict[str, Any] = {}
+        self.statuses = statuses
+        self.calls = 0
+
+    def get(self, url: str, timeout: float, **_: Any) -> _FakeResponse:
+        status = self.statuses[min(self.calls, len(self.statuses) - 1)]
+        self.calls += 1
+        return _FakeResponse(url=url, text="", status_code=status)
+
+def test_retry_policy_fails_fast_on_permanent_status_and_enforces_deadline():
+    gone = _ScriptedSession([410])
+    client = HttpClient(base_url="https://x.test", user_agent="t", session=gone)
+    with pytest.raises(PermanentHttpError):
+        client.get("/profiles/company/dead")
+    assert gone.calls == 1
+
+    flaky = _ScriptedSession([503])
+    client = HttpClient(
+        base_url="https://x.test",
+        user_agent="t",
+        session=flaky,
+        retry_policy=RetryPolicy(max_attempts=50, backoff_factor=0.05, jitter=False, deadline=0.3),
+    )
+    with pytest.raises(HttpStatusError) as excinfo:
+        client.get("/profiles/company/flaky")
+    assert not isinstance(excinfo.value, PermanentHttpError)
+    assert 2 <= flaky.calls < 10
+
+def test_full_jitter_backoff_respects_cap_and_retry_after():
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=4.0)
+    delays = [policy.backoff(10) for _ in range(200)]
+    assert all(0 <= delay <= 4.0 for delay in delays)
+    assert len(set(delays)) > 1
+    assert policy.backoff(1, retry_after=7.0) >= 7.0
\ No newline at end of file
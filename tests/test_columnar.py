@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import csv
+
+import pytest
+
+from src.outputs.columnar import ColumnarSink
+
+def test_csv_tables_are_normalized_by_company_id(tmp_path, company_records):
+    records = company_records
+    with ColumnarSink(tmp_path, fmt="csv", batch_rows=4) as sink:
+        for record in records:
+            sink.write(record)
+
+    with (tmp_path / "investments" / "part-00000.csv").open(encoding="utf-8", newline="") as f:
+        investments = list(csv.DictReader(f))
+    assert len(investments) == sum(len(record["all_investments"]) for record in records)
+    assert [row["company_id"] for row in investments[:3]] == ["0-00", "1-00", "1-00"]
+    assert investments[0]["deal_type"] == records[0]["all_investments"][0]["deal_type"]
+
+    with (tmp_path / "companies" / "part-00000.csv").open(encoding="utf-8", newline="") as f:
+        companies = list(csv.DictReader(f))
+    assert [row["id"] for row in companies] == [record["id"] for record in records]
+    contacts = (tmp_path / "contacts" / "part-00000.csv").read_text(encoding="utf-8")
+    assert "social,www.facebook.com" in contacts
+
+def test_parquet_tables_stream_in_row_groups_and_resume_as_new_parts(tmp_path, company_records):
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    records = company_records
+    with ColumnarSink(tmp_path, fmt="parquet", batch_rows=4) as sink:
+        for record in records:
+            sink.write(record)
+    with ColumnarSink(tmp_path, fmt="parquet", resume=True) as sink:
+        sink.write(records[0])
+
+    first = pyarrow_parquet.ParquetFile(tmp_path / "investments" / "part-00000.parquet")
+    assert first.metadata.num_rows == 15
+    assert first.num_row_groups > 1
+    assert (tmp_path / "investments" / "part-00001.parquet").exists()
+
+    # Column-selective scan over the whole dataset.
+    table = pyarrow_parquet.read_table(tmp_path / "companies", columns=["id", "year_founded"])
+    assert table.column_names == ["id", "year_founded"]
+    assert table.column("id").to_pylist() == [record["id"] for record in records] + ["0-00"]
+    assert str(table.schema.field("year_founded").type) == "int64"
+
+def test_a_fresh_run_replaces_the_parts_of_earlier_runs(tmp_path, company_records):
+    records = company_records
+    for _ in range(2):
+        with ColumnarSink(tmp_path, fmt="csv") as sink:
+            for record in records:
+                sink.write(record)
+
+    assert [path.name for path in (tmp_path / "companies").iterdir()] == ["part-00000.csv"]
+    with ColumnarSink(tmp_path, fmt="csv", resume=True) as sink:
+        sink.write(records[0])
+    assert sorted(path.name for path in (tmp_path / "companies").iterdir()) == [
+        "part-00000.csv",
+        "part-00001.csv",
+    ]
\ No newline at end of file
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from src.clients.pitchbook_client import canonical_company_id
+from src.utils.dedupe import SeenSet
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "361831-87",
+        " 361831-87 ",
+        "https://pitchbook.com/profiles/company/361831-87",
+        "https://PitchBook.com/profiles/company/361831-87/",
+        "http://pitchbook.com/profiles/company/361831-87?tab=faq#deals",
+        "pitchbook.com/profiles/company/361831-87/investments",
+    ],
+)
+def test_canonical_company_id_accepts_ids_and_profile_urls(value):
+    assert canonical_company_id(value) == "361831-87"
+
+@pytest.mark.parametrize("value", ["", "https://pitchbook.com/profiles/investor/1-2", "a b"])
+def test_canonical_company_id_rejects_other_inputs(value):
+    assert canonical_company_id(value) is None
+
+def test_seen_set_spills_to_disk_and_stays_exact(tmp_path):
+    with SeenSet(max_memory_items=3, directory=str(tmp_path)) as seen:
+        added = [seen.add(f"id-{i % 5}") for i in range(12)]
+        assert added == [True] * 5 + [False] * 7
+        assert seen.spilled
+        assert len(seen) == 5
+        assert "id-4" in seen and "id-9" not in seen
+    assert os.listdir(tmp_path) == []
\ No newline at end of file
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.models.company_profile import CompanyProfile
+from src.models.investment_record import InvestmentRecord
+from src.outputs.exporters import (
+    JSON_BACKENDS,
+    JsonlSink,
+    PrettyJsonSink,
+    RecordWriter,
+    check_json_backend,
+    encode_record,
+)
+
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_pretty_json_sink_matches_json_dump(tmp_path, sample_records, count):
+    records = (sample_records * 3)[:count]
+    path = tmp_path / "out.json"
+
+    with PrettyJsonSink(path) as sink:
+        for record in records:
+            sink.write(record)
+
+    expected = json.dumps(records, indent=2, ensure_ascii=False)
+    assert path.read_text(encoding="utf-8") == expected
+
+def test_jsonl_sink_writes_each_record_immediately_and_appends(tmp_path, sample_records):
+    record = sample_records[0]
+    path = tmp_path / "out.jsonl"
+
+    with JsonlSink(path) as sink:
+        sink.write(record)
+        assert path.read_text(encoding="utf-8").count("\n") == 1
+    with JsonlSink(path, append=True) as sink:
+        sink.write(record)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [record, record]
+
+def test_sinks_serialize_slotted_models_like_their_dicts(tmp_path, sample_records):
+    record = sample_records[0]
+    fields = dict(record)
+    fields["all_investments"] = [InvestmentRecord(**deal) for deal in record["all_investments"]]
+    profile = CompanyProfile(**fields)
+    assert not hasattr(profile, "__dict__")
+    assert not hasattr(profile.all_investments[0], "__dict__")
+    assert profile.to_dict() == record
+
+    for sink_type, name in ((JsonlSink, "out.jsonl"), (PrettyJsonSink, "out.json")):
+        with sink_type(tmp_path / f"model-{name}") as sink:
+            sink.write(profile)
+        with sink_type(tmp_path / f"dict-{name}") as sink:
+            sink.write(record)
+        model_bytes = (tmp_path / f"model-{name}").read_bytes()
+        assert model_bytes == (tmp_path / f"dict-{name}").read_bytes()
+
+def _tricky_records(sample_records: list) -> list:
+    record = dict(sample_records[0])
+    record["description"] = 'Line one\nline two\t"quoted" \\ caf\u00e9 \u2603 \U0001f600 \u2028 \x00\x1f\x7f ,\n  x'
+    record["faq"] = [{"type": "Question", "value": "[] {} , : \\n"}]
+    record["investors"] = []
+    record["patents"] = {"nested": {"empty": {}, "list": [[], [1, -2, None, True]]}}
+    return sample_records + [record]
+
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+def test_single_serialization_is_byte_identical_to_json_dumps(tmp_path, sample_records, backend):
+    try:
+        check_json_backend(backend)
+    except ImportError:
+        pytest.skip(f"{backend} is not installed")
+    records = _tricky_records(sample_records)
+
+    for record in records:
+        encoded = encode_record(record, backend)
+        assert encoded.pretty == json.dumps(record, indent=2, ensure_ascii=False).encode("utf-8")
+        assert encoded.compact == json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+    jsonl_path = tmp_path / "out.jsonl"
+    pretty_path = tmp_path / "out.json"
+    with JsonlSink(jsonl_path, json_backend=backend) as jsonl_sink, PrettyJsonSink(
+        pretty_path, json_backend=backend
+    ) as pretty_sink:
+        writer = RecordWriter([jsonl_sink, pretty_sink], json_backend=backend)
+        for record in records:
+            writer.write(record)
+
+    expected_jsonl = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    assert jsonl_path.read_text(encoding="utf-8") == expected_jsonl
+    expected_pretty = json.dumps(records, indent=2, ensure_ascii=False)
+    assert pretty_path.read_text(encoding="utf-8") == expected_pretty
\ No newline at end of file
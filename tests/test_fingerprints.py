@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from src.utils.fingerprints import FingerprintStore, page_fingerprint, record_fingerprint
+
+_PAGE = """
+<html><head>
+  <meta name="csrf-token" content="{token}">
+  <style>.a {{ color: red }}</style>
+  <script nonce="{token}">window.requestId = "{token}";</script>
+  <script type="application/ld+json">{{"name": "{name}"}}</script>
+</head>
+<body data-request-id="{token}"><!-- rendered {token} -->
+  <h1>{name}</h1>
+</body></html>
+"""
+
+def test_page_fingerprint_ignores_volatile_markup_but_not_content():
+    first = page_fingerprint(_PAGE.format(token="abc", name="Acme"))
+    again = page_fingerprint(_PAGE.format(token="xyz", name="Acme").replace("  ", "    "))
+    renamed = page_fingerprint(_PAGE.format(token="abc", name="Acme Corp"))
+
+    assert first == again
+    assert first != renamed
+    assert first != page_fingerprint(_PAGE.format(token="abc", name="Acme"), salt="lxml")
+
+def test_record_fingerprint_ignores_key_order():
+    assert record_fingerprint({"a": 1, "b": [1, 2]}) == record_fingerprint({"b": [1, 2], "a": 1})
+    assert record_fingerprint({"a": 1}) != record_fingerprint({"a": 2})
+
+def test_store_reuses_records_and_tracks_changes_across_sessions(tmp_path):
+    url = "https://pitchbook.com/profiles/company/1-1"
+    html = _PAGE.format(token="abc", name="Acme")
+    record = {"url": url, "company_name": "Acme"}
+
+    with FingerprintStore(tmp_path / "fp.sqlite", salt="html.parser") as store:
+        previous, page_hash = store.reuse(url, html)
+        assert previous is None
+        store.remember(url, page_hash, record)
+        assert store.record_changed(url, record)
+
+    with FingerprintStore(tmp_path / "fp.sqlite", salt="html.parser") as store:
+        assert store.reuse(url, _PAGE.format(token="new", name="Acme")) == (record, page_hash)
+        assert store.reuse(url, _PAGE.format(token="new", name="Acme Corp"))[0] is None
+        assert not store.record_changed(url, dict(record))
+        assert store.record_changed(url, {**record, "company_name": "Acme Corp"})
+        assert store.stats() == {"reused": 1, "parsed": 0, "changed": 1, "unchanged": 1}
+
+    with FingerprintStore(tmp_path / "fp.sqlite", salt="lxml") as store:
+        # Another parser backend may extract differently, so nothing is reused.
+        assert store.reuse(url, html)[0] is None
\ No newline at end of file
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+
+import pytest
+
+from src.utils.inputs import load_inputs, parse_shard, shard_of
+
+IDS = [f"1000-{i}" for i in range(5)]
+
+def test_load_inputs_reads_text_jsonl_and_csv(tmp_path):
+    text = tmp_path / "inputs.txt"
+    text.write_text("# header\n" + "\n".join(IDS) + "\n\n", encoding="utf-8")
+    jsonl = tmp_path / "inputs.jsonl"
+    jsonl.write_text(
+        "\n".join(json.dumps({"name": f"Co {i}", "company_id": id_}) for i, id_ in enumerate(IDS)),
+        encoding="utf-8",
+    )
+    csv_path = tmp_path / "inputs.csv"
+    csv_path.write_text(
+        "name,url\n" + "\n".join(f"Co,https://pitchbook.com/profiles/company/{id_}" for id_ in IDS),
+        encoding="utf-8",
+    )
+
+    assert list(load_inputs(text)) == IDS
+    assert list(load_inputs(jsonl)) == IDS
+    assert list(load_inputs(jsonl, id_column="name")) == [f"Co {i}" for i in range(5)]
+    assert [value.rsplit("/", 1)[1] for value in load_inputs(csv_path)] == IDS
+    with pytest.raises(ValueError):
+        list(load_inputs(csv_path, id_column="missing"))
+
+def test_load_inputs_streams_compressed_files(tmp_path):
+    gz_path = tmp_path / "inputs.csv.gz"
+    with gzip.open(gz_path, "wt", encoding="utf-8") as handle:
+        handle.write("id\n" + "\n".join(IDS))
+    assert list(load_inputs(gz_path)) == IDS
+
+    zstandard = pytest.importorskip("zstandard")
+    zst_path = tmp_path / "inputs.txt.zst"
+    zst_path.write_bytes(zstandard.ZstdCompressor().compress("\n".join(IDS).encode("utf-8")))
+    assert list(load_inputs(zst_path)) == IDS
+
+def test_shards_partition_ids_deterministically():
+    ids = [f"{i}-{i % 97}" for i in range(2000)]
+    shards = [shard_of(id_, 4) for id_ in ids]
+    assert shards == [shard_of(id_, 4) for id_ in ids]
+    counts = [shards.count(i) for i in range(4)]
+    assert sum(counts) == len(ids)
+    assert min(counts) > 400
+    assert parse_shard("2/4") == (2, 4)
+    for bad, reason in (
+        ("4/4", "must be < count"),
+        ("-1/4", "must not be negative"),
+        ("1", "two integers"),
+        ("a/b", "two integers"),
+        ("0/0", "at least 1"),
+    ):
+        with pytest.raises(argparse.ArgumentTypeError, match=reason):
+            parse_shard(bad)
\ No newline at end of file
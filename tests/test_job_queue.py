@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import time
+
+import pytest
+
+from src import runner
+from src.utils.job_queue import JobQueue
+from src.utils.retry import PermanentHttpError
+
+def test_leases_expire_and_failures_are_retried_then_given_up(tmp_path):
+    path = tmp_path / "jobs.sqlite"
+    with JobQueue(path, lease_seconds=0.05, max_attempts=2) as queue:
+        assert queue.seed(["a", "b", "c"]) == 3
+        assert queue.seed(["a", "d"]) == 1
+
+        assert queue.claim("w1", 2) == ["a", "b"]
+        assert queue.claim("w2", 10) == ["c", "d"]
+        time.sleep(0.1)
+        # w1 stalled: its jobs are reclaimed by w2 and w1 can no longer finish them.
+        assert sorted(queue.claim("w2", 10)) == ["a", "b", "c", "d"]
+        assert not queue.complete("a", "w1")
+        assert queue.complete("a", "w2")
+        assert queue.fail("b", "w2", "boom")
+        assert queue.fail("c", "w2", "gone", permanent=True)
+        assert queue.complete("d", "w2")
+
+        assert queue.claim("w2", 10) == []
+        counts = queue.counts()
+        assert counts["done"] == 2
+        assert counts["failed"] == 1
+        assert counts["permanent"] == 1
+        assert counts["retries"] == 4
+        assert not queue.has_unfinished()
+
+def test_queue_commands_keep_earlier_options_and_reject_ones_they_ignore(capsys):
+    args = runner.parse_args(["--workers", "4", "--offline", "work", "--queue", "q"])
+    assert (args.command, args.workers, args.offline, args.queue) == ("work", 4, True, "q")
+    args = runner.parse_args(["--shard", "0/2", "seed", "--queue", "q", "--input", "ids.txt"])
+    assert (args.shard, args.input) == ((0, 2), "ids.txt")
+
+    for argv in (
+        ["--resume", "work", "--queue", "q"],
+        ["work", "--queue", "q", "--sqlite", "out.db"],
+        ["--output", "out.json", "seed", "--queue", "q"],
+        ["seed", "--queue", "q", "--workers", "2"],
+    ):
+        with pytest.raises(SystemExit):
+            runner.parse_args(argv)
+
+    with pytest.raises(SystemExit):
+        runner.parse_args(["--shard", "2/2", "seed", "--queue", "q", "--input", "ids.txt"])
+    assert "shard index i must be < count N" in capsys.readouterr().err
+
+def _fetch_page(url: str) -> str:
+    time.sleep(0.001)
+    if url.endswith("-13"):
+        raise PermanentHttpError(404, url)
+    return f"<html><body><h1 data-test='company-name'>{url}</h1></body></html>"
+
+def _work(queue_path, output_path, config_path, worker_id):
+    runner.work_queue(
+        queue_path, output_path, config_path, worker_id=worker_id, batch_size=5
+    )
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_seed_and_several_work_processes_process_each_job_once(
+    tmp_path, monkeypatch, stub_client
+):
+    monkeypatch.setattr(runner, "build_client", lambda settings: stub_client(_fetch_page))
+    input_path = tmp_path / "inputs.txt"
+    input_path.write_text("\n".join(f"1000-{i}" for i in range(40)) + "\n1000-0\n", encoding="utf-8")
+    queue_path = tmp_path / "jobs.sqlite"
+    output_path = tmp_path / "out" / "records.json"
+    config_path = tmp_path / "missing-settings.json"
+
+    assert runner.seed_queue(input_path, queue_path, config_path) == 40
+
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_work, args=(queue_path, output_path, config_path, f"w{i}"))
+        for i in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    urls = []
+    for jsonl_path in sorted(output_path.parent.glob("records.w*.jsonl")):
+        urls.extend(json.loads(line)["url"] for line in jsonl_path.read_text("utf-8").splitlines())
+    assert len(urls) == len(set(urls)) == 39
+    with JobQueue(queue_path) as queue:
+        counts = queue.counts()
+    assert counts["done"] == 39 and counts["permanent"] == 1 and counts["pending"] == 0
\ No newline at end of file
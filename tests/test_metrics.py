@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import urllib.request
+
+from src.utils.metrics import MetricsRegistry
+
+def test_counters_gauges_and_histograms_render_in_prometheus_format():
+    registry = MetricsRegistry()
+    responses = registry.counter("http_responses_total", "Responses.")
+    rate = registry.gauge("rate_per_minute", "Rate.")
+    latency = registry.histogram("stage_seconds", "Stage latency.", buckets=(0.01, 0.1, 1.0))
+
+    responses.inc(status="200")
+    responses.inc(2, status="200")
+    responses.inc(status="503")
+    rate.set(60)
+    rate.set(30.5)
+    for value in (0.005, 0.05, 0.05, 0.5, 5.0):
+        latency.observe(value, stage="parse")
+
+    text = registry.render_prometheus()
+    assert "# TYPE http_responses_total counter" in text
+    assert 'http_responses_total{status="200"} 3' in text
+    assert 'http_responses_total{status="503"} 1' in text
+    assert "# TYPE rate_per_minute gauge" in text
+    assert "rate_per_minute 30.5" in text
+    assert "# TYPE stage_seconds histogram" in text
+    assert 'stage_seconds_bucket{stage="parse",le="0.01"} 1' in text
+    assert 'stage_seconds_bucket{stage="parse",le="0.1"} 3' in text
+    assert 'stage_seconds_bucket{stage="parse",le="+Inf"} 5' in text
+    assert 'stage_seconds_count{stage="parse"} 5' in text
+    assert responses.by_label("status") == {"200": 3.0, "503": 1.0}
+
+    counts, total, count = latency.snapshot()[(("stage", "parse"),)]
+    assert count == 5 and abs(total - 5.605) < 1e-9
+    assert 0.01 < latency.quantile(0.5, counts) <= 0.1
+
+    registry.reset()
+    assert responses.total() == 0
+    assert rate.value() == 0
+    assert latency.snapshot() == {}
+
+def test_metrics_are_written_to_a_file_and_served(tmp_path):
+    registry = MetricsRegistry()
+    registry.counter("runs_total", "Runs.").inc()
+
+    registry.write_prometheus(tmp_path / "metrics" / "scraper.prom")
+    assert "runs_total 1" in (tmp_path / "metrics" / "scraper.prom").read_text("utf-8")
+
+    server = registry.serve(0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            assert response.status == 200
+            assert "runs_total 1" in response.read().decode("utf-8")
+    finally:
+        server.shutdown()
+        server.server_close()
\ No newline at end of file
@@ -1,43 +1,137 @@
 from __future__ import annotations
 
-from src.extractors.company_profile_parser import parse_company_profile
-from src.extractors.investments_parser import parse_investments
-from src.extractors.competitors_parser import parse_competitors
-from src.extractors.faq_parser import parse_faq
+import pytest
+
+from src.extractors.company_profile_parser import (
+    parse_company_profile,
+    parse_company_profile_page,
+)
+from src.extractors.investments_parser import parse_investments, parse_investments_page
+from src.extractors.competitors_parser import parse_competitors, parse_competitors_page
+from src.extractors.faq_parser import parse_faq, parse_faq_page
+from src.extractors.parsed_page import PARSER_BACKENDS, ParsedPage, check_parser_backend
 from src.models.company_profile import CompanyProfile
 
+PROFILE_HTML = """
+<html>
+  <head>
+    <title>Badia Spices - PitchBook</title>
+    <script type="application/ld+json">
+    {
+      "@context": "http://schema.org",
+      "@type": "Organization",
+      "@id": "361831-87",
+      "name": "Badia Spices",
+      "description": "Manufacturer and distributor of food ingredients based in Doral, Florida."
+    }
+    </script>
+  </head>
+  <body>
+    <p data-test="company-description">Manufacturer and distributor of food ingredients based in Doral, Florida.</p>
+    <table>
+      <tr><th>Founded</th><td>1967</td></tr>
+      <tr><th>Ownership Status</th><td>Private</td></tr>
+      <tr><th>Employees</th><td>101</td></tr>
+    </table>
+    <a href="https://www.facebook.com/BadiaSpices">Facebook</a>
+    <a href="https://twitter.com/badiaspices">Twitter</a>
+    <a href="https://www.linkedin.com/company/badia-spices-inc.">LinkedIn</a>
+    <ul>
+      <li data-type="Website">www.badiaspices.com</li>
+    </ul>
+  </body>
+</html>
+"""
+
+DEALS_HTML = """
+<html>
+  <body>
+    <div data-test="deal-summary">
+      <span>Latest deal type: Buyout/​LBO</span>
+    </div>
+    <table>
+      <tr>
+        <th>Company</th><th>Date</th><th>Deal Size</th><th>Deal Type</th><th>Industry</th>
+      </tr>
+      <tr>
+        <td>Tech Data (Warehouse in Sweetwater, Texas)</td>
+        <td>2020-11-03</td>
+        <td>n/a</td>
+        <td>Corporate Asset Purchase</td>
+        <td>Buildings and Property</td>
+      </tr>
+    </table>
+    <table>
+      <tr>
+        <th>Competitor</th><th>Status</th><th>Location</th>
+      </tr>
+      <tr>
+        <td><a href="https://pitchbook.com/profiles/company/233704-27">Louisiana Fish Fry</a></td>
+        <td>Private Equity-Backed</td>
+        <td>Baton Rouge, LA</td>
+      </tr>
+    </table>
+    <section>
+      <h2>FAQ</h2>
+      <div data-test="faq-item">
+        <h3 data-test="faq-question">When was Badia Spices founded?</h3>
+        <p data-test="faq-answer">Badia Spices was founded in 1967.</p>
+      </div>
+    </section>
+    <div data-test="investors">
+      <a>BDT &amp; MSD Partners</a>
+    </div>
+  </body>
+</html>
+"""
+
+LAYOUT_VARIANTS_HTML = """
+<html>
+  <body>
+    <h1 class="title company-name"> Louisiana <em>Fish</em> Fry </h1>
+    <dl><dt>Year Founded</dt><dd>1982</dd></dl>
+    <dl><dt>Employees</dt><dd>1,250 people</dd></dl>
+    <a href>Empty link</a>
+    <a href="https://x.com/fishfry">X</a>
+    <ul><li data-label="Corporate Office">Baton Rouge,&nbsp;LA</li><li data-label="Empty"> </li></ul>
+    <div data-test="faq-section">
+      <div>
+        <h4>Who owns <b>it</b>?</h4>
+        <h3>Where is Louisiana Fish Fry based?</h3>
+        <p>Baton Rouge, LA.</p>
+      </div>
+      <div><h3>No question here</h3></div>
+    </div>
+  </body>
+</html>
+"""
+
+INLINE_SCRIPTS_HTML = """
+<html>
+  <body>
+    <h1 data-test="company-name">Acme <!-- name --> Corp<script>var x=1;</script><style>.a{}</style></h1>
+    <table>
+      <tr><th>Competitor</th><th>Status<template>draft</template></th><th>Location</th></tr>
+      <tr>
+        <td><a href="https://pitchbook.com/profiles/company/1-11">Rival<script>track()</script></a></td>
+        <td>Private <!-- status --> Equity-Backed</td>
+        <td>Austin, TX<style>td{}</style></td>
+      </tr>
+    </table>
+    <section>
+      <h2>FAQ<script>faq()</script></h2>
+      <div>
+        <h3><script>var q = "Is this a question?";</script></h3>
+        <h3>Where is Acme based?</h3>
+        <p>Austin<script>a()</script>, TX.</p>
+      </div>
+    </section>
+  </body>
+</html>
+"""
+
 def test_company_profile_parsing_basic():
-    html = """
-    <html>
-      <head>
-        <title>Badia Spices - PitchBook</title>
-        <script type="application/ld+json">
-        {
-          "@context": "http://schema.org",
-          "@type": "Organization",
-          "@id": "361831-87",
-          "name": "Badia Spices",
-          "description": "Manufacturer and distributor of food ingredients based in Doral, Florida."
-        }
-        </script>
-      </head>
-      <body>
-        <p data-test="company-description">Manufacturer and distributor of food ingredients based in Doral, Florida.</p>
-        <table>
-          <tr><th>Founded</th><td>1967</td></tr>
-          <tr><th>Ownership Status</th><td>Private</td></tr>
-          <tr><th>Employees</th><td>101</td></tr>
-        </table>
-        <a href="https://www.facebook.com/BadiaSpices">Facebook</a>
-        <a href="https://twitter.com/badiaspices">Twitter</a>
-        <a href="https://www.linkedin.com/company/badia-spices-inc.">LinkedIn</a>
-        <ul>
-          <li data-type="Website">www.badiaspices.com</li>
-        </ul>
-      </body>
-    </html>
-    """
-    basics = parse_company_profile(html, "https://pitchbook.com/profiles/company/361831-87")
+    basics = parse_company_profile(PROFILE_HTML, "https://pitchbook.com/profiles/company/361831-87")
     assert basics["company_name"] == "Badia Spices"
     assert basics["year_founded"] == 1967
     assert basics["status"] == "Private"
@@ -46,59 +140,17 @@ def test_company_profile_parsing_basic():
     assert basics["contact_information"][0]["Type"] == "Website"
 
 def test_investments_and_competitors_and_faq():
-    html = """
-    <html>
-      <body>
-        <div data-test="deal-summary">
-          <span>Latest deal type: Buyout/​LBO</span>
-        </div>
-        <table>
-          <tr>
-            <th>Company</th><th>Date</th><th>Deal Size</th><th>Deal Type</th><th>Industry</th>
-          </tr>
-          <tr>
-            <td>Tech Data (Warehouse in Sweetwater, Texas)</td>
-            <td>2020-11-03</td>
-            <td>n/a</td>
-            <td>Corporate Asset Purchase</td>
-            <td>Buildings and Property</td>
-          </tr>
-        </table>
-        <table>
-          <tr>
-            <th>Competitor</th><th>Status</th><th>Location</th>
-          </tr>
-          <tr>
-            <td><a href="https://pitchbook.com/profiles/company/233704-27">Louisiana Fish Fry</a></td>
-            <td>Private Equity-Backed</td>
-            <td>Baton Rouge, LA</td>
-          </tr>
-        </table>
-        <section>
-          <h2>FAQ</h2>
-          <div data-test="faq-item">
-            <h3 data-test="faq-question">When was Badia Spices founded?</h3>
-            <p data-test="faq-answer">Badia Spices was founded in 1967.</p>
-          </div>
-        </section>
-        <div data-test="investors">
-          <a>BDT &amp; MSD Partners</a>
-        </div>
-      </body>
-    </html>
-    """
-
-    summary, all_investments, investors = parse_investments(html)
+    summary, all_investments, investors = parse_investments(DEALS_HTML)
     assert summary["latest_deal_type"].startswith("Buyout")
     assert summary["financing_rounds"] == 1
     assert len(all_investments) == 1
     assert investors == ["BDT & MSD Partners"]
 
-    competitors = parse_competitors(html)
+    competitors = parse_competitors(DEALS_HTML)
     assert len(competitors) == 1
     assert competitors[0]["company_name"] == "Louisiana Fish Fry"
 
-    faq = parse_faq(html)
+    faq = parse_faq(DEALS_HTML)
     assert any(entry["type"] == "Question" for entry in faq)
     assert any(entry["type"] == "Answer" for entry in faq)
 
@@ -134,4 +186,55 @@ def test_investments_and_competitors_and_faq():
     assert len(record["competitors"]) == 1
     assert len(record["all_investments"]) == 1
     assert len(record["faq"]) >= 2
-    assert record["investors"] == ["BDT & MSD Partners"]
\ No newline at end of file
+    assert record["investors"] == ["BDT & MSD Partners"]
+
+def test_extractors_share_one_parsed_page():
+    html = """
+    <html>
+      <body>
+        <h1 data-test="company-name">Badia Spices</h1>
+        <table>
+          <tr><th>Company</th><th>Date</th><th>Deal Size</th><th>Deal Type</th></tr>
+          <tr><td>Tech Data</td><td>2020-11-03</td><td>n/a</td><td>Corporate Asset Purchase</td></tr>
+        </table>
+        <table>
+          <tr><th>Competitor</th><th>Status</th><th>Location</th></tr>
+          <tr><td>Louisiana Fish Fry</td><td>Private Equity-Backed</td><td>Baton Rouge, LA</td></tr>
+        </table>
+      </body>
+    </html>
+    """
+    url = "https://pitchbook.com/profiles/company/361831-87"
+    page = ParsedPage.from_html(html)
+
+    assert parse_company_profile_page(page, url) == parse_company_profile(html, url)
+    summary, investments, investors = parse_investments_page(page)
+    assert (summary, [deal.to_dict() for deal in investments], investors) == parse_investments(html)
+    assert parse_competitors_page(page) == parse_competitors(html)
+    assert parse_faq_page(page) == parse_faq(html)
+
+def _extract_all(html: str, backend: str) -> tuple:
+    url = "https://pitchbook.com/profiles/company/361831-87"
+    page = ParsedPage.from_html(html, backend)
+    return (
+        parse_company_profile_page(page, url),
+        parse_investments_page(page),
+        parse_competitors_page(page),
+        parse_faq_page(page),
+    )
+
+@pytest.mark.parametrize("backend", PARSER_BACKENDS)
+@pytest.mark.parametrize(
+    "html", [PROFILE_HTML, DEALS_HTML, LAYOUT_VARIANTS_HTML, INLINE_SCRIPTS_HTML]
+)
+def test_parser_backends_produce_identical_records(backend, html):
+    try:
+        check_parser_backend(backend)
+    except ImportError as exc:
+        pytest.skip(str(exc))
+
+    assert _extract_all(html, backend) == _extract_all(html, "html.parser")
+
+def test_unknown_parser_backend_is_rejected():
+    with pytest.raises(ValueError):
+        ParsedPage.from_html("<html></html>", "html5lib")
\ No newline at end of file
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pstats
+import tracemalloc
+
+from src.utils.profiling import StageProfiler
+
+def _work(size: int) -> int:
+    return sum(len(str(i)) for i in range(size))
+
+def test_only_sampled_urls_are_profiled(tmp_path):
+    profiler = StageProfiler(tmp_path / "profile", every=3, top=5)
+    for i in range(7):
+        url = f"https://pitchbook.com/profiles/company/1-{i}"
+        profiler.sample(url)
+        with profiler.stage("parse", url):
+            _work(1000 * (i + 1))
+        profiler.finish(url)
+    paths = profiler.write()
+
+    assert [path.name for path in paths] == ["parse.prof", "report.txt"]
+    entries = pstats.Stats(str(paths[0])).stats.items()  # type: ignore[attr-defined]
+    calls = [primitive for (_, _, name), (primitive, *_) in entries if name == "_work"]
+    assert calls == [3]
+    report = paths[1].read_text(encoding="utf-8")
+    assert report.startswith("Profiled 3 of 7 URLs (every 3)")
+    assert "1-6" in report and "1-1" not in report
+
+def test_memory_is_only_traced_inside_sampled_stages(tmp_path):
+    profiler = StageProfiler(tmp_path / "profile", every=2)
+    tracing = []
+    for i in range(4):
+        url = f"https://pitchbook.com/profiles/company/1-{i}"
+        profiler.sample(url)
+        with profiler.stage("parse", url):
+            tracing.append(tracemalloc.is_tracing())
+            rows = [str(j) * 10 for j in range(1000)]
+        profiler.finish(url)
+    report = profiler.write()[-1].read_text(encoding="utf-8")
+
+    assert tracing == [True, False, True, False]
+    assert not tracemalloc.is_tracing()
+    assert len(rows) == 1000
+    assert "allocation sites still held after a stage" in report
+    assert "test_profiling.py" in report
\ No newline at end of file
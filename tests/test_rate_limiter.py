@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils import rate_limiter
+from src.utils.http import HttpClient, parse_retry_after
+from src.utils.metrics import RATE_LIMIT_PER_MINUTE
+from src.utils.rate_limiter import AdaptiveRateLimiter, RateLimiter
+
+class _FrozenClock:
+    """
+    Stands in for the limiter's clock: time only moves when advanced, and
+    sleeps are recorded instead of taken.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+        self._lock = threading.Lock()
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.sleeps.append(seconds)
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FrozenClock()
+    monkeypatch.setattr(
+        rate_limiter, "time", SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep)
+    )
+    monkeypatch.setattr(rate_limiter, "asyncio", SimpleNamespace(sleep=clock.async_sleep))
+    return clock
+
+def test_many_threads_achieve_the_configured_rate(clock):
+    limiter = RateLimiter(max_per_minute=6000, burst=1)  # 100 requests per second
+    threads_count, per_thread = 16, 10
+    start_barrier = threading.Barrier(threads_count)
+
+    def worker() -> None:
+        start_barrier.wait()
+        for _ in range(per_thread):
+            limiter.acquire()
+
+    threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every request gets its own slot: the first token is free, then one per 10ms.
+    waits = sorted([0.0] + clock.sleeps)
+    assert len(waits) == threads_count * per_thread
+    assert waits == pytest.approx([i * 0.01 for i in range(threads_count * per_thread)])
+
+def test_burst_is_served_immediately_and_instances_are_independent(clock):
+    limiter = RateLimiter(max_per_minute=60, burst=5)
+    other = RateLimiter(max_per_minute=60, burst=1)
+    assert limiter._lock is not other._lock
+
+    for _ in range(5):
+        limiter.acquire()
+    other.acquire()
+    assert clock.sleeps == []
+
+    limiter.acquire()
+    clock.now += 0.5
+    other.acquire()
+    assert clock.sleeps == pytest.approx([1.0, 0.5])
+
+def test_per_host_buckets_and_async_acquire(clock):
+    limiter = RateLimiter(max_per_minute=600, burst=1, per_host=True)
+
+    async def acquire_all() -> None:
+        await asyncio.gather(*(limiter.aacquire(f"host-{i}") for i in range(10)))
+        assert clock.sleeps == []
+        await asyncio.gather(*(limiter.aacquire("host-0") for _ in range(3)))
+
+    asyncio.run(acquire_all())
+    assert sorted(clock.sleeps) == pytest.approx([0.1, 0.2, 0.3])
+
+def test_adaptive_limiter_increases_additively_and_backs_off_multiplicatively():
+    limiter = AdaptiveRateLimiter(
+        max_per_minute=40, floor_per_minute=10, ceiling_per_minute=45, increase_per_minute=2
+    )
+    assert RATE_LIMIT_PER_MINUTE.value() == 40
+    for _ in range(5):
+        limiter.record_success()
+    assert limiter.current_per_minute == 45
+    assert RATE_LIMIT_PER_MINUTE.value() == 45
+
+    limiter.record_throttle()
+    limiter.record_throttle()  # same congestion event, inside the cooldown
+    assert limiter.current_per_minute == 22.5
+    assert RATE_LIMIT_PER_MINUTE.value() == 22.5
+
+    limiter.decrease_cooldown = 0
+    for _ in range(5):
+        limiter.record_throttle()
+    assert limiter.current_per_minute == 10
+
+def test_retry_after_pauses_the_bucket(clock):
+    limiter = RateLimiter(max_per_minute=60000, burst=1)
+    limiter.acquire()
+    limiter.record_throttle(retry_after=0.2)
+
+    limiter.acquire()
+    # The pause, then the 1ms interval the first request's token still owes.
+    assert clock.sleeps == pytest.approx([0.201])
+
+def test_http_client_reports_throttling_to_the_limiter():
+    class _Response:
+        def __init__(self, status_code: int, headers: dict) -> None:
+            self.status_code = status_code
+            self.headers = headers
+            self.url = "https://x.test/a"
+            self._content = b""
+
+    class _Session:
+        headers: dict = {}
+
+        def __init__(self) -> None:
+            self.responses = [_Response(429, {"Retry-After": "0"}), _Response(200, {})]
+
+        def get(self, url: str, timeout: int, **_: object) -> _Response:
+            return self.responses.pop(0)
+
+    limiter = AdaptiveRateLimiter(
+        max_per_minute=6000, floor_per_minute=1, ceiling_per_minute=60000
+    )
+    client = HttpClient(
+        base_url="https://x.test",
+        user_agent="t",
+        rate_limiter=limiter,
+        backoff_factor=0,
+        session=_Session(),
+    )
+
+    assert client.get("/a").status_code == 200
+    assert limiter.current_per_minute == 3001
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
\ No newline at end of file
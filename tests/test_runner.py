@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import json
+import pstats
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src import runner
+from src.outputs.journal import RunJournal
+from src.pipeline import run_pipeline
+from src.runner import build_record, iter_processed
+from src.utils.cache import ResponseCache
+from src.utils import fingerprints
+from src.utils.fingerprints import FingerprintStore
+from src.utils.retry import PermanentHttpError
+from src.utils.statuses import STATUS_DONE
+
+def _fetch_page(url_or_id: str) -> str:
+    index = int(url_or_id.rsplit("-", 1)[1])
+    # Later URLs finish first, so ordering has to come from the runner.
+    time.sleep(0.002 * (10 - index))
+    if index == 3:
+        raise RuntimeError("boom")
+    return f"<html><body><h1 data-test='company-name'>Company {index}</h1></body></html>"
+
+@pytest.fixture
+def client(stub_client):
+    threads: set[str] = set()
+
+    def fetch(url_or_id: str) -> str:
+        threads.add(threading.current_thread().name)
+        return _fetch_page(url_or_id)
+
+    client = stub_client(fetch)
+    client.threads = threads
+    return client
+
+def test_iter_processed_keeps_input_order_with_workers(client):
+    urls = [f"https://pitchbook.com/profiles/company/1000-{i}" for i in range(10)]
+
+    results = list(iter_processed(client, urls, workers=4))
+
+    assert [result.url for result in results] == urls
+    assert results[3].record is None
+    assert isinstance(results[3].error, RuntimeError)
+    names = [record["company_name"] for _, record, _ in results if record is not None]
+    assert names == [f"Company {i}" for i in range(10) if i != 3]
+    assert len(client.threads) > 1
+
+def test_pipeline_parses_in_processes_and_keeps_order(client):
+    urls = [f"https://pitchbook.com/profiles/company/1000-{i}" for i in range(10)]
+
+    results = list(
+        run_pipeline(
+            urls,
+            client.fetch_company_profile,
+            build_record,
+            fetch_workers=3,
+            parse_workers=2,
+            queue_size=4,
+        )
+    )
+
+    assert [result.url for result in results] == urls
+    assert results[3].record is None
+    assert str(results[3].error) == "boom"
+    assert results[0].record["company_name"] == "Company 0"
+    assert results[9].record["url"] == urls[9]
+
+def test_resume_skips_completed_urls_and_appends(tmp_path, monkeypatch, client):
+    input_path = tmp_path / "inputs.txt"
+    input_path.write_text("\n".join(f"1000-{i}" for i in range(6)), encoding="utf-8")
+    output_path = tmp_path / "out" / "records.json"
+    fetched: list[str] = []
+
+    def fetch(url_or_id: str) -> str:
+        fetched.append(url_or_id)
+        return _fetch_page(url_or_id)
+
+    monkeypatch.setattr(client, "fetch_company_profile", fetch)
+    monkeypatch.setattr(runner, "build_client", lambda settings: client)
+    config_path = tmp_path / "missing-settings.json"
+
+    runner.run(input_path, output_path, config_path)
+    assert sorted(fetched) == [client.profile_url(f"1000-{i}") for i in range(6)]
+
+    fetched.clear()
+    runner.run(input_path, output_path, config_path, resume=True)
+    # Only the URL that failed the first time is fetched again.
+    assert fetched == [client.profile_url("1000-3")]
+
+    lines = output_path.with_suffix(".jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 5
+    assert len(json.loads(output_path.read_text(encoding="utf-8"))) == 5
+
+def test_permanent_failures_are_journaled_and_not_retried_on_resume(tmp_path, monkeypatch, client):
+    input_path = tmp_path / "inputs.txt"
+    input_path.write_text("\n".join(f"1000-{i}" for i in range(4)), encoding="utf-8")
+    output_path = tmp_path / "records.json"
+    fetched: list[str] = []
+
+    def fetch(url_or_id: str) -> str:
+        fetched.append(url_or_id)
+        if url_or_id.endswith("/1000-3"):
+            raise PermanentHttpError(404, url_or_id)
+        return _fetch_page(url_or_id)
+
+    monkeypatch.setattr(client, "fetch_company_profile", fetch)
+    monkeypatch.setattr(runner, "build_client", lambda settings: client)
+    config_path = tmp_path / "missing-settings.json"
+
+    runner.run(input_path, output_path, config_path)
+    journal = [
+        json.loads(line)
+        for line in output_path.with_suffix(".journal").read_text(encoding="utf-8").splitlines()
+    ]
+    statuses = {entry["url"]: entry["status"] for entry in journal}
+    assert statuses[client.profile_url("1000-3")] == "permanent"
+
+    fetched.clear()
+    runner.run(input_path, output_path, config_path, resume=True)
+    assert fetched == []
+
+def test_resumed_journal_drops_a_line_torn_by_a_crash(tmp_path):
+    path = tmp_path / "records.journal"
+    with RunJournal(path) as journal:
+        journal.record("a", STATUS_DONE)
+        # Only the startup state is kept in memory.
+        assert not journal.is_done("a")
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"url": "b", "sta')
+
+    with RunJournal(path, resume=True) as journal:
+        journal.record("b", STATUS_DONE)
+    with RunJournal(path, resume=True) as journal:
+        assert journal.completed == {"a", "b"}
+
+def test_explicit_zero_workers_is_rejected_not_replaced_by_the_setting(tmp_path):
+    config_path = tmp_path / "settings.json"
+    config_path.write_text(json.dumps({"workers": 4}), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="workers must be at least 1, got 0"):
+        runner.run(tmp_path / "inputs.txt", tmp_path / "records.json", config_path, workers=0)
+
+def test_empty_or_missing_input_leaves_the_previous_outputs_alone(tmp_path, monkeypatch, client):
+    input_path = tmp_path / "inputs.txt"
+    input_path.write_text("\n".join(f"1000-{i}" for i in range(3)), encoding="utf-8")
+    output_path = tmp_path / "records.json"
+    monkeypatch.setattr(runner, "build_client", lambda settings: client)
+    config_path = tmp_path / "missing-settings.json"
+    runner.run(input_path, output_path, config_path)
+    outputs = [output_path, output_path.with_suffix(".jsonl"), output_path.with_suffix(".journal")]
+    before = [path.read_bytes() for path in outputs]
+
+    input_path.write_text("# nothing yet\n", encoding="utf-8")
+    runner.run(input_path, output_path, config_path)
+    runner.run(tmp_path / "missing.txt", output_path, config_path)
+
+    assert [path.read_bytes() for path in outputs] == before
+    assert len(json.loads(before[0])) == 3
+
+def test_inputs_are_canonicalized_and_deduplicated_before_fetching(tmp_path, monkeypatch, client):
+    input_path = tmp_path / "inputs.txt"
+    input_path.write_text(
+        "\n".join(
+            [
+                "1000-1",
+                "https://pitchbook.com/profiles/company/1000-1",
+                "https://pitchbook.com/profiles/company/1000-1/?utm_source=x",
+                "# comment",
+                "1000-2",
+                "https://example.com/not-a-profile",
+                "1000-2",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    fetched: list[str] = []
+
+    def fetch(url_or_id: str) -> str:
+        fetched.append(url_or_id)
+        return _fetch_page(url_or_id)
+
+    monkeypatch.setattr(client, "fetch_company_profile", fetch)
+    monkeypatch.setattr(runner, "build_client", lambda settings: client)
+
+    runner.run(input_path, tmp_path / "records.json", tmp_path / "missing-settings.json")
+
+    assert fetched == [client.profile_url("1000-1"), client.profile_url("1000-2")]
+
+def test_quarantine_moves_invalid_records_out_of_the_output(tmp_path, monkeypatch, client):
+    input_path = tmp_path / "inputs.txt"
+    input_path.write_text("\n".join(f"1000-{i}" for i in range(3)), encoding="utf-8")
+    output_path = tmp_path / "records.json"
+    real_build_record = runner.build_record
+
+    def build_record(html: str, url: str, **kwargs) -> dict:
+        record = real_build_record(html, url, **kwargs)
+        if url.endswith("/1000-1"):
+            record["year_founded"] = "long ago"
+        return record
+
+    monkeypatch.setattr(runner, "build_client", lambda settings: client)
+    monkeypatch.setattr(runner, "build_record", build_record)
+
+    runner.run(input_path, output_path, tmp_path / "missing-settings.json", quarantine=True)
+
+    records = json.loads(output_path.read_text(encoding="utf-8"))
+    assert [record["url"] for record in records] == [
+        client.profile_url("1000-0"),
+        client.profile_url("1000-2"),
+    ]
+    quarantined = [
+        json.loads(line)
+        for line in output_path.with_suffix(".quarantine.jsonl").read_text("utf-8").splitlines()
+    ]
+    assert [entry["url"] for entry in quarantined] == [client.profile_url("1000-1")]
+    assert "'long ago' is not of type 'integer', 'null'" in quarantined[0]["errors"][0]
+
+@pytest.mark.parametrize("parse_processes", [0, 2])
+def test_fingerprints_skip_unchanged_pages_and_feed_only_changes(
+    tmp_path, monkeypatch, parse_processes, client
+):
+    input_path = tmp_path / "inputs.txt"
+    input_path.write_text("\n".join(f"1000-{i}" for i in (0, 1, 2)), encoding="utf-8")
+    output_path = tmp_path / "records.json"
+    changes_path = tmp_path / "changes.jsonl"
+    run_number = 1
+    parsed: list[str] = []
+    hashed: list[str] = []
+    real_remember = FingerprintStore.remember
+    real_page_fingerprint = fingerprints.page_fingerprint
+
+    def fetch(url_or_id: str) -> str:
+        html = _fetch_page(url_or_id)
+        # A fresh nonce on every fetch must not count as a change.
+        script = f"<script nonce='n{run_number}'>var t={run_number};</script>"
+        html = html.replace("<body>", "<body>" + script)
+        if run_number == 2 and url_or_id.endswith("-2"):
+            html = html.replace("Company 2", "Company Two")
+        return html
+
+    # Only freshly parsed records are remembered; parsing may run in other processes.
+    def remember(store: FingerprintStore, url: str, page_hash: str, record: dict) -> None:
+        parsed.append(url)
+        real_remember(store, url, page_hash, record)
+
+    def page_fingerprint(html: str, **kwargs) -> str:
+        hashed.append(html)
+        return real_page_fingerprint(html, **kwargs)
+
+    monkeypatch.setattr(client, "fetch_company_profile", fetch)
+    monkeypatch.setattr(runner, "build_client", lambda settings: client)
+    monkeypatch.setattr(FingerprintStore, "remember", remember)
+    monkeypatch.setattr(fingerprints, "page_fingerprint", page_fingerprint)
+
+    def run() -> list:
+        runner.run(
+            input_path,
+            output_path,
+            tmp_path / "missing-settings.json",
+            parse_processes=parse_processes,
+            fingerprints_path=tmp_path / "fingerprints.sqlite",
+            changes_path=changes_path,
+        )
+        lines = changes_path.read_text(encoding="utf-8").splitlines()
+        return [json.loads(line)["company_name"] for line in lines]
+
+    assert run() == ["Company 0", "Company 1", "Company 2"]
+    assert sorted(parsed) == [client.profile_url(f"1000-{i}") for i in (0, 1, 2)]
+
+    run_number = 2
+    parsed.clear()
+    hashed.clear()
+    assert run() == ["Company Two"]
+    assert parsed == [client.profile_url("1000-2")]
+    # Each fetched page is hashed once, changed or not.
+    assert len(hashed) == 3
+    # The full output still carries every record.
+    assert len(json.loads(output_path.read_text(encoding="utf-8"))) == 3
+
+@pytest.mark.parametrize("parse_processes", [0, 2])
+def test_not_modified_pages_reuse_the_cached_record(tmp_path, monkeypatch, parse_processes, client):
+    input_path = tmp_path / "inputs.txt"
+    input_path.write_text("\n".join(f"1000-{i}" for i in (0, 1)), encoding="utf-8")
+    output_path = tmp_path / "records.json"
+    not_modified = False
+
+    def fetch_profile_response(url_or_id: str) -> SimpleNamespace:
+        html = _fetch_page(url_or_id)
+        # A 304 replays the cached body; parsing it again would pick up the edit.
+        html = html.replace("Company", "Stale Company") if not_modified else html
+        return SimpleNamespace(url=url_or_id, text=html, not_modified=not_modified)
+
+    def fetch_company_profile(url_or_id: str) -> str:
+        return fetch_profile_response(url_or_id).text
+
+    monkeypatch.setattr(client, "fetch_profile_response", fetch_profile_response)
+    monkeypatch.setattr(client, "fetch_company_profile", fetch_company_profile)
+    monkeypatch.setattr(runner, "build_client", lambda settings: client)
+
+    def run() -> list:
+        client.http_client.cache = ResponseCache(tmp_path / "cache.sqlite")
+        runner.run(
+            input_path,
+            output_path,
+            tmp_path / "missing-settings.json",
+            parse_processes=parse_processes,
+        )
+        records = json.loads(output_path.read_text(encoding="utf-8"))
+        return [record["company_name"] for record in records]
+
+    assert run() == ["Company 0", "Company 1"]
+    not_modified = True
+    assert run() == ["Company 0", "Company 1"]
+
+def test_run_writes_stage_metrics(tmp_path, monkeypatch, client):
+    input_path = tmp_path / "inputs.txt"
+    input_path.write_text("\n".join(f"1000-{i}" for i in range(5)), encoding="utf-8")
+    metrics_path = tmp_path / "scraper.prom"
+    monkeypatch.setattr(runner, "build_client", lambda settings: client)
+
+    runner.run(
+        input_path,
+        tmp_path / "records.json",
+        tmp_path / "missing-settings.json",
+        metrics_file=metrics_path,
+    )
+
+    text = metrics_path.read_text(encoding="utf-8")
+    assert 'scraper_records_total{outcome="written"} 4' in text
+    assert 'scraper_records_total{outcome="failed"} 1' in text
+    for stage in ("parse", "investments", "validate", "export_json"):
+        assert f'scraper_stage_seconds_count{{stage="{stage}"}} 4' in text
+
+def test_metrics_file_is_written_when_the_run_fails(tmp_path, monkeypatch, client):
+    input_path = tmp_path / "inputs.txt"
+    input_path.write_text("\n".join(f"1000-{i}" for i in range(5)), encoding="utf-8")
+    metrics_path = tmp_path / "scraper.prom"
+    monkeypatch.setattr(runner, "build_client", lambda settings: client)
+    validated: list[dict] = []
+
+    def validate(record: dict, index: int) -> list:
+        validated.append(record)
+        if len(validated) == 3:
+            raise OSError("disk full")
+        return []
+
+    monkeypatch.setattr(runner, "validate_record", validate)
+
+    with pytest.raises(OSError, match="disk full"):
+        runner.run(
+            input_path,
+            tmp_path / "records.json",
+            tmp_path / "missing-settings.json",
+            metrics_file=metrics_path,
+        )
+
+    text = metrics_path.read_text(encoding="utf-8")
+    assert 'scraper_records_total{outcome="written"} 2' in text
+    assert "scraper_run_seconds_total " in text
+
+def test_profile_writes_stage_profiles_and_a_report(tmp_path, monkeypatch, client):
+    input_path = tmp_path / "inputs.txt"
+    input_path.write_text("\n".join(f"1000-{i}" for i in range(6)), encoding="utf-8")
+    output_path = tmp_path / "records.json"
+    monkeypatch.setattr(runner, "build_client", lambda settings: client)
+
+    runner.run(
+        input_path,
+        output_path,
+        tmp_path / "missing-settings.json",
+        workers=2,
+        profile=True,
+        profile_every=2,
+    )
+
+    profile_dir = output_path.with_suffix(".profile")
+    assert sorted(path.name for path in profile_dir.iterdir()) == [
+        "export.prof",
+        "parse.prof",
+        "report.txt",
+        "validate.prof",
+    ]
+    stats = pstats.Stats(str(profile_dir / "parse.prof"))
+    assert any(name == "build_record" for _, _, name in stats.stats)  # type: ignore[attr-defined]
+    report = (profile_dir / "report.txt").read_text(encoding="utf-8")
+    assert report.startswith("Profiled 3 of 6 URLs (every 2)")
+    assert "peak memory per page" in report
+    assert len(json.loads(output_path.read_text(encoding="utf-8"))) == 5
\ No newline at end of file
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import copy
 import json
 from pathlib import Path
 
-from src.outputs.schema_validator import validate_records
+import pytest
+
+from src.outputs.schema_validator import (
+    compile_schema,
+    validate_record,
+    validate_record_jsonschema,
+    validate_records,
+)
 
 def test_sample_output_conforms_to_schema():
     project_root = Path(__file__).resolve().parents[1]
@@ -14,4 +22,31 @@ def test_sample_output_conforms_to_schema():
         records = json.load(f)
 
     errors = validate_records(records)
-    assert errors == []
\ No newline at end of file
+    assert errors == []
+
+def _mutations(record):
+    yield record
+    for key in list(record):
+        missing = dict(record)
+        del missing[key]
+        yield missing
+        for bad in (True, 1.5, 7, "x", None, [None], [{"link": 3}], {"a": 1}):
+            wrong = dict(record)
+            wrong[key] = bad
+            yield wrong
+    nested = copy.deepcopy(record)
+    nested["competitors"] = [{"company_name": 1}]
+    nested["all_investments"] = [{"deal_size": 2.0}, "row"]
+    nested["year_founded"] = 2001.0
+    yield nested
+
+def test_compiled_validator_matches_jsonschema(sample_records):
+    for record in sample_records:
+        for idx, candidate in enumerate(_mutations(record)):
+            compiled = validate_record(candidate, idx)
+            reference = validate_record_jsonschema(candidate, idx)
+            assert sorted(compiled) == sorted(reference), candidate
+
+def test_compile_schema_rejects_unsupported_keywords():
+    with pytest.raises(ValueError):
+        compile_schema({"type": "string", "pattern": "^a"})
\ No newline at end of file
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import sqlite3
+
+from src.outputs.sqlite_sink import SqliteSink, changed_since, get_company, write_sqlite
+
+def test_upserts_by_id_and_reports_changes_since_a_run(tmp_path, company_records):
+    path = tmp_path / "companies.sqlite"
+    records = company_records
+    first_run = write_sqlite(records, path, batch_size=3)
+
+    updated = dict(records[1], employees=250, investors=["New Investor", "Other"])
+    with SqliteSink(path, batch_size=2) as sink:
+        changed = [sink.write(record) for record in [records[0], updated] + records[2:]]
+        second_run = sink.run_id
+    assert changed == [False, True, False, False, False]
+    assert second_run > first_run
+
+    assert [record["id"] for record in changed_since(path, first_run)] == ["1-00"]
+    assert list(changed_since(path, second_run)) == []
+    assert get_company(path, "1-00")["employees"] == 250
+    assert get_company(path, "missing") is None
+
+    conn = sqlite3.connect(str(path))
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0] == 5
+        investors = conn.execute(
+            "SELECT name FROM investors WHERE company_id = ? ORDER BY position", ("1-00",)
+        ).fetchall()
+        assert investors == [("New Investor",), ("Other",)]
+        investments = sum(len(record["all_investments"]) for record in records)
+        assert conn.execute("SELECT COUNT(*) FROM investments").fetchone()[0] == investments
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT record FROM companies WHERE updated_run > 1"
+            )
+        )
+        assert "companies_updated_run" in plan
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
\ No newline at end of file